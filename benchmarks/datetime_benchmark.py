@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Microbenchmark of parse_mavim_date and normalize_datetime_format.
+
+Times each function per call on gold-layer timestamps in three modes: dateutil only
+(the previous implementation), the fast parser without memoization, and the fast
+parser with memoization, where repeated values are served from the cache.
+
+Usage:
+    python -m benchmarks.datetime_benchmark --values 20000 --distinct 2000
+"""
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from gql.utils import datetime as dt
+
+LAYOUTS = ("%Y-%m-%d %H:%M:%S.0000000 +00:00", "%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def sample_values(count: int, distinct: int, seed: int = 42) -> List[str]:
+    """count timestamps drawn from a pool of distinct values in the gold-layer layouts."""
+    rng = random.Random(seed)
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    pool = [
+        (start + timedelta(seconds=rng.randrange(300_000_000))).strftime(rng.choice(LAYOUTS))
+        for _ in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _clear_caches() -> None:
+    dt.parse_mavim_date.cache_clear()
+    dt._normalize_datetime_string.cache_clear()
+
+
+def _per_call(func: Callable[[str], object], values: List[str], cached: bool, repeat: int) -> float:
+    def run() -> None:
+        if not cached:
+            _clear_caches()
+        for value in values:
+            func(value) if cached else func.__wrapped__(value)
+
+    _clear_caches()
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(values) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--values", type=int, default=20_000, help="Timestamps parsed per run")
+    parser.add_argument("--distinct", type=int, default=2_000, help="Distinct timestamps among them")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode, the fastest is reported")
+    args = parser.parse_args()
+    values = sample_values(args.values, args.distinct)
+
+    functions = {
+        "parse_mavim_date": dt.parse_mavim_date,
+        "normalize_datetime_format": dt._normalize_datetime_string,
+    }
+    fast_parser = dt._parse_gold_timestamp
+    for name, func in functions.items():
+        dt._parse_gold_timestamp = lambda value: None
+        dateutil_us = _per_call(func, values, cached=False, repeat=args.repeat)
+        dt._parse_gold_timestamp = fast_parser
+        fast_us = _per_call(func, values, cached=False, repeat=args.repeat)
+        cached_us = _per_call(func, values, cached=True, repeat=args.repeat)
+        print(
+            f"{name:<26} dateutil {dateutil_us:7.2f}us  fast {fast_us:6.2f}us "
+            f"({dateutil_us / fast_us:4.1f}x)  cached {cached_us:6.2f}us ({dateutil_us / cached_us:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Report the memory a cached table takes as entity objects versus columnar row views.
+
+Builds a synthetic table from each table's configured columns, transforms it and
+measures what keeping it cached costs: one strawberry entity per row (the old
+cache) against LazyRows over the transformed frame, which the cache holds either
+way. The table is read from --parts part files, as in storage, so its columns
+have one chunk per part and sharing them rather than copying shows. Python heap
+growth is measured with tracemalloc and resident memory growth from /proc where
+available. It also times building the cache and serving a few fields of every row.
+
+Usage:
+    python -m benchmarks.memory_report --rows 200000 --parts 4 mavim_manager_users company
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+import polars as pl
+
+from benchmarks.transform_benchmark import synthetic_frame
+from gql.config import tables_names
+from gql.schemas import query  # noqa: F401 - registers the table services
+from gql.services.data_service import DataService, get_registered_services
+from gql.services.rows import LazyRows, stored_fields
+
+
+def resident_bytes() -> Optional[int]:
+    """Resident set size of this process, None where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def measure(build: Callable[[], Any]) -> Tuple[Any, float, int, Optional[int]]:
+    """Build a cache and return it with the seconds it took and the Python heap and resident memory it added."""
+    gc.collect()
+    rss_before = resident_bytes()
+    start = time.perf_counter()
+    cache = build()
+    seconds = time.perf_counter() - start
+    rss_after = resident_bytes()
+    # Traced separately, tracemalloc slows allocation down
+    del cache
+    gc.collect()
+    tracemalloc.start()
+    cache = build()
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+    return cache, seconds, heap, rss
+
+
+def serve_seconds(rows: Any, fields: List[str]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        for name in fields:
+            getattr(row, name)
+    return time.perf_counter() - start
+
+
+def _mb(size: Optional[int]) -> str:
+    return f"{size / 2**20:9.1f} MB" if size is not None else "      n/a"
+
+
+def report(service: DataService, rows: int, parts: int, served_fields: int) -> None:
+    # Concatenated without rechunking, as CsvPartCache does
+    table = pl.concat(
+        [synthetic_frame(service, rows // parts, seed=part) for part in range(parts)], rechunk=False
+    )
+    frame = service.frame_transform(table)
+    fields = stored_fields(service.entity_type)[:served_fields]
+
+    # Lazy first: memory freed after the entities is not always returned to the OS
+    lazy, lazy_build, lazy_heap, lazy_rss = measure(lambda: LazyRows(frame, service.entity_type))
+    entities, build, heap, rss = measure(lambda: [service.entity_type(**row) for row in frame.iter_rows(named=True)])
+
+    print(
+        f"{service.table_name:<30} {frame.height:>9,} rows in {parts} parts  frame {_mb(frame.estimated_size())}\n"
+        f"    entities   heap {_mb(heap)}  resident {_mb(rss)}  build {build:6.3f}s  "
+        f"serve {len(fields)} fields {serve_seconds(entities, fields):6.3f}s\n"
+        f"    row views  heap {_mb(lazy_heap)}  resident {_mb(lazy_rss)}  build {lazy_build:6.3f}s  "
+        f"serve {len(fields)} fields {serve_seconds(lazy, fields):6.3f}s"
+    )
+    del entities, lazy
+
+
+def main() -> None:
+    services = get_registered_services()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("tables", nargs="*", help="Tables to report on, all tables when omitted")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows in each synthetic table")
+    parser.add_argument("--parts", type=int, default=4, help="Part files each synthetic table is read from")
+    parser.add_argument("--fields", type=int, default=4, help="Fields read per row when timing serving")
+    args = parser.parse_args()
+
+    for table in args.tables or sorted(name for name in services if name in tables_names):
+        report(services[table], args.rows, args.parts, args.fields)
+
+
+if __name__ == "__main__":
+    main()
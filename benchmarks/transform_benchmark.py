@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Benchmark the per-row transformers against their vectorized frame counterparts.
+
+Builds a synthetic table from each table's configured columns and times turning it
+into entities both ways: calling transform_func for every row (the old refresh path)
+and running frame_transform before building the entities.
+
+Usage:
+    python -m benchmarks.transform_benchmark --rows 200000 mavim_manager_users mavim_databases_details
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+import polars as pl
+
+from gql.services.data_service import DataService, get_registered_services
+from gql.schemas import query  # noqa: F401 - registers the table services
+from gql.utils import reader
+
+DATE_COLUMNS = ("created", "Created", "login_time")
+
+
+def _is_date_column(name: str) -> bool:
+    return "date" in name.lower() or name in DATE_COLUMNS
+
+
+def synthetic_frame(service: DataService, rows: int, seed: int = 42) -> pl.DataFrame:
+    """A table with the service's schema, about 5% nulls and distinct timestamps."""
+    rng = random.Random(seed)
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    columns: Dict[str, List] = {}
+    for name, dtype in reader.table_schema(service.columns).items():
+        if dtype == pl.Int64:
+            values = [rng.randrange(1_000_000) for _ in range(rows)]
+        elif dtype == pl.Float64:
+            values = [rng.random() * 1000 for _ in range(rows)]
+        elif dtype == pl.Boolean:
+            values = [rng.random() < 0.5 for _ in range(rows)]
+        elif _is_date_column(name):
+            values = [
+                (start + timedelta(seconds=rng.randrange(300_000_000))).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+                for _ in range(rows)
+            ]
+        else:
+            values = [f"{name}-{rng.randrange(10_000)}" for _ in range(rows)]
+        columns[name] = [None if rng.random() < 0.05 else value for value in values]
+    return pl.DataFrame(columns, schema=reader.table_schema(service.columns))
+
+
+def _time(func: Callable[[], list], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(service: DataService, rows: int, repeat: int) -> None:
+    df = synthetic_frame(service, rows)
+
+    def per_row() -> list:
+        return [service.transform_func(row) for row in df.iter_rows(named=True)]
+
+    def vectorized() -> list:
+        return [service.entity_type(**row) for row in service.frame_transform(df).iter_rows(named=True)]
+
+    def frame_only() -> pl.DataFrame:
+        return service.frame_transform(df)
+
+    assert per_row() == vectorized(), f"{service.table_name}: vectorized output differs"
+    row_seconds = _time(per_row, repeat)
+    vector_seconds = _time(vectorized, repeat)
+    frame_seconds = _time(frame_only, repeat)
+    print(
+        f"{service.table_name:<30} {rows:>9,} rows  per-row {row_seconds:8.3f}s  "
+        f"vectorized {vector_seconds:8.3f}s ({row_seconds / vector_seconds:5.1f}x)  "
+        f"frame only {frame_seconds:8.3f}s"
+    )
+
+
+def main() -> None:
+    services = get_registered_services()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("tables", nargs="*", help="Tables to benchmark, all tables when omitted")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows in each synthetic table")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant, the fastest is reported")
+    args = parser.parse_args()
+
+    for table in args.tables or sorted(services):
+        benchmark(services[table], args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
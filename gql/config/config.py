@@ -13,21 +13,52 @@ with open(CONFIG_DIR/'config.yaml', 'r', encoding='utf-8') as file:
  
  ## get the keys of the tables from the config file
 tables_names = config.get('tables', {}).keys()
+
+# Reader and cache defaults shared by all tables
+reader_settings: Dict[str, Any] = config.get('reader') or {}
+cache_settings: Dict[str, Any] = config.get('cache') or {}
+
+
+def get_table_config(table_name: str) -> Dict[str, Any]:
+    """
+    Return the settings of a table, merged over the reader and cache defaults.
+
+    Table entries are either a plain folder name or a mapping of settings.
+    """
+    entry = config.get('tables', {}).get(table_name)
+    settings = {**reader_settings, **cache_settings}
+    if isinstance(entry, dict):
+        settings.update(entry)
+    return settings
     
 # Access the base directory
 base_dir =(config['base_dir'])
+
+
+def table_path(table_name: str) -> str:
+    """
+    Return the blob folder of a table: base_dir joined with the table's `path`.
+
+    Plain string entries name the folder themselves; without either the table
+    name is the folder.
+    """
+    entry = config.get('tables', {}).get(table_name)
+    folder = entry.get('path', table_name) if isinstance(entry, dict) else entry or table_name
+    return str(base_dir + "/" + folder)
+
+
 # Define data directories - convert Path objects to strings for PySpark compatibility
-combined_databases: str = str(base_dir+ "/"+ 'combined_databases')
-combined_users: str = str(base_dir+ "/"+ 'combined_users')
-company: str = str(base_dir+ "/"+ 'company')
-customer_addon_details: str = str(base_dir+ "/"+ 'customer_addon_details')
-customer_edition_details: str = str(base_dir+ "/"+ 'customer_edition_details')
-edition_function_details: str = str(base_dir+ "/"+ 'edition_function_details')
-license_customer_product: str = str(base_dir+ "/"+ 'license_customer_product')
-mavim_databases_details: str = str(base_dir+ "/"+ 'mavim_databases_details')
-mpm_customers: str = str(base_dir+ "/"+ 'mpm_customers')
-portal_monthly_users_report: str = str(base_dir+ "/"+ 'portal_monthly_users_report')
-company_global_admins: str = str(base_dir+ "/"+ 'company_global_admins')
-portal: str = str(base_dir+ "/"+ 'portal')
-users: str = str(base_dir+ "/"+ 'mavim_manager_users')
-manager_user_login_details: str = str(base_dir+ "/"+ 'manager_user_login_details')
\ No newline at end of file
+combined_databases: str = table_path('combined_databases')
+combined_users: str = table_path('combined_users')
+company: str = table_path('company')
+customer_addon_details: str = table_path('customer_addon_details')
+customer_edition_details: str = table_path('customer_edition_details')
+edition_function_details: str = table_path('edition_function_details')
+license_customer_product: str = table_path('license_customer_product')
+mavim_databases_details: str = table_path('mavim_databases_details')
+mpm_customers: str = table_path('mpm_customers')
+portal_monthly_users_report: str = table_path('portal_monthly_users_report')
+company_global_admins: str = table_path('company_global_admins')
+portal: str = table_path('portal')
+users: str = table_path('mavim_manager_users')
+manager_user_login_details: str = table_path('manager_user_login_details')
@@ -1,15 +1,29 @@
-from typing import List
+from typing import List, Optional
 from gql.services.data_service import DataService
-from gql.types import CombinedDatabasesType
+from gql.types import CombinedDatabasesType, CombinedDatabasesWhere, CombinedDatabasesField, CombinedDatabasesAggregation, CombinedDatabasesAggregateRow, Connection
 from gql.config import combined_databases as PATH
-from gql.resolvers.transformers import transform_to_combined_databases
+from gql.resolvers.transformers import transform_to_combined_databases, transform_to_combined_databases_frame
 
 # Create a singleton service instance
 company_service = DataService(path=PATH,
+                              table_name="combined_databases",
                               entity_type=CombinedDatabasesType,
-                              transform_func=transform_to_combined_databases)
+                              transform_func=transform_to_combined_databases,
+                              frame_transform=transform_to_combined_databases_frame)
 
 
 # This gets called for each GraphQL query
-def get_combined_databases() -> List[CombinedDatabasesType]:
-    return company_service.get_data()
+async def get_combined_databases(where: Optional[CombinedDatabasesWhere] = None) -> List[CombinedDatabasesType]:
+    return await company_service.get_data_async(where=where)
+
+
+async def get_combined_databases_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CombinedDatabasesWhere] = None) -> Connection[CombinedDatabasesType]:
+    return await company_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_combined_databases_aggregate(
+    group_by: Optional[List[CombinedDatabasesField]] = None,
+    aggregations: Optional[List[CombinedDatabasesAggregation]] = None,
+    where: Optional[CombinedDatabasesWhere] = None
+) -> List[CombinedDatabasesAggregateRow]:
+    return await company_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -1,15 +1,29 @@
-from typing import List
-from gql.types import CombinedUsersType
+from typing import List, Optional
+from gql.types import CombinedUsersType, CombinedUsersWhere, CombinedUsersField, CombinedUsersAggregation, CombinedUsersAggregateRow, Connection
 from gql.config import combined_users as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_combined_users
+from gql.resolvers.transformers import transform_to_combined_users, transform_to_combined_users_frame
 
 # Create a singleton service instance
 company_service = DataService(path=PATH,
+                              table_name="combined_users",
                               entity_type=CombinedUsersType,
-                              transform_func=transform_to_combined_users)
+                              transform_func=transform_to_combined_users,
+                              frame_transform=transform_to_combined_users_frame)
 
 
 # This gets called for each GraphQL query
-def get_combined_users() -> List[CombinedUsersType]:
-    return company_service.get_data()
+async def get_combined_users(where: Optional[CombinedUsersWhere] = None) -> List[CombinedUsersType]:
+    return await company_service.get_data_async(where=where)
+
+
+async def get_combined_users_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CombinedUsersWhere] = None) -> Connection[CombinedUsersType]:
+    return await company_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_combined_users_aggregate(
+    group_by: Optional[List[CombinedUsersField]] = None,
+    aggregations: Optional[List[CombinedUsersAggregation]] = None,
+    where: Optional[CombinedUsersWhere] = None
+) -> List[CombinedUsersAggregateRow]:
+    return await company_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
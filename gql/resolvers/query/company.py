@@ -1,16 +1,37 @@
-from typing import List
-from gql.types import CompanyType
+from typing import List, Optional
+from gql.types import CompanyType, CompanyWhere, CompanyField, CompanyAggregation, CompanyAggregateRow, Connection
 from gql.config import company as COMPANY_PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_company
+from gql.resolvers.transformers import transform_to_company, transform_to_company_frame
 
 # Create a singleton service instance
 company_service = DataService(path=COMPANY_PATH,
+                              table_name="company",
                               entity_type=CompanyType,
-                              transform_func=transform_to_company)
+                              transform_func=transform_to_company,
+                              frame_transform=transform_to_company_frame)
 
 
 # This gets called for each GraphQL query
-def get_companies() -> List[CompanyType]:
+async def get_companies(where: Optional[CompanyWhere] = None) -> List[CompanyType]:
     """Resolver that returns all companies."""
-    return company_service.get_data()
+    return await company_service.get_data_async(where=where)
+
+
+async def get_companies_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CompanyWhere] = None) -> Connection[CompanyType]:
+    """Resolver that returns a page of companies."""
+    return await company_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_companies_aggregate(
+    group_by: Optional[List[CompanyField]] = None,
+    aggregations: Optional[List[CompanyAggregation]] = None,
+    where: Optional[CompanyWhere] = None
+) -> List[CompanyAggregateRow]:
+    """Resolver that returns companies aggregated per group."""
+    return await company_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
+
+
+async def get_company(customer_id: int) -> Optional[CompanyType]:
+    """Resolver that returns the company with a customer id, looked up by primary key."""
+    return await company_service.get_by_key_async([customer_id])
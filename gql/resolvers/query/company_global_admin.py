@@ -1,17 +1,29 @@
-from typing import List
+from typing import List, Optional
 from gql.services.data_service import DataService
-from gql.types import CompanyGlobalAdminType
+from gql.types import CompanyGlobalAdminType, CompanyGlobalAdminWhere, CompanyGlobalAdminField, CompanyGlobalAdminAggregation, CompanyGlobalAdminAggregateRow, Connection
 from gql.config import company_global_admins as PATH
-from gql.resolvers.transformers import transform_to_company_global_admin
+from gql.resolvers.transformers import transform_to_company_global_admin, transform_to_company_global_admin_frame
 
 # Create a singleton service instance
 company_global_admin_service = DataService(path=PATH,
+                              table_name="company_global_admins",
                               entity_type=CompanyGlobalAdminType,
-                              transform_func=transform_to_company_global_admin)
+                              transform_func=transform_to_company_global_admin,
+                              frame_transform=transform_to_company_global_admin_frame)
 
 
 # This gets called for each GraphQL query
-def get_company_global_admin() -> List[CompanyGlobalAdminType]:
-    return company_global_admin_service.get_data()
+async def get_company_global_admin(where: Optional[CompanyGlobalAdminWhere] = None) -> List[CompanyGlobalAdminType]:
+    return await company_global_admin_service.get_data_async(where=where)
 
 
+async def get_company_global_admin_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CompanyGlobalAdminWhere] = None) -> Connection[CompanyGlobalAdminType]:
+    return await company_global_admin_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_company_global_admin_aggregate(
+    group_by: Optional[List[CompanyGlobalAdminField]] = None,
+    aggregations: Optional[List[CompanyGlobalAdminAggregation]] = None,
+    where: Optional[CompanyGlobalAdminWhere] = None
+) -> List[CompanyGlobalAdminAggregateRow]:
+    return await company_global_admin_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -0,0 +1,25 @@
+from typing import List, Optional
+from gql.types import CompanyUserType, CompanyUserWhere, CompanyUserField, CompanyUserAggregation, CompanyUserAggregateRow, Connection
+from gql.services.views import ViewService
+
+# Materialized view over the cached tables, configured under `views` in config.yaml
+company_users_service = ViewService("company_users", entity_type=CompanyUserType)
+
+
+async def get_company_users(where: Optional[CompanyUserWhere] = None) -> List[CompanyUserType]:
+    """Resolver that returns all company users."""
+    return await company_users_service.get_data_async(where=where)
+
+
+async def get_company_users_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CompanyUserWhere] = None) -> Connection[CompanyUserType]:
+    """Resolver that returns a page of company users."""
+    return await company_users_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_company_users_aggregate(
+    group_by: Optional[List[CompanyUserField]] = None,
+    aggregations: Optional[List[CompanyUserAggregation]] = None,
+    where: Optional[CompanyUserWhere] = None
+) -> List[CompanyUserAggregateRow]:
+    """Resolver that returns company users aggregated per group."""
+    return await company_users_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
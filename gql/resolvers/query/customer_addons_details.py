@@ -1,18 +1,34 @@
 
-from typing import List
-from gql.types import CustomerAddonDetailsType
+from typing import List, Optional
+from gql.types import CustomerAddonDetailsType, CustomerAddonDetailsWhere, CustomerAddonDetailsField, CustomerAddonDetailsAggregation, CustomerAddonDetailsAggregateRow, Connection
 from gql.config import customer_addon_details as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_customer_addons_details
+from gql.resolvers.transformers import transform_to_customer_addons_details, transform_to_customer_addons_details_frame
 
 # Create a singleton service instance
 customer_addon_service = DataService(
     path=PATH,
+    table_name="customer_addon_details",
     entity_type=CustomerAddonDetailsType,
-    transform_func=transform_to_customer_addons_details
+    transform_func=transform_to_customer_addons_details,
+    frame_transform=transform_to_customer_addons_details_frame
 )
 
 # This gets called for each GraphQL query
-def get_customer_addons_details() -> List[CustomerAddonDetailsType]:
+async def get_customer_addons_details(where: Optional[CustomerAddonDetailsWhere] = None) -> List[CustomerAddonDetailsType]:
     """Resolver that returns all customer addon details."""
-    return customer_addon_service.get_data()
\ No newline at end of file
+    return await customer_addon_service.get_data_async(where=where)
+
+
+async def get_customer_addons_details_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CustomerAddonDetailsWhere] = None) -> Connection[CustomerAddonDetailsType]:
+    """Resolver that returns a page of customer addon details."""
+    return await customer_addon_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_customer_addons_details_aggregate(
+    group_by: Optional[List[CustomerAddonDetailsField]] = None,
+    aggregations: Optional[List[CustomerAddonDetailsAggregation]] = None,
+    where: Optional[CustomerAddonDetailsWhere] = None
+) -> List[CustomerAddonDetailsAggregateRow]:
+    """Resolver that returns customer addon details aggregated per group."""
+    return await customer_addon_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -1,18 +1,34 @@
-from typing import List
-from gql.types import CustomerEditionDetailsType
+from typing import List, Optional
+from gql.types import CustomerEditionDetailsType, CustomerEditionDetailsWhere, CustomerEditionDetailsField, CustomerEditionDetailsAggregation, CustomerEditionDetailsAggregateRow, Connection
 from gql.config import customer_edition_details as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_customer_edition_details
+from gql.resolvers.transformers import transform_to_customer_edition_details, transform_to_customer_edition_details_frame
 
 
 # Create a singleton service instance
 customer_edition_service = DataService(
     path=PATH,
+    table_name="customer_edition_details",
     entity_type=CustomerEditionDetailsType,
-    transform_func=transform_to_customer_edition_details
+    transform_func=transform_to_customer_edition_details,
+    frame_transform=transform_to_customer_edition_details_frame
 )
 
 # This gets called for each GraphQL query
-def get_customer_edition_details() -> List[CustomerEditionDetailsType]:
+async def get_customer_edition_details(where: Optional[CustomerEditionDetailsWhere] = None) -> List[CustomerEditionDetailsType]:
     """Resolver that returns all customer edition details."""
-    return customer_edition_service.get_data()
\ No newline at end of file
+    return await customer_edition_service.get_data_async(where=where)
+
+
+async def get_customer_edition_details_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CustomerEditionDetailsWhere] = None) -> Connection[CustomerEditionDetailsType]:
+    """Resolver that returns a page of customer edition details."""
+    return await customer_edition_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_customer_edition_details_aggregate(
+    group_by: Optional[List[CustomerEditionDetailsField]] = None,
+    aggregations: Optional[List[CustomerEditionDetailsAggregation]] = None,
+    where: Optional[CustomerEditionDetailsWhere] = None
+) -> List[CustomerEditionDetailsAggregateRow]:
+    """Resolver that returns customer edition details aggregated per group."""
+    return await customer_edition_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
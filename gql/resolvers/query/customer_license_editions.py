@@ -0,0 +1,25 @@
+from typing import List, Optional
+from gql.types import CustomerLicenseEditionType, CustomerLicenseEditionWhere, CustomerLicenseEditionField, CustomerLicenseEditionAggregation, CustomerLicenseEditionAggregateRow, Connection
+from gql.services.views import ViewService
+
+# Materialized view over the cached tables, configured under `views` in config.yaml
+customer_license_editions_service = ViewService("customer_license_editions", entity_type=CustomerLicenseEditionType)
+
+
+async def get_customer_license_editions(where: Optional[CustomerLicenseEditionWhere] = None) -> List[CustomerLicenseEditionType]:
+    """Resolver that returns all customer licenses with their editions."""
+    return await customer_license_editions_service.get_data_async(where=where)
+
+
+async def get_customer_license_editions_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[CustomerLicenseEditionWhere] = None) -> Connection[CustomerLicenseEditionType]:
+    """Resolver that returns a page of customer licenses with their editions."""
+    return await customer_license_editions_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_customer_license_editions_aggregate(
+    group_by: Optional[List[CustomerLicenseEditionField]] = None,
+    aggregations: Optional[List[CustomerLicenseEditionAggregation]] = None,
+    where: Optional[CustomerLicenseEditionWhere] = None
+) -> List[CustomerLicenseEditionAggregateRow]:
+    """Resolver that returns customer licenses with their editions aggregated per group."""
+    return await customer_license_editions_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -0,0 +1,25 @@
+from typing import List, Optional
+from gql.types import DatabaseDetailsType, DatabaseDetailsWhere, DatabaseDetailsField, DatabaseDetailsAggregation, DatabaseDetailsAggregateRow, Connection
+from gql.services.views import ViewService
+
+# Materialized view over the cached tables, configured under `views` in config.yaml
+database_details_service = ViewService("database_details", entity_type=DatabaseDetailsType)
+
+
+async def get_database_details(where: Optional[DatabaseDetailsWhere] = None) -> List[DatabaseDetailsType]:
+    """Resolver that returns all databases with their Mavim details."""
+    return await database_details_service.get_data_async(where=where)
+
+
+async def get_database_details_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[DatabaseDetailsWhere] = None) -> Connection[DatabaseDetailsType]:
+    """Resolver that returns a page of databases with their Mavim details."""
+    return await database_details_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_database_details_aggregate(
+    group_by: Optional[List[DatabaseDetailsField]] = None,
+    aggregations: Optional[List[DatabaseDetailsAggregation]] = None,
+    where: Optional[DatabaseDetailsWhere] = None
+) -> List[DatabaseDetailsAggregateRow]:
+    """Resolver that returns databases with their Mavim details aggregated per group."""
+    return await database_details_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
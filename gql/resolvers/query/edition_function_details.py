@@ -1,17 +1,33 @@
-from typing import List
-from gql.types import EditionFunctionDetailsType
+from typing import List, Optional
+from gql.types import EditionFunctionDetailsType, EditionFunctionDetailsWhere, EditionFunctionDetailsField, EditionFunctionDetailsAggregation, EditionFunctionDetailsAggregateRow, Connection
 from gql.config import edition_function_details as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_edition_function_details
+from gql.resolvers.transformers import transform_to_edition_function_details, transform_to_edition_function_details_frame
 
 
 # Create a singleton service instance
 edition_function_service = DataService(
     path=PATH,
+    table_name="edition_function_details",
     entity_type=EditionFunctionDetailsType,
-    transform_func=transform_to_edition_function_details
+    transform_func=transform_to_edition_function_details,
+    frame_transform=transform_to_edition_function_details_frame
 )
 # This gets called for each GraphQL query
-def get_edition_function_details() -> List[EditionFunctionDetailsType]:
+async def get_edition_function_details(where: Optional[EditionFunctionDetailsWhere] = None) -> List[EditionFunctionDetailsType]:
     """Resolver that returns all edition function details."""
-    return edition_function_service.get_data()
\ No newline at end of file
+    return await edition_function_service.get_data_async(where=where)
+
+
+async def get_edition_function_details_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[EditionFunctionDetailsWhere] = None) -> Connection[EditionFunctionDetailsType]:
+    """Resolver that returns a page of edition function details."""
+    return await edition_function_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_edition_function_details_aggregate(
+    group_by: Optional[List[EditionFunctionDetailsField]] = None,
+    aggregations: Optional[List[EditionFunctionDetailsAggregation]] = None,
+    where: Optional[EditionFunctionDetailsWhere] = None
+) -> List[EditionFunctionDetailsAggregateRow]:
+    """Resolver that returns edition function details aggregated per group."""
+    return await edition_function_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -1,17 +1,33 @@
-from typing import List
-from gql.types import LicenseCustomerProductType
+from typing import List, Optional
+from gql.types import LicenseCustomerProductType, LicenseCustomerProductWhere, LicenseCustomerProductField, LicenseCustomerProductAggregation, LicenseCustomerProductAggregateRow, Connection
 from gql.config import license_customer_product as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_license_customer_product
+from gql.resolvers.transformers import transform_to_license_customer_product, transform_to_license_customer_product_frame
 
 # Create a singleton service instance
 license_customer_product_service = DataService(
     path=PATH,
+    table_name="license_customer_product",
     entity_type=LicenseCustomerProductType,
-    transform_func=transform_to_license_customer_product
+    transform_func=transform_to_license_customer_product,
+    frame_transform=transform_to_license_customer_product_frame
 )
 
 # This gets called for each GraphQL query
-def get_license_customer_product() -> List[LicenseCustomerProductType]:
+async def get_license_customer_product(where: Optional[LicenseCustomerProductWhere] = None) -> List[LicenseCustomerProductType]:
     """Resolver that returns all license customer products."""
-    return license_customer_product_service.get_data()
\ No newline at end of file
+    return await license_customer_product_service.get_data_async(where=where)
+
+
+async def get_license_customer_product_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[LicenseCustomerProductWhere] = None) -> Connection[LicenseCustomerProductType]:
+    """Resolver that returns a page of license customer products."""
+    return await license_customer_product_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_license_customer_product_aggregate(
+    group_by: Optional[List[LicenseCustomerProductField]] = None,
+    aggregations: Optional[List[LicenseCustomerProductAggregation]] = None,
+    where: Optional[LicenseCustomerProductWhere] = None
+) -> List[LicenseCustomerProductAggregateRow]:
+    """Resolver that returns license customer products aggregated per group."""
+    return await license_customer_product_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -1,16 +1,31 @@
-from typing import List
-from gql.types import ManagerUserLoginDetailsType
+from typing import List, Optional
+from gql.types import ManagerUserLoginDetailsType, ManagerUserLoginDetailsWhere, ManagerUserLoginDetailsField, ManagerUserLoginDetailsAggregation, ManagerUserLoginDetailsAggregateRow, Connection
 from gql.config import manager_user_login_details as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_manager_user_login_details
+from gql.resolvers.transformers import transform_to_manager_user_login_details, transform_to_manager_user_login_details_frame
 # Create a singleton service instance
 users_service = DataService(path=PATH,
+                            table_name="manager_user_login_details",
                             entity_type=ManagerUserLoginDetailsType,
-                            transform_func=transform_to_manager_user_login_details)
+                            transform_func=transform_to_manager_user_login_details,
+                            frame_transform=transform_to_manager_user_login_details_frame)
 
 
 # This gets called for each GraphQL query
-def get_manager_user_login_details() -> List[ManagerUserLoginDetailsType]:
+async def get_manager_user_login_details(where: Optional[ManagerUserLoginDetailsWhere] = None) -> List[ManagerUserLoginDetailsType]:
     """Resolver that returns all users."""
-    return users_service.get_data()
-    
\ No newline at end of file
+    return await users_service.get_data_async(where=where)
+
+
+async def get_manager_user_login_details_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[ManagerUserLoginDetailsWhere] = None) -> Connection[ManagerUserLoginDetailsType]:
+    """Resolver that returns a page of users."""
+    return await users_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_manager_user_login_details_aggregate(
+    group_by: Optional[List[ManagerUserLoginDetailsField]] = None,
+    aggregations: Optional[List[ManagerUserLoginDetailsAggregation]] = None,
+    where: Optional[ManagerUserLoginDetailsWhere] = None
+) -> List[ManagerUserLoginDetailsAggregateRow]:
+    """Resolver that returns users aggregated per group."""
+    return await users_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -1,17 +1,33 @@
-from typing import List
-from gql.types import MavimDatabaseType
+from typing import List, Optional
+from gql.types import MavimDatabaseType, MavimDatabaseWhere, MavimDatabaseField, MavimDatabaseAggregation, MavimDatabaseAggregateRow, Connection
 from gql.config import mavim_databases_details as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_mavim_database_details
+from gql.resolvers.transformers import transform_to_mavim_database_details, transform_to_mavim_database_details_frame
 
 # Create a singleton service instance
 mavim_database_service = DataService(
     path=PATH,
+    table_name="mavim_databases_details",
     entity_type=MavimDatabaseType,
-    transform_func=transform_to_mavim_database_details
+    transform_func=transform_to_mavim_database_details,
+    frame_transform=transform_to_mavim_database_details_frame
 )
 
 # This gets called for each GraphQL query
-def get_mavim_databases_details() -> List[MavimDatabaseType]:
+async def get_mavim_databases_details(where: Optional[MavimDatabaseWhere] = None) -> List[MavimDatabaseType]:
     """Resolver that returns all Mavim database details."""
-    return mavim_database_service.get_data()
\ No newline at end of file
+    return await mavim_database_service.get_data_async(where=where)
+
+
+async def get_mavim_databases_details_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[MavimDatabaseWhere] = None) -> Connection[MavimDatabaseType]:
+    """Resolver that returns a page of Mavim database details."""
+    return await mavim_database_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_mavim_databases_details_aggregate(
+    group_by: Optional[List[MavimDatabaseField]] = None,
+    aggregations: Optional[List[MavimDatabaseAggregation]] = None,
+    where: Optional[MavimDatabaseWhere] = None
+) -> List[MavimDatabaseAggregateRow]:
+    """Resolver that returns Mavim database details aggregated per group."""
+    return await mavim_database_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
@@ -1,16 +1,32 @@
-from typing import List
-from gql.types import MpmCustomerType
+from typing import List, Optional
+from gql.types import MpmCustomerType, MpmCustomerWhere, MpmCustomerField, MpmCustomerAggregation, MpmCustomerAggregateRow, Connection
 from gql.config import mpm_customers as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_mpm_customer
+from gql.resolvers.transformers import transform_to_mpm_customer, transform_to_mpm_customer_frame
 
 # Create a singleton service instance
 mpm_customer_service = DataService(
     path=PATH,
+    table_name="mpm_customers",
     entity_type=MpmCustomerType,
-    transform_func=transform_to_mpm_customer
+    transform_func=transform_to_mpm_customer,
+    frame_transform=transform_to_mpm_customer_frame
 )
 # This gets called for each GraphQL query
-def get_mpm_customers() -> List[MpmCustomerType]:
+async def get_mpm_customers(where: Optional[MpmCustomerWhere] = None) -> List[MpmCustomerType]:
     """Resolver that returns all MPM customers."""
-    return mpm_customer_service.get_data()
\ No newline at end of file
+    return await mpm_customer_service.get_data_async(where=where)
+
+
+async def get_mpm_customers_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[MpmCustomerWhere] = None) -> Connection[MpmCustomerType]:
+    """Resolver that returns a page of MPM customers."""
+    return await mpm_customer_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_mpm_customers_aggregate(
+    group_by: Optional[List[MpmCustomerField]] = None,
+    aggregations: Optional[List[MpmCustomerAggregation]] = None,
+    where: Optional[MpmCustomerWhere] = None
+) -> List[MpmCustomerAggregateRow]:
+    """Resolver that returns MPM customers aggregated per group."""
+    return await mpm_customer_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
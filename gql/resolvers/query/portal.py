@@ -1,16 +1,37 @@
-from typing import List
-from gql.types import PortalType
+from typing import List, Optional
+from gql.types import PortalType, PortalWhere, PortalField, PortalAggregation, PortalAggregateRow, Connection
 from gql.config import portal as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_portal
+from gql.resolvers.transformers import transform_to_portal, transform_to_portal_frame
 
 # Create a singleton service instance
 portal_service = DataService(path=PATH,
+                             table_name="portal",
                              entity_type=PortalType,
-                             transform_func=transform_to_portal)
+                             transform_func=transform_to_portal,
+                             frame_transform=transform_to_portal_frame)
 
 
 # This gets called for each GraphQL query
-def get_portal() -> List[PortalType]:
+async def get_portal(where: Optional[PortalWhere] = None) -> List[PortalType]:
     """Resolver that returns all portals."""
-    return portal_service.get_data()
+    return await portal_service.get_data_async(where=where)
+
+
+async def get_portal_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[PortalWhere] = None) -> Connection[PortalType]:
+    """Resolver that returns a page of portals."""
+    return await portal_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_portal_aggregate(
+    group_by: Optional[List[PortalField]] = None,
+    aggregations: Optional[List[PortalAggregation]] = None,
+    where: Optional[PortalWhere] = None
+) -> List[PortalAggregateRow]:
+    """Resolver that returns portals aggregated per group."""
+    return await portal_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
+
+
+async def get_portal_by_id(portal_id: int) -> Optional[PortalType]:
+    """Resolver that returns the portal with a portal id, looked up by primary key."""
+    return await portal_service.get_by_key_async([portal_id])
@@ -1,16 +1,32 @@
-from typing import List
-from gql.types import PortalMonthlyUserReportType
+from typing import List, Optional
+from gql.types import PortalMonthlyUserReportType, PortalMonthlyUserReportWhere, PortalMonthlyUserReportField, PortalMonthlyUserReportAggregation, PortalMonthlyUserReportAggregateRow, Connection
 from gql.config import portal_monthly_users_report as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_portal_monthly_users_report
+from gql.resolvers.transformers import transform_to_portal_monthly_users_report, transform_to_portal_monthly_users_report_frame
 
 # Create a singleton service instance
 portal_monthly_users_report_service = DataService(
     path=PATH,
+    table_name="portal_monthly_users_report",
     entity_type=PortalMonthlyUserReportType,
-    transform_func=transform_to_portal_monthly_users_report
+    transform_func=transform_to_portal_monthly_users_report,
+    frame_transform=transform_to_portal_monthly_users_report_frame
 )
 # This gets called for each GraphQL query
-def get_portal_monthly_users_report() -> List[PortalMonthlyUserReportType]:
+async def get_portal_monthly_users_report(where: Optional[PortalMonthlyUserReportWhere] = None) -> List[PortalMonthlyUserReportType]:
     """Resolver that returns all portal monthly user reports."""
-    return portal_monthly_users_report_service.get_data()
\ No newline at end of file
+    return await portal_monthly_users_report_service.get_data_async(where=where)
+
+
+async def get_portal_monthly_users_report_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[PortalMonthlyUserReportWhere] = None) -> Connection[PortalMonthlyUserReportType]:
+    """Resolver that returns a page of portal monthly user reports."""
+    return await portal_monthly_users_report_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_portal_monthly_users_report_aggregate(
+    group_by: Optional[List[PortalMonthlyUserReportField]] = None,
+    aggregations: Optional[List[PortalMonthlyUserReportAggregation]] = None,
+    where: Optional[PortalMonthlyUserReportWhere] = None
+) -> List[PortalMonthlyUserReportAggregateRow]:
+    """Resolver that returns portal monthly user reports aggregated per group."""
+    return await portal_monthly_users_report_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
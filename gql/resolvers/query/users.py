@@ -1,15 +1,31 @@
-from typing import List
-from gql.types import UserMavimManagerLicenseType
+from typing import List, Optional
+from gql.types import UserMavimManagerLicenseType, UserMavimManagerLicenseWhere, UserMavimManagerLicenseField, UserMavimManagerLicenseAggregation, UserMavimManagerLicenseAggregateRow, Connection
 from gql.config import users as PATH
 from gql.services.data_service import DataService
-from gql.resolvers.transformers import transform_to_user_mavim_manager_license
+from gql.resolvers.transformers import transform_to_user_mavim_manager_license, transform_to_user_mavim_manager_license_frame
 # Create a singleton service instance
 users_service = DataService(path=PATH,
+                            table_name="mavim_manager_users",
                             entity_type=UserMavimManagerLicenseType,
-                            transform_func=transform_to_user_mavim_manager_license)
+                            transform_func=transform_to_user_mavim_manager_license,
+                            frame_transform=transform_to_user_mavim_manager_license_frame)
 
 
 # This gets called for each GraphQL query
-def get_users_mavim_manager() -> List[UserMavimManagerLicenseType]:
+async def get_users_mavim_manager(where: Optional[UserMavimManagerLicenseWhere] = None) -> List[UserMavimManagerLicenseType]:
     """Resolver that returns all users."""
-    return users_service.get_data()
+    return await users_service.get_data_async(where=where)
+
+
+async def get_users_mavim_manager_connection(first: Optional[int] = None, after: Optional[str] = None, where: Optional[UserMavimManagerLicenseWhere] = None) -> Connection[UserMavimManagerLicenseType]:
+    """Resolver that returns a page of users."""
+    return await users_service.get_page_async(first=first, after=after, where=where)
+
+
+async def get_users_mavim_manager_aggregate(
+    group_by: Optional[List[UserMavimManagerLicenseField]] = None,
+    aggregations: Optional[List[UserMavimManagerLicenseAggregation]] = None,
+    where: Optional[UserMavimManagerLicenseWhere] = None
+) -> List[UserMavimManagerLicenseAggregateRow]:
+    """Resolver that returns users aggregated per group."""
+    return await users_service.aggregate_async(group_by=group_by, aggregations=aggregations, where=where)
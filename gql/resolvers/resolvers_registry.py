@@ -1,15 +1,17 @@
-from gql.resolvers.query.company import get_companies
-from gql.resolvers.query.customer_addons_details import get_customer_addons_details
-from gql.resolvers.query.customer_edition_details import get_customer_edition_details
-from gql.resolvers.query.edition_function_details import get_edition_function_details   
-from gql.resolvers.query.mavim_databases_details import get_mavim_databases_details
-from gql.resolvers.query.users import get_users_mavim_manager
-from gql.resolvers.query.mpm_customers import get_mpm_customers
-from gql.resolvers.query.portal import get_portal
-from gql.resolvers.query.license_customer_product import get_license_customer_product
-from gql.resolvers.query.combined_users import get_combined_users
-from gql.resolvers.query.combined_databases import get_combined_databases
-from gql.resolvers.query.portal_monthly_users_report import get_portal_monthly_users_report
-from gql.resolvers.query.company_global_admin import get_company_global_admin
-from gql.resolvers.query.manager_user_login_details import get_manager_user_login_details
-
+from gql.resolvers.query.company import get_companies, get_companies_connection, get_companies_aggregate, get_company
+from gql.resolvers.query.customer_addons_details import get_customer_addons_details, get_customer_addons_details_connection, get_customer_addons_details_aggregate
+from gql.resolvers.query.customer_edition_details import get_customer_edition_details, get_customer_edition_details_connection, get_customer_edition_details_aggregate
+from gql.resolvers.query.edition_function_details import get_edition_function_details, get_edition_function_details_connection, get_edition_function_details_aggregate
+from gql.resolvers.query.mavim_databases_details import get_mavim_databases_details, get_mavim_databases_details_connection, get_mavim_databases_details_aggregate
+from gql.resolvers.query.users import get_users_mavim_manager, get_users_mavim_manager_connection, get_users_mavim_manager_aggregate
+from gql.resolvers.query.mpm_customers import get_mpm_customers, get_mpm_customers_connection, get_mpm_customers_aggregate
+from gql.resolvers.query.portal import get_portal, get_portal_connection, get_portal_aggregate, get_portal_by_id
+from gql.resolvers.query.license_customer_product import get_license_customer_product, get_license_customer_product_connection, get_license_customer_product_aggregate
+from gql.resolvers.query.combined_users import get_combined_users, get_combined_users_connection, get_combined_users_aggregate
+from gql.resolvers.query.combined_databases import get_combined_databases, get_combined_databases_connection, get_combined_databases_aggregate
+from gql.resolvers.query.portal_monthly_users_report import get_portal_monthly_users_report, get_portal_monthly_users_report_connection, get_portal_monthly_users_report_aggregate
+from gql.resolvers.query.company_global_admin import get_company_global_admin, get_company_global_admin_connection, get_company_global_admin_aggregate
+from gql.resolvers.query.manager_user_login_details import get_manager_user_login_details, get_manager_user_login_details_connection, get_manager_user_login_details_aggregate
+from gql.resolvers.query.company_users import get_company_users, get_company_users_connection, get_company_users_aggregate
+from gql.resolvers.query.customer_license_editions import get_customer_license_editions, get_customer_license_editions_connection, get_customer_license_editions_aggregate
+from gql.resolvers.query.database_details import get_database_details, get_database_details_connection, get_database_details_aggregate
@@ -1,14 +1,14 @@
-from .company_transformer import transform_to_company
-from .license_customer_product_transformer import transform_to_license_customer_product
-from .customer_addons_details_transformer import transform_to_customer_addons_details
-from .customer_edition_details_transformer import transform_to_customer_edition_details
-from .edition_function_details_transformer import transform_to_edition_function_details
-from .mavim_databases_details_transformer import transform_to_mavim_database_details
-from .users_transformer import transform_to_user_mavim_manager_license
-from .portal_transformer import transform_to_portal
-from .mpm_customers_transformer import transform_to_mpm_customer
-from .combined_databases_transformer import transform_to_combined_databases
-from .combined_users_transformer import transform_to_combined_users
-from .portal_monthly_users_report_transformer import transform_to_portal_monthly_users_report
-from .company_global_admin_transformer import transform_to_company_global_admin
-from .manager_user_login_details_transformer import transform_to_manager_user_login_details
+from .company_transformer import transform_to_company, transform_to_company_frame
+from .license_customer_product_transformer import transform_to_license_customer_product, transform_to_license_customer_product_frame
+from .customer_addons_details_transformer import transform_to_customer_addons_details, transform_to_customer_addons_details_frame
+from .customer_edition_details_transformer import transform_to_customer_edition_details, transform_to_customer_edition_details_frame
+from .edition_function_details_transformer import transform_to_edition_function_details, transform_to_edition_function_details_frame
+from .mavim_databases_details_transformer import transform_to_mavim_database_details, transform_to_mavim_database_details_frame
+from .users_transformer import transform_to_user_mavim_manager_license, transform_to_user_mavim_manager_license_frame
+from .portal_transformer import transform_to_portal, transform_to_portal_frame
+from .mpm_customers_transformer import transform_to_mpm_customer, transform_to_mpm_customer_frame
+from .combined_databases_transformer import transform_to_combined_databases, transform_to_combined_databases_frame
+from .combined_users_transformer import transform_to_combined_users, transform_to_combined_users_frame
+from .portal_monthly_users_report_transformer import transform_to_portal_monthly_users_report, transform_to_portal_monthly_users_report_frame
+from .company_global_admin_transformer import transform_to_company_global_admin, transform_to_company_global_admin_frame
+from .manager_user_login_details_transformer import transform_to_manager_user_login_details, transform_to_manager_user_login_details_frame
@@ -1,6 +1,7 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import CombinedDatabasesType
-from gql.utils.datetime import parse_mavim_date
+from gql.utils.datetime import mavim_date, parse_mavim_date
 
 
 def transform_to_combined_databases(row: Dict[str, Any]) -> CombinedDatabasesType:
@@ -18,3 +19,22 @@ def transform_to_combined_databases(row: Dict[str, Any]) -> CombinedDatabasesTyp
                           allowed_db_size_mb=row['allowed_db_size_mb'],
                           db_size_mb=row['db_size_mb'],
                           customer_name_and_id=row['customer_name_and_id'])
+
+
+def transform_to_combined_databases_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_combined_databases: one column per CombinedDatabasesType field."""
+    return df.select(
+        pl.col("database_id"),
+        pl.col("connection_string"),
+        pl.col("database_name"),
+        pl.col("company_guid"),
+        mavim_date("created_date").alias("created_date"),
+        mavim_date("modified_date").alias("modified_date"),
+        pl.col("primary_region"),
+        pl.col("company_id"),
+        pl.col("company_name"),
+        pl.col("reference_db"),
+        pl.col("allowed_db_size_mb"),
+        pl.col("db_size_mb"),
+        pl.col("customer_name_and_id")
+    )
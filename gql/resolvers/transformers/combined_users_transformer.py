@@ -1,6 +1,7 @@
 from typing import Dict,Any
+import polars as pl
 from gql.types import CombinedUsersType
-from gql.utils.datetime import parse_mavim_date
+from gql.utils.datetime import mavim_date, parse_mavim_date
 
 def transform_to_combined_users(row: Dict[str, Any]) -> CombinedUsersType:
     return CombinedUsersType(
@@ -15,3 +16,19 @@ def transform_to_combined_users(row: Dict[str, Any]) -> CombinedUsersType:
             company_id=row['company_id'],
             company_name=row['company_name']            
 )
+
+
+def transform_to_combined_users_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_combined_users: one column per CombinedUsersType field."""
+    return df.select(
+        pl.col("user_id"),
+        pl.col("product_name"),
+        pl.col("license_name"),
+        pl.col("user_name"),
+        pl.col("first_name"),
+        pl.col("last_name"),
+        mavim_date("created_date").alias("created_date"),
+        mavim_date("modified_date").alias("modified_date"),
+        pl.col("company_id"),
+        pl.col("company_name")
+    )
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import CompanyGlobalAdminType
 from gql.utils.datetime import parse_mavim_date
 
@@ -19,3 +20,17 @@ def transform_to_company_global_admin(
         )
     
 
+
+def transform_to_company_global_admin_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_company_global_admin: one column per CompanyGlobalAdminType field."""
+    return df.select(
+        pl.col("FirstName").alias("first_name"),
+        pl.col("LastName").alias("last_name"),
+        pl.col("Email").alias("email"),
+        pl.col("user_id"),
+        pl.col("role_name"),
+        pl.col("role_description"),
+        pl.col("user_aggregateid").alias("user_aggregate_id"),
+        pl.col("CompanyId").alias("company_id"),
+        pl.col("Created").alias("created")
+    )
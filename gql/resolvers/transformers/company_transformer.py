@@ -1,5 +1,7 @@
 from typing import Dict, Any
+import polars as pl
 from gql.types import CompanyType
+from gql.utils.columns import flag, parse_flag, whole_number
 
 def transform_to_company(row: Dict[str, Any]) -> CompanyType:
     """Transform a data row to a CompanyType."""
@@ -11,12 +13,13 @@ def transform_to_company(row: Dict[str, Any]) -> CompanyType:
         termination_date=row["termination_date"],
         terminated_date=row["terminated_date"],
         crm_id=row["crm_id"],
-        number_of_databases=row["number_of_databases"],
+        number_of_databases=int(row["number_of_databases"])
+        if row["number_of_databases"] is not None else None,
         number_of_portal_users=row["number_of_portal_users"],
         external_customer_id=row["external_customer_id"],
-        is_partner=bool(row["is_partner"]),
+        is_partner=bool(parse_flag(row["is_partner"])),
         partner_customer_id=row["partner_customer_id"],
-        is_onboarded_to_improve=bool(row["is_onboarded_to_improve"]),
+        is_onboarded_to_improve=bool(parse_flag(row["is_onboarded_to_improve"])),
         onboarded_to_improve_date=row["onboarded_to_improve_date"],
         exact_id=row["exact_id"],
         version_number=row["version_number"],
@@ -27,3 +30,29 @@ def transform_to_company(row: Dict[str, Any]) -> CompanyType:
         crm_url=row["crm_url"]
     )
 
+
+def transform_to_company_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_company: one column per CompanyType field."""
+    return df.select(
+        pl.col("customer_id"),
+        pl.col("customer_name"),
+        pl.col("created_date"),
+        pl.col("modified_date"),
+        pl.col("termination_date"),
+        pl.col("terminated_date"),
+        pl.col("crm_id"),
+        whole_number("number_of_databases"),
+        pl.col("number_of_portal_users"),
+        pl.col("external_customer_id"),
+        flag("is_partner").fill_null(False),
+        pl.col("partner_customer_id"),
+        flag("is_onboarded_to_improve").fill_null(False),
+        pl.col("onboarded_to_improve_date"),
+        pl.col("exact_id"),
+        pl.col("version_number"),
+        pl.col("company_guid"),
+        pl.col("domain_name"),
+        pl.col("app_id"),
+        pl.col("customer_name_and_id"),
+        pl.col("crm_url")
+    )
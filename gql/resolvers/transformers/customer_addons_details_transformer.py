@@ -1,5 +1,7 @@
 from typing import Dict, Any
+import polars as pl
 from gql.types import CustomerAddonDetailsType
+from gql.utils.columns import flag, parse_flag
 
 def transform_to_customer_addons_details(row: Dict[str, Any]) -> CustomerAddonDetailsType:
     """Transform a data row to a CustomerAddonDetailsType."""
@@ -10,5 +12,18 @@ def transform_to_customer_addons_details(row: Dict[str, Any]) -> CustomerAddonDe
             addon_configuration=row["addon_configuration"],
             customer_addon_id=row["customer_addon_id"],
             name=row["name"],
-            is_addon=bool(row["is_addon"])
-    )
\ No newline at end of file
+            is_addon=bool(parse_flag(row["is_addon"]))
+    )
+
+
+def transform_to_customer_addons_details_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_customer_addons_details: one column per CustomerAddonDetailsType field."""
+    return df.select(
+        pl.col("customer_id"),
+        pl.col("addon_id"),
+        pl.col("quantity"),
+        pl.col("addon_configuration"),
+        pl.col("customer_addon_id"),
+        pl.col("name"),
+        flag("is_addon").fill_null(False)
+    )
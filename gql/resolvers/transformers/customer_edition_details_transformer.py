@@ -1,5 +1,7 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import CustomerEditionDetailsType
+from gql.utils.columns import flag, parse_flag
 
 
 def transform_to_customer_edition_details(
@@ -10,9 +12,25 @@ def transform_to_customer_edition_details(
         edition_id=row.get("customer_edition_edition_id"),
         edition_name=row.get("mavim_edition_name"),
         edition_description=row.get("mavim_edition_description"),
-        edition_is_active=bool(row.get("mavim_edition_is_active")),
+        edition_is_active=bool(parse_flag(row.get("mavim_edition_is_active"))),
         edition_quantity=row.get("customer_edition_quantity"),
         edition_created_date=row.get("mavim_edition_created_date"),
         edition_modified_date=row.get("mavim_edition_modified_date"),
         edition_deleted_date=row.get("mavim_edition_deleted_date"),
     )
+
+
+def transform_to_customer_edition_details_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_customer_edition_details: one column per CustomerEditionDetailsType field."""
+    return df.select(
+        pl.col("customer_id"),
+        pl.col("customer_edition_id"),
+        pl.col("customer_edition_edition_id").alias("edition_id"),
+        pl.col("mavim_edition_name").alias("edition_name"),
+        pl.col("mavim_edition_description").alias("edition_description"),
+        flag("mavim_edition_is_active").fill_null(False).alias("edition_is_active"),
+        pl.col("customer_edition_quantity").alias("edition_quantity"),
+        pl.col("mavim_edition_created_date").alias("edition_created_date"),
+        pl.col("mavim_edition_modified_date").alias("edition_modified_date"),
+        pl.col("mavim_edition_deleted_date").alias("edition_deleted_date")
+    )
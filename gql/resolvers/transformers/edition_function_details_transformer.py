@@ -1,5 +1,7 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import EditionFunctionDetailsType
+from gql.utils.columns import flag, parse_flag
 
 
 def transform_to_edition_function_details(
@@ -11,7 +13,21 @@ def transform_to_edition_function_details(
         function_name=row.get("function_name"),
         function_description=row.get("function_description"),
         function_subject=row.get("function_subject"),
-        function_is_addon=bool(row.get("function_is_addon")),
+        function_is_addon=bool(parse_flag(row.get("function_is_addon"))),
         function_is_company_wide_addon=bool(
-            row.get("function_is_company_wide_addon")),
+            parse_flag(row.get("function_is_company_wide_addon"))),
+    )
+
+
+def transform_to_edition_function_details_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_edition_function_details: one column per EditionFunctionDetailsType field."""
+    return df.select(
+        pl.col("edition_id"),
+        pl.col("function_id"),
+        pl.col("function_code"),
+        pl.col("function_name"),
+        pl.col("function_description"),
+        pl.col("function_subject"),
+        flag("function_is_addon").fill_null(False),
+        flag("function_is_company_wide_addon").fill_null(False)
     )
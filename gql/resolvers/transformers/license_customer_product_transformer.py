@@ -1,6 +1,8 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import LicenseCustomerProductType
-from gql.utils.datetime import parse_mavim_date
+from gql.utils.columns import whole_number
+from gql.utils.datetime import mavim_date, parse_mavim_date
 
 def transform_to_license_customer_product(
         row: Dict[str, Any]) -> LicenseCustomerProductType:
@@ -18,3 +20,19 @@ def transform_to_license_customer_product(
         used_qty=int(row["used_qty"]) if row["used_qty"] is not None else None,
         is_active=row["is_active"],
         created=parse_mavim_date(row['created']))
+
+
+def transform_to_license_customer_product_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_license_customer_product: one column per LicenseCustomerProductType field."""
+    return df.select(
+        pl.col("customer_id"),
+        pl.col("customer_name"),
+        whole_number("number_of_databases"),
+        pl.col("is_partner"),
+        pl.col("product_name"),
+        pl.col("license_name"),
+        whole_number("license_quantity"),
+        whole_number("used_qty"),
+        pl.col("is_active"),
+        mavim_date("created").alias("created")
+    )
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import ManagerUserLoginDetailsType
 
 
@@ -10,3 +11,13 @@ def transform_to_manager_user_login_details(
         customer_id=row["customer_id"],
         login_time=row["login_time"]
     )
+
+
+def transform_to_manager_user_login_details_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_manager_user_login_details: one column per ManagerUserLoginDetailsType field."""
+    return df.select(
+        pl.col("id"),
+        pl.col("thinfinity_user"),
+        pl.col("customer_id"),
+        pl.col("login_time")
+    )
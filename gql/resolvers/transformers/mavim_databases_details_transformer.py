@@ -1,6 +1,7 @@
 
+import polars as pl
 from gql.types import MavimDatabaseType
-from gql.utils.datetime import parse_mavim_date
+from gql.utils.datetime import mavim_date, parse_mavim_date
 from typing import Dict, Any
 
 def transform_to_mavim_database_details(row: Dict[str, Any]) -> MavimDatabaseType:
@@ -30,3 +31,27 @@ def transform_to_mavim_database_details(row: Dict[str, Any]) -> MavimDatabaseTyp
         # manager_database_user_id=row["manager_database_user_id"],
         # manager_database_user_database_id=row["manager_database_user_database_id"]
     )
+
+
+def transform_to_mavim_database_details_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_mavim_database_details: one column per MavimDatabaseType field."""
+    return df.select(
+        pl.col("database_id"),
+        pl.col("customer_id"),
+        pl.col("mavim_database_connection_name").alias("connection_name"),
+        pl.col("mavim_database_connection_string").alias("connection_string"),
+        pl.col("mavim_sql_server"),
+        pl.col("mavim_sql_database"),
+        pl.col("mavim_schema"),
+        pl.col("mavim_db_license_code"),
+        pl.col("db_size_mb"),
+        mavim_date("mavim_database_created_date").alias("created_date"),
+        mavim_date("mavim_database_modified_date").alias("modified_date"),
+        mavim_date("mavim_database_deleted_date").alias("deleted_date"),
+        pl.col("mavim_database_allowed_db_size_mb").alias("allowed_db_size_mb"),
+        pl.col("mavim_database_template_id").alias("template_id"),
+        pl.col("mavim_database_onboarded_to_improve").alias("onboarded_to_improve"),
+        pl.col("mavim_database_secondary_connection_string").alias("secondary_connection_string"),
+        pl.col("mavim_database_domain_name").alias("domain_name"),
+        pl.col("mavim_database_guid").alias("database_guid")
+    )
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import MpmCustomerType
 
 def transform_to_mpm_customer(row: Dict[str, Any]) -> MpmCustomerType:
@@ -14,3 +15,18 @@ def transform_to_mpm_customer(row: Dict[str, Any]) -> MpmCustomerType:
         subscription_start_date=row["subscription_start_date"],
         subscription_end_date=row["subscription_end_date"],
     )
+
+
+def transform_to_mpm_customer_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_mpm_customer: one column per MpmCustomerType field."""
+    return df.select(
+        pl.col("customer_id"),
+        pl.col("number_of_analyzer"),
+        pl.col("number_of_developer"),
+        pl.col("number_of_reports"),
+        pl.col("workspace_id"),
+        pl.col("portal_url"),
+        pl.col("subscription_key"),
+        pl.col("subscription_start_date"),
+        pl.col("subscription_end_date")
+    )
@@ -1,6 +1,7 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import PortalMonthlyUserReportType
-from gql.utils.datetime import parse_mavim_date
+from gql.utils.datetime import mavim_date, parse_mavim_date
 
 
 def transform_to_portal_monthly_users_report(
@@ -15,3 +16,17 @@ def transform_to_portal_monthly_users_report(
         month=row['month'],
         year=row['year'],
         created_date=parse_mavim_date(row['created_date']))
+
+
+def transform_to_portal_monthly_users_report_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_portal_monthly_users_report: one column per PortalMonthlyUserReportType field."""
+    return df.select(
+        pl.col("report_id"),
+        pl.col("portal_id"),
+        pl.col("portal_name"),
+        pl.col("portal_sql_database"),
+        pl.col("users_count"),
+        pl.col("month"),
+        pl.col("year"),
+        mavim_date("created_date").alias("created_date")
+    )
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import PortalType
 
 
@@ -23,3 +24,27 @@ def transform_to_portal(row: Dict[str, Any]) -> PortalType:
         modified_date=row.get("portal_modified_date", ""),
         termination_date=row.get("portal_termination_date", ""),
     )
+
+
+def transform_to_portal_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_portal: one column per PortalType field."""
+    return df.select(
+        pl.col("portal_id"),
+        pl.col("customer_id"),
+        pl.col("portal_name").alias("name"),
+        pl.col("portal_connection_string").alias("connection_string"),
+        pl.col("portal_sql_server"),
+        pl.col("portal_sql_database"),
+        pl.col("portal_sql_user"),
+        pl.col("portal_sql_password"),
+        pl.col("portal_database_size_mb").alias("database_size_mb"),
+        pl.col("portal_allowed_db_size_mb").alias("allowed_db_size_mb"),
+        pl.col("portal_app_name"),
+        pl.col("portal_app_id"),
+        pl.col("portal_url"),
+        pl.col("portal_number_of_portal_users").alias("number_of_portal_users"),
+        pl.col("portal_users_active"),
+        pl.col("portal_created_date").alias("created_date"),
+        pl.col("portal_modified_date").alias("modified_date"),
+        pl.col("portal_termination_date").alias("termination_date")
+    )
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+import polars as pl
 from gql.types import UserMavimManagerLicenseType
 
 
@@ -22,6 +23,29 @@ def transform_to_user_mavim_manager_license(
         license_changed_date=row["license_changed_date"],
         license=row["license"])
 
+
+def transform_to_user_mavim_manager_license_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Vectorized transform_to_user_mavim_manager_license: one column per UserMavimManagerLicenseType field."""
+    return df.select(
+        pl.col("customer_edition_id"),
+        pl.col("customer_id"),
+        pl.col("deployment_status"),
+        pl.col("edition_id"),
+        pl.col("edition_name"),
+        pl.col("email_address"),
+        pl.col("first_name"),
+        pl.col("last_name"),
+        pl.col("upn"),
+        pl.col("user_name"),
+        pl.col("created_date"),
+        pl.col("user_id"),
+        pl.col("modified_date"),
+        pl.col("deleted_date"),
+        pl.col("license_changed_date"),
+        pl.col("license")
+    )
+
+
 # print(transform_to_mavim_manager_license({
 #     "customer_edition_id": "12345",
 #     "customer_id": "67890",
@@ -0,0 +1,151 @@
+from dataclasses import replace
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Union
+from graphql import ExecutionResult, GraphQLError
+from strawberry.asgi import GraphQL
+from strawberry.http import GraphQLHTTPResponse
+from gql.services.coalescing import RequestCoalescer, default_request_coalescer
+from gql.services.data_service import track_reads
+from gql.services.fast_path import execute_flat_query, plan_flat_query
+from gql.services.persisted_queries import PersistedQueries, PersistedQueryError, default_persisted_queries
+from gql.services.response_cache import ResponseCache, auth_scope, default_response_cache, response_key
+
+
+class _EncodedResult(ExecutionResult):
+    """Result of a query already written as JSON, with the errors it holds."""
+
+    def __init__(self, body: str, errors: Optional[List[GraphQLError]] = None):
+        super().__init__(data=None, errors=errors)
+        self.body = body
+
+
+class _EncodedResponse(dict):
+    """A response body written before strawberry would encode it."""
+
+    def __init__(self, body: str):
+        super().__init__()
+        self.body = body
+
+
+class GraphQLApp(GraphQL):
+    """
+    Strawberry's ASGI GraphQL app, answering queries from the cached tables as directly as possible.
+
+    Queries such as `{ users { customerId userName } }` are written to JSON
+    column by column from the table's frame (see gql.services.fast_path), with
+    the bytes normal execution would send; every other query executes as usual.
+    Successful responses are kept in a ResponseCache until a table they were
+    made from loads new data, and identical operations arriving together are
+    executed once by a RequestCoalescer. Clients may send persisted query
+    hashes instead of query documents (see PersistedQueries).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        response_cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        persisted_queries: Optional[PersistedQueries] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize the app.
+
+        Args:
+            *args: Strawberry GraphQL app arguments, the schema first
+            response_cache: Cache of the responses; defaults to the one configured in config.yaml
+            coalescer: Coalescer of identical operations; defaults to the one configured in config.yaml
+            persisted_queries: Persisted query store; defaults to the one configured in config.yaml,
+                with its allowlist loaded
+            **kwargs: Further strawberry GraphQL app settings
+        """
+        super().__init__(*args, **kwargs)
+        self.response_cache = response_cache if response_cache is not None else default_response_cache()
+        self.coalescer = coalescer if coalescer is not None else default_request_coalescer()
+        self.persisted_queries = persisted_queries if persisted_queries is not None else default_persisted_queries()
+
+    async def execute_single(
+        self,
+        request: Any,
+        request_adapter: Any,
+        sub_response: Any,
+        context: Any,
+        root_value: Optional[Any],
+        request_data: Any,
+    ) -> ExecutionResult:
+        if self.persisted_queries is not None:
+            try:
+                query = self.persisted_queries.resolve(request_data.query, request_data.extensions)
+            except PersistedQueryError as e:
+                return ExecutionResult(data=None, errors=[GraphQLError(str(e), extensions={"code": e.code})])
+            request_data = replace(request_data, query=query)
+        execute = partial(
+            super().execute_single,
+            request=request,
+            request_adapter=request_adapter,
+            sub_response=sub_response,
+            context=context,
+            root_value=root_value,
+            request_data=request_data,
+        )
+        if not request_data.query or (not self.allow_queries_via_get and request_adapter.method == "GET"):
+            return await execute()
+
+        key = None
+        if self.response_cache is not None or self.coalescer is not None:
+            key = response_key(
+                request_data.query, request_data.operation_name, request_data.variables, auth_scope(context)
+            )
+        if key is None:
+            return await self._execute(request_data, execute)
+        if self.response_cache is not None:
+            body = await self.response_cache.get_async(key)
+            if body is not None:
+                return _EncodedResult(body)
+        if self.coalescer is None:
+            return await self._execute_keyed(key, request, request_data, execute)
+        return await self.coalescer.run(key, partial(self._execute_keyed, key, request, request_data, execute))
+
+    async def _execute(
+        self,
+        request_data: Any,
+        execute: Callable[[], Awaitable[ExecutionResult]]
+    ) -> ExecutionResult:
+        """Answer through the fast path, else through normal execution."""
+        plan = plan_flat_query(self.schema, request_data.query, request_data.operation_name)
+        body = await execute_flat_query(plan) if plan is not None else None
+        return _EncodedResult(body) if body is not None else await execute()
+
+    async def _execute_keyed(
+        self,
+        key: Hashable,
+        request: Any,
+        request_data: Any,
+        execute: Callable[[], Awaitable[ExecutionResult]]
+    ) -> _EncodedResult:
+        """Answer an operation with a cache key, encoded so every coalesced caller gets the same bytes."""
+        with track_reads() as reads:
+            result = await self._execute(request_data, execute)
+        if not isinstance(result, _EncodedResult):
+            body = self.encode_json(await super().process_result(request, result))
+            result = _EncodedResult(body, errors=result.errors)
+        if self.response_cache is not None and not result.errors:
+            self.response_cache.put(key, result.body, reads)
+        return result
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        # A GET sending only a persisted query hash has no query either
+        return super().should_render_graphql_ide(request) and request.query_params.get("extensions") is None
+
+    async def process_result(self, request: Any, result: ExecutionResult) -> GraphQLHTTPResponse:
+        if isinstance(result, _EncodedResult):
+            return _EncodedResponse(result.body)  # type: ignore[return-value]
+        return await super().process_result(request, result)
+
+    def encode_json(self, data: Union[GraphQLHTTPResponse, List[GraphQLHTTPResponse]]) -> str:
+        if isinstance(data, _EncodedResponse):
+            return data.body
+        if isinstance(data, list) and any(isinstance(item, _EncodedResponse) for item in data):
+            # A batch, separated as json.dumps separates list items
+            return "[" + ", ".join(self.encode_json(item) for item in data) + "]"
+        return super().encode_json(data)
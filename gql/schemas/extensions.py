@@ -0,0 +1,42 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterator
+from graphql import parse
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.schema import validate_document
+from gql.config import config
+
+document_cache_settings: Dict[str, Any] = config.get('document_cache') or {}
+
+# Shared by every request; strawberry creates the extension anew for each one
+_parse = lru_cache(maxsize=int(document_cache_settings.get('size', 1024)))(parse)
+_validate = lru_cache(maxsize=int(document_cache_settings.get('size', 1024)))(validate_document)
+
+
+class DocumentCache(SchemaExtension):
+    """
+    Parse and validate each distinct query document once.
+
+    Strawberry's ParserCache and ValidationCache keep their cache on the
+    extension instance, which is either shared by concurrent requests or
+    created per request; this keeps the LRU caches at module level and is
+    registered as a class, so every request gets its own instance.
+    """
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        execution_context.graphql_document = _parse(execution_context.query, **execution_context.parse_options)
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        execution_context.pre_execution_errors = _validate(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            execution_context.validation_rules,
+        )
+        yield
+
+
+def document_cache_info() -> Dict[str, Any]:
+    """Hits, misses and sizes of the parse and validation caches."""
+    return {"parse": _parse.cache_info()._asdict(), "validate": _validate.cache_info()._asdict()}
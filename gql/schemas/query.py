@@ -1,11 +1,19 @@
 import typing
 import strawberry
-from gql.resolvers.query.company_global_admin import get_company_global_admin
+from gql.resolvers.query.company_global_admin import get_company_global_admin, get_company_global_admin_connection
 from gql.types import (
     UserMavimManagerLicenseType, LicenseCustomerProductType, CompanyType,
     CustomerAddonDetailsType, CustomerEditionDetailsType,
     EditionFunctionDetailsType, MavimDatabaseType, PortalType,MpmCustomerType
-    ,CombinedDatabasesType,CombinedUsersType,PortalMonthlyUserReportType
+    ,CombinedDatabasesType,CombinedUsersType,PortalMonthlyUserReportType,
+    CompanyUserType, CustomerLicenseEditionType, DatabaseDetailsType,
+    Connection,
+    CompanyAggregateRow, CustomerAddonDetailsAggregateRow, CustomerEditionDetailsAggregateRow,
+    EditionFunctionDetailsAggregateRow, MavimDatabaseAggregateRow, UserMavimManagerLicenseAggregateRow,
+    LicenseCustomerProductAggregateRow, PortalAggregateRow, MpmCustomerAggregateRow,
+    CombinedDatabasesAggregateRow, CombinedUsersAggregateRow, PortalMonthlyUserReportAggregateRow,
+    CompanyGlobalAdminAggregateRow, ManagerUserLoginDetailsAggregateRow, CompanyUserAggregateRow,
+    CustomerLicenseEditionAggregateRow, DatabaseDetailsAggregateRow
     )
 from gql.types.company_global_admin import CompanyGlobalAdminType
 from gql.types.manager_user_login_details import ManagerUserLoginDetailsType
@@ -19,7 +27,39 @@ from ..resolvers import (get_companies, get_customer_addons_details,
                         get_combined_databases,
                         get_combined_users,
                         get_portal_monthly_users_report,
-                        get_manager_user_login_details
+                        get_manager_user_login_details,
+                        get_companies_connection,
+                        get_customer_addons_details_connection,
+                        get_customer_edition_details_connection,
+                        get_edition_function_details_connection,
+                        get_mavim_databases_details_connection,
+                        get_users_mavim_manager_connection,
+                        get_license_customer_product_connection,
+                        get_portal_connection,
+                        get_mpm_customers_connection,
+                        get_combined_databases_connection,
+                        get_combined_users_connection,
+                        get_portal_monthly_users_report_connection,
+                        get_manager_user_login_details_connection,
+                        get_company,
+                        get_portal_by_id,
+                        get_companies_aggregate,
+                        get_customer_addons_details_aggregate,
+                        get_customer_edition_details_aggregate,
+                        get_edition_function_details_aggregate,
+                        get_mavim_databases_details_aggregate,
+                        get_users_mavim_manager_aggregate,
+                        get_license_customer_product_aggregate,
+                        get_portal_aggregate,
+                        get_mpm_customers_aggregate,
+                        get_combined_databases_aggregate,
+                        get_combined_users_aggregate,
+                        get_portal_monthly_users_report_aggregate,
+                        get_company_global_admin_aggregate,
+                        get_manager_user_login_details_aggregate,
+                        get_company_users, get_company_users_connection, get_company_users_aggregate,
+                        get_customer_license_editions, get_customer_license_editions_connection, get_customer_license_editions_aggregate,
+                        get_database_details, get_database_details_connection, get_database_details_aggregate
                          )
 
 
@@ -39,3 +79,50 @@ class Query:
     portal_monthly_users_report: typing.List[PortalMonthlyUserReportType] = strawberry.field(resolver=get_portal_monthly_users_report)
     global_admin: typing.List[CompanyGlobalAdminType] = strawberry.field(resolver=get_company_global_admin)
     manager_user_login_details: typing.List[ManagerUserLoginDetailsType] = strawberry.field(resolver=get_manager_user_login_details)
+
+    # Paged variants of the fields above, in primary key order
+    companies_connection: Connection[CompanyType] = strawberry.field(resolver=get_companies_connection)
+    customer_addons_details_connection: Connection[CustomerAddonDetailsType] = strawberry.field(resolver=get_customer_addons_details_connection)
+    customer_edition_details_connection: Connection[CustomerEditionDetailsType] = strawberry.field(resolver=get_customer_edition_details_connection)
+    edition_function_details_connection: Connection[EditionFunctionDetailsType] = strawberry.field(resolver=get_edition_function_details_connection)
+    mavim_databases_details_connection: Connection[MavimDatabaseType] = strawberry.field(resolver=get_mavim_databases_details_connection)
+    users_connection: Connection[UserMavimManagerLicenseType] = strawberry.field(resolver=get_users_mavim_manager_connection)
+    license_customer_product_connection: Connection[LicenseCustomerProductType] = strawberry.field(resolver=get_license_customer_product_connection)
+    portal_connection: Connection[PortalType] = strawberry.field(resolver=get_portal_connection)
+    mpm_customers_connection: Connection[MpmCustomerType] = strawberry.field(resolver=get_mpm_customers_connection)
+    combined_databases_connection: Connection[CombinedDatabasesType] = strawberry.field(resolver=get_combined_databases_connection)
+    combined_users_connection: Connection[CombinedUsersType] = strawberry.field(resolver=get_combined_users_connection)
+    portal_monthly_users_report_connection: Connection[PortalMonthlyUserReportType] = strawberry.field(resolver=get_portal_monthly_users_report_connection)
+    global_admin_connection: Connection[CompanyGlobalAdminType] = strawberry.field(resolver=get_company_global_admin_connection)
+    manager_user_login_details_connection: Connection[ManagerUserLoginDetailsType] = strawberry.field(resolver=get_manager_user_login_details_connection)
+
+    # Aggregates of the fields above, grouped and computed on the server
+    companies_aggregate: typing.List[CompanyAggregateRow] = strawberry.field(resolver=get_companies_aggregate)
+    customer_addons_details_aggregate: typing.List[CustomerAddonDetailsAggregateRow] = strawberry.field(resolver=get_customer_addons_details_aggregate)
+    customer_edition_details_aggregate: typing.List[CustomerEditionDetailsAggregateRow] = strawberry.field(resolver=get_customer_edition_details_aggregate)
+    edition_function_details_aggregate: typing.List[EditionFunctionDetailsAggregateRow] = strawberry.field(resolver=get_edition_function_details_aggregate)
+    mavim_databases_details_aggregate: typing.List[MavimDatabaseAggregateRow] = strawberry.field(resolver=get_mavim_databases_details_aggregate)
+    users_aggregate: typing.List[UserMavimManagerLicenseAggregateRow] = strawberry.field(resolver=get_users_mavim_manager_aggregate)
+    license_customer_product_aggregate: typing.List[LicenseCustomerProductAggregateRow] = strawberry.field(resolver=get_license_customer_product_aggregate)
+    portal_aggregate: typing.List[PortalAggregateRow] = strawberry.field(resolver=get_portal_aggregate)
+    mpm_customers_aggregate: typing.List[MpmCustomerAggregateRow] = strawberry.field(resolver=get_mpm_customers_aggregate)
+    combined_databases_aggregate: typing.List[CombinedDatabasesAggregateRow] = strawberry.field(resolver=get_combined_databases_aggregate)
+    combined_users_aggregate: typing.List[CombinedUsersAggregateRow] = strawberry.field(resolver=get_combined_users_aggregate)
+    portal_monthly_users_report_aggregate: typing.List[PortalMonthlyUserReportAggregateRow] = strawberry.field(resolver=get_portal_monthly_users_report_aggregate)
+    global_admin_aggregate: typing.List[CompanyGlobalAdminAggregateRow] = strawberry.field(resolver=get_company_global_admin_aggregate)
+    manager_user_login_details_aggregate: typing.List[ManagerUserLoginDetailsAggregateRow] = strawberry.field(resolver=get_manager_user_login_details_aggregate)
+
+    # Single rows by primary key, answered from the table's hash index
+    company: typing.Optional[CompanyType] = strawberry.field(resolver=get_company)
+    portal_by_id: typing.Optional[PortalType] = strawberry.field(resolver=get_portal_by_id)
+
+    # Materialized views over the tables above, configured under `views` in config.yaml
+    company_users: typing.List[CompanyUserType] = strawberry.field(resolver=get_company_users)
+    company_users_connection: Connection[CompanyUserType] = strawberry.field(resolver=get_company_users_connection)
+    company_users_aggregate: typing.List[CompanyUserAggregateRow] = strawberry.field(resolver=get_company_users_aggregate)
+    customer_license_editions: typing.List[CustomerLicenseEditionType] = strawberry.field(resolver=get_customer_license_editions)
+    customer_license_editions_connection: Connection[CustomerLicenseEditionType] = strawberry.field(resolver=get_customer_license_editions_connection)
+    customer_license_editions_aggregate: typing.List[CustomerLicenseEditionAggregateRow] = strawberry.field(resolver=get_customer_license_editions_aggregate)
+    database_details: typing.List[DatabaseDetailsType] = strawberry.field(resolver=get_database_details)
+    database_details_connection: Connection[DatabaseDetailsType] = strawberry.field(resolver=get_database_details_connection)
+    database_details_aggregate: typing.List[DatabaseDetailsAggregateRow] = strawberry.field(resolver=get_database_details_aggregate)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import strawberry
 from datetime import datetime
+from .extensions import DocumentCache
 from .query import Query
 from ..utils.datetime import DateTimeISO
 
@@ -7,7 +8,8 @@ schema = strawberry.Schema(
     query=Query,
     scalar_overrides={
         datetime: DateTimeISO
-    }
+    },
+    extensions=[DocumentCache]
 )
 
 __all__ = ["schema"]
\ No newline at end of file
@@ -0,0 +1,119 @@
+from typing import AbstractSet, Any, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+import polars as pl
+from strawberry.utils.str_converters import to_camel_case
+from gql.config import config
+from gql.types.aggregation import AggregateFunction, AggregateValue
+from gql.utils.datetime import parse_timestamps
+
+aggregation_settings: Dict[str, Any] = config.get('aggregation') or {}
+
+# (function, field, alias) of one requested aggregate, with the field and alias resolved
+AggregateSpec = Tuple[str, Optional[str], str]
+
+
+def aggregate_specs(aggregations: Optional[Sequence[Any]]) -> Tuple[AggregateSpec, ...]:
+    """
+    Resolve aggregation inputs into (function, field, alias) triples; a row count when none are given.
+
+    Raises:
+        ValueError: If a function other than COUNT has no field, or two aggregates share an alias
+    """
+    specs = []
+    for aggregation in aggregations or [None]:
+        function = aggregation.function.value if aggregation else AggregateFunction.COUNT.value
+        field = aggregation.field.value if aggregation and aggregation.field else None
+        if field is None and function != AggregateFunction.COUNT.value:
+            raise ValueError(f"{function.upper()} needs a field")
+        alias = aggregation.alias if aggregation and aggregation.alias else to_camel_case(
+            function if field is None else f"{function}_{field}"
+        )
+        specs.append((function, field, alias))
+    aliases = [alias for _, _, alias in specs]
+    if len(set(aliases)) != len(aliases):
+        raise ValueError(f"Duplicate aggregate alias in {aliases}")
+    return tuple(specs)
+
+
+def _instant_column(field: str) -> str:
+    return f"__instant_{field}"
+
+
+def _is_date_extreme(spec: AggregateSpec, date_fields: AbstractSet[str]) -> bool:
+    function, field, _ = spec
+    return function in ("min", "max") and field in date_fields
+
+
+def _expression(frame: pl.DataFrame, spec: AggregateSpec, date_fields: AbstractSet[str]) -> pl.Expr:
+    function, field, alias = spec
+    if field is None:
+        return pl.len().alias(alias)
+    column = pl.col(field)
+    if _is_date_extreme(spec, date_fields):
+        # Dates are strings in several layouts: take the stored value of the earliest or latest instant
+        instants = pl.col(_instant_column(field))
+        return column.sort_by(instants, descending=function == "max", nulls_last=True).first().alias(alias)
+    if function in ("sum", "avg") and not frame.schema[field].is_numeric():
+        raise ValueError(f"{function.upper()} needs a numeric field, {field} is {frame.schema[field]}")
+    if function == "count":
+        return column.count().alias(alias)
+    if function == "avg":
+        return column.mean().alias(alias)
+    return getattr(column, function)().alias(alias)
+
+
+def aggregate_frame(
+    frame: pl.DataFrame,
+    group_by: Sequence[str],
+    specs: Sequence[AggregateSpec],
+    date_fields: AbstractSet[str] = frozenset(),
+    row_type: Optional[Type[Any]] = None
+) -> List[Any]:
+    """
+    Aggregate a transformed table, one result row per group.
+
+    Args:
+        frame: Transformed table, already filtered
+        group_by: Fields to group by; no fields aggregates the whole table into one row
+        specs: Aggregates made by aggregate_specs
+        date_fields: Fields holding date strings, whose MIN and MAX compare the instants they denote
+        row_type: Row type made by gql.types.aggregation.aggregate_row to return the rows as
+
+    Returns:
+        List[Any]: Rows ordered by the group keys (nulls last): row_type instances, or
+            without a row type dicts keyed by the camelCase group field names and the aggregate aliases
+    """
+    if frame.is_empty():
+        # A table without rows may not have its columns; read them as empty numbers
+        missing = dict.fromkeys(field for _, field, _ in specs if field is not None and field not in frame.columns)
+        frame = frame.with_columns(pl.Series(field, [], dtype=pl.Float64) for field in missing)
+    dates = {spec[1] for spec in specs if _is_date_extreme(spec, date_fields)}
+    if dates:
+        frame = frame.with_columns(
+            pl.col(field)
+            .map_batches(parse_timestamps, return_dtype=pl.Datetime("us", "UTC"))
+            .alias(_instant_column(field))
+            for field in dates
+        )
+    expressions = [_expression(frame, spec, date_fields) for spec in specs]
+    if not group_by:
+        result = frame.select(expressions)
+    else:
+        result = frame.group_by(list(group_by)).agg(expressions).sort(list(group_by), nulls_last=True)
+    if row_type is None:
+        return result.rename({field: to_camel_case(field) for field in group_by}).to_dicts()
+    return [
+        row_type(
+            **{field: row[field] for field in group_by},
+            aggregates=[AggregateValue.of(spec[2], row[spec[2]], _is_date_extreme(spec, date_fields)) for spec in specs]
+        )
+        for row in result.iter_rows(named=True)
+    ]
+
+
+def cache_key(group_by: Sequence[str], specs: Sequence[AggregateSpec], where: Optional[Any]) -> Hashable:
+    """Key of an aggregation in the per-snapshot memo; where inputs are dataclasses with stable reprs."""
+    return tuple(group_by), tuple(specs), repr(where)
+
+
+def cache_size() -> int:
+    return int(aggregation_settings.get('cache_size', 256))
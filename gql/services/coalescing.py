@@ -0,0 +1,81 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+from gql.config import config
+from gql.utils.metrics import counter
+
+coalescing_settings: Dict[str, Any] = config.get('request_coalescing') or {}
+
+operations = counter(
+    "request_coalescing_operations",
+    "Keyed GraphQL operations by outcome: executed, or joined an identical one in flight"
+)
+
+T = TypeVar('T')
+
+
+@dataclass
+class _Flight(Generic[T]):
+    task: "asyncio.Future[T]"
+    finished_at: Optional[float] = None
+
+
+class RequestCoalescer:
+    """
+    Runs identical operations once while one of them is in flight.
+
+    The first caller of a key starts the execution; callers of the same key
+    that arrive before it finished, or at most window_seconds after, wait for
+    it and get the very same result. The execution runs to the end even if the
+    caller that started it goes away, as long as others wait for it.
+    """
+
+    def __init__(self, window_seconds: float = 0.0):
+        self.window_seconds = window_seconds
+        self._flights: Dict[Hashable, _Flight[Any]] = {}
+
+    async def run(self, key: Hashable, execute: Callable[[], Awaitable[T]]) -> T:
+        """
+        The result of execute for key, shared with every caller of key in flight.
+
+        Args:
+            key: Identity of the operation
+            execute: Runs the operation; called only when no result for key can be shared
+        """
+        flight = self._flights.get(key)
+        if flight is not None and self._is_shareable(flight):
+            operations.inc(outcome="joined")
+            return await asyncio.shield(flight.task)
+
+        operations.inc(outcome="executed")
+        flight = _Flight(asyncio.ensure_future(execute()))
+        self._flights[key] = flight
+        flight.task.add_done_callback(lambda _: self._finished(key, flight))
+        return await asyncio.shield(flight.task)
+
+    def _is_shareable(self, flight: _Flight[Any]) -> bool:
+        return flight.finished_at is None or time.monotonic() - flight.finished_at <= self.window_seconds
+
+    def _finished(self, key: Hashable, flight: _Flight[Any]) -> None:
+        flight.finished_at = time.monotonic()
+        if flight.task.cancelled() or flight.task.exception() is not None or self.window_seconds <= 0:
+            # Failures are not shared past the execution, so callers after it retry
+            self._forget(key, flight)
+        else:
+            asyncio.get_running_loop().call_later(self.window_seconds, self._forget, key, flight)
+
+    def _forget(self, key: Hashable, flight: _Flight[Any]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def in_flight(self) -> int:
+        """Number of keys with an execution running or still shareable."""
+        return len(self._flights)
+
+
+def default_request_coalescer() -> Optional[RequestCoalescer]:
+    """The coalescer configured under `request_coalescing` in config.yaml, None when disabled."""
+    if not coalescing_settings.get('enabled', True):
+        return None
+    return RequestCoalescer(window_seconds=float(coalescing_settings.get('window_seconds', 0)))
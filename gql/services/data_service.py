@@ -1,14 +1,93 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import count
 from pathlib import Path
-from typing import Dict, List, Optional, Type, TypeVar, Generic, Any, Callable, cast
+from typing import Dict, FrozenSet, Hashable, Iterator, List, Optional, Sequence, Type, TypeVar, Generic, Any, Callable, Union, cast
+import asyncio
+import threading
 import time
-from gql.utils.reader import read_csv_files_to_polars_df
+import polars as pl
+from azure.storage.blob.aio import ContainerClient as AsyncContainerClient
+from gql.config import get_table_config
+from gql.services.aggregation import aggregate_frame, aggregate_specs, cache_key, cache_size
+from gql.services.filters import compile_where
+from gql.services.indexes import HashIndex, IndexFields, index_fields
+from gql.services.pagination import KeyIndex, empty_page, paginate
+from gql.services.rows import LazyRows, is_lazy_entity_type, take
+from gql.types.aggregation import aggregate_row, date_fields
+from gql.types.pagination import Connection
+from gql.utils.reader import CsvPartCache, DEFAULT_MAX_CONCURRENCY, table_schema
 from gql.utils.logger import get_logger
+from gql.utils.metrics import counter
 from gql.utils.utility import check_file_path, normalize_path_for_spark
 
 logger = get_logger(__name__)
 
+coalesced_waiters = counter(
+    "data_service_coalesced_waiters",
+    "Callers that found a table refresh in flight and shared it instead of starting their own"
+)
+
 T = TypeVar('T')
 
+# Every DataService by table name, so the app can warm up and report on all tables
+_services: Dict[str, "DataService[Any]"] = {}
+
+# Data versions handed out to loaded snapshots, unique across tables
+_versions = count(1)
+
+# Table versions served in the current track_reads block, None for a table read at two versions
+_reads: ContextVar[Optional[Dict[str, Optional[int]]]] = ContextVar("data_service_reads", default=None)
+
+
+@contextmanager
+def track_reads() -> Iterator[Dict[str, Optional[int]]]:
+    """
+    Record the tables read inside the block, and the version of the data each served.
+
+    Reads by tasks started inside the block are recorded too. A table served at
+    two versions, because it was reloaded in between, is recorded as None.
+    """
+    reads: Dict[str, Optional[int]] = {}
+    token = _reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _reads.reset(token)
+
+
+def get_registered_services() -> Dict[str, "DataService[Any]"]:
+    """Return the DataService instances created so far, keyed by table name."""
+    return dict(_services)
+
+
+@dataclass(frozen=True)
+class _Snapshot(Generic[T]):
+    """
+    Cached entities together with the time they were last confirmed current.
+
+    data holds the entities in load order; for strawberry entity types it is a
+    LazyRows view of frame, so no entity is built before it is served.
+    frame is the transformed table the entities were built from, row for row;
+    filters are evaluated on it. lookups holds the hash indexes of the primary
+    key and the configured secondary indexes, built together with the data so a
+    lookup never mixes two refreshes. aggregates memoizes aggregation results for
+    this version of the data; it is carried over while storage does not change.
+    version identifies the loaded data the same way, 0 when nothing is loaded.
+    """
+    data: Sequence[T]
+    refreshed_at: float
+    loaded: bool = True
+    index: Optional[KeyIndex] = None
+    frame: Optional[pl.DataFrame] = None
+    lookups: Dict[IndexFields, HashIndex] = field(default_factory=dict)
+    aggregates: "OrderedDict[Hashable, List[Dict[str, Any]]]" = field(default_factory=OrderedDict)
+    version: int = 0
+
+
 class DataService(Generic[T]):
     """Service for loading and caching data from CSV files."""
     
@@ -17,7 +96,16 @@ class DataService(Generic[T]):
         path: str, 
         entity_type: Type[T],
         transform_func: Callable[[Dict[str, Any]], T],
-        cache_ttl_seconds: int = 300
+        cache_ttl_seconds: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        hard_ttl_seconds: Optional[int] = None,
+        background_refresh: Optional[bool] = None,
+        async_container_client: Optional[AsyncContainerClient] = None,
+        columns: Optional[Dict[str, str]] = None,
+        frame_transform: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None,
+        primary_key: Optional[List[str]] = None,
+        indexes: Optional[List[Union[str, List[str]]]] = None,
+        table_name: Optional[str] = None
     ):
         """
         Initialize the data service.
@@ -26,54 +114,460 @@ class DataService(Generic[T]):
             path: Path to the CSV files
             entity_type: The type of entity this service provides
             transform_func: Function to transform raw data to entity type
-            cache_ttl_seconds: How long to cache data before refreshing (in seconds)
+            cache_ttl_seconds: Soft TTL, after which data is refreshed (in seconds)
+            max_concurrency: Maximum parallel part file downloads; defaults to the table's config
+            hard_ttl_seconds: Age after which stale data is no longer served while refreshing
+            background_refresh: Refresh expired data in the background instead of in the request
+            async_container_client: Blob container to read from; defaults to the shared storage client
+            columns: CSV columns to read mapped to their Polars dtype; defaults to the table's configured columns
+            frame_transform: Vectorized transform_func producing one column per entity field;
+                when given it is used instead of calling transform_func for every row
+            primary_key: Entity fields identifying a row, used to order pages; defaults to the
+                table's configured primary key
+            indexes: Fields (or lists of fields) to keep hash indexes on for get_by_index_async;
+                defaults to the table's configured indexes
+            table_name: Key of the table under `tables` in config.yaml, which names it everywhere
+                else (settings, registration, readiness); defaults to the last folder of path
         """
         self.path = normalize_path_for_spark(path)
+        self.table_name = table_name or self.path.split('/')[-1]
+        table_config = get_table_config(self.table_name)
+        self.max_concurrency = max_concurrency or int(table_config.get('max_concurrency', DEFAULT_MAX_CONCURRENCY))
+        self.async_container_client = async_container_client
         self.entity_type = entity_type
         self.transform_func = transform_func
-        self.cache_ttl_seconds = cache_ttl_seconds
-        self._cache: Optional[List[T]] = None
-        self._last_refresh: Optional[float] = None
+        self.frame_transform = frame_transform
+        # 0 is a valid TTL (refresh on every request), only None falls back to the config
+        self.cache_ttl_seconds = (
+            cache_ttl_seconds if cache_ttl_seconds is not None
+            else int(table_config.get('soft_ttl_seconds', 300))
+        )
+        self.hard_ttl_seconds = (
+            hard_ttl_seconds if hard_ttl_seconds is not None
+            else int(table_config.get('hard_ttl_seconds', 3600))
+        )
+        self.background_refresh = (
+            background_refresh if background_refresh is not None
+            else bool(table_config.get('background_refresh', True))
+        )
+        self._snapshot: Optional[_Snapshot[T]] = None
+        self._last_attempt: Optional[float] = None
+        self._last_refresh_duration: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        self.columns: Optional[Dict[str, str]] = columns or table_config.get('columns')
+        self.primary_key: Optional[List[str]] = primary_key or table_config.get('primary_key')
+        self.indexes: List[IndexFields] = [
+            index_fields(entry)
+            for entry in (indexes if indexes is not None else table_config.get('indexes') or [])
+        ]
+        self._parts = CsvPartCache(self.path, max_concurrency=self.max_concurrency, columns=self.columns)
+        # Aggregates of strawberry types are returned as their typed rows
+        self._aggregate_row: Optional[Type[Any]] = None
+        self._date_fields: FrozenSet[str] = frozenset()
+        if is_lazy_entity_type(entity_type):
+            self._aggregate_row = aggregate_row(entity_type)
+            self._date_fields = date_fields(entity_type)
+        _services[self.table_name] = self
+
+    @property
+    def data_age_seconds(self) -> Optional[float]:
+        """Seconds since the served data was last confirmed current, None if never loaded."""
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.loaded:
+            return None
+        return time.time() - snapshot.refreshed_at
+
+    def _is_expired(self, current_time: float) -> bool:
+        """Whether the soft TTL passed since the last refresh attempt (or nothing is loaded)."""
+        return (self._snapshot is None or
+                self._last_attempt is None or
+                current_time - self._last_attempt > self.cache_ttl_seconds)
+
+    def _is_servable(self, snapshot: Optional[_Snapshot[T]], current_time: float) -> bool:
+        """Whether a snapshot may still be served while it is being refreshed."""
+        return snapshot is not None and current_time - snapshot.refreshed_at <= self.hard_ttl_seconds
     
-    def get_data(self) -> List[T]:
-        """Get data, using cache if available and not expired."""
+    async def get_data_async(self, where: Optional[Any] = None) -> Sequence[T]:
+        """
+        Get data, using cache if available and not expired.
+
+        Past the soft TTL the cached data keeps being served while a background
+        refresh runs; past the hard TTL (or without any data) the caller refreshes.
+        Refreshes download through the async blob client and transform in a
+        worker thread, so they never block the event loop; concurrent callers
+        share the single in-flight refresh.
+
+        Args:
+            where: Filter input of the entity type; only matching rows are returned
+        """
+        return self._select(await self._current_snapshot_async(), where)
+
+    async def get_frame_async(self, where: Optional[Any] = None) -> Optional[pl.DataFrame]:
+        """
+        The rows get_data_async returns, as the transformed frame they are served from.
+
+        Args:
+            where: Filter input of the entity type; only matching rows are returned
+
+        Returns:
+            Optional[pl.DataFrame]: The rows in get_data_async order, None when there are none
+
+        Raises:
+            ValueError: If the table has no frame transform, so its rows are no frame
+        """
+        return self._select_frame(await self._current_snapshot_async(), where)
+
+    async def data_version_async(self) -> int:
+        """
+        Version of the data get_data_async serves, refreshed first as it would be.
+
+        Every load of new data gets a new version; 0 means nothing is loaded.
+        """
+        snapshot = await self._current_snapshot_async()
+        return snapshot.version if snapshot else 0
+
+    async def get_page_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        where: Optional[Any] = None
+    ) -> Connection[T]:
+        """
+        Get one page of the data in primary key order.
+
+        Args:
+            first: Maximum number of rows, defaults to the configured page size
+            after: Cursor of the row to continue after
+            where: Filter input of the entity type; pages and totalCount cover matching rows only
+
+        Returns:
+            Connection[T]: The page, its cursors and the total row count
+
+        Raises:
+            ValueError: If the cursor is invalid or the table has no primary key
+        """
+        return self._page(await self._current_snapshot_async(), first, after, where)
+
+    async def get_by_key_async(self, key: Sequence[Any]) -> Optional[T]:
+        """
+        Get the row with a primary key through the primary key's hash index.
+
+        Args:
+            key: Values of the primary key fields, in configured order
+
+        Returns:
+            Optional[T]: The row, None if there is none
+
+        Raises:
+            ValueError: If the table has no primary key
+        """
+        return self._by_key(await self._current_snapshot_async(), key)
+
+    async def get_by_index_async(self, fields: Sequence[str], key: Sequence[Any]) -> List[T]:
+        """
+        Get the rows whose fields hold a key through a configured index.
+
+        Args:
+            fields: Fields of the index, as declared in the table's indexes
+            key: Values of those fields
+
+        Returns:
+            List[T]: Matching rows in load order
+
+        Raises:
+            ValueError: If no index is configured on these fields
+        """
+        return self._by_index(await self._current_snapshot_async(), index_fields(fields), key)
+
+    async def get_many_by_index_async(self, fields: Sequence[str], keys: Sequence[Sequence[Any]]) -> List[List[T]]:
+        """
+        Batched get_by_index_async: the rows of every key, all looked up in the same snapshot.
+
+        Raises:
+            ValueError: If no index is configured on these fields
+        """
+        snapshot = await self._current_snapshot_async()
+        return [self._by_index(snapshot, index_fields(fields), key) for key in keys]
+
+    async def aggregate_async(
+        self,
+        group_by: Optional[Sequence[Any]] = None,
+        aggregations: Optional[Sequence[Any]] = None,
+        where: Optional[Any] = None
+    ) -> List[Any]:
+        """
+        Aggregate the cached table per group with a Polars group-by.
+
+        Results are memoized per version of the data, so repeated aggregations
+        only cost a lookup until the table changes in storage. MIN and MAX of a
+        date field compare the instants the dates denote, not their text.
+
+        Args:
+            group_by: Field enum members (or field names) to group by; none gives one row
+            aggregations: Aggregation inputs of the entity type; defaults to a row count
+            where: Filter input of the entity type, applied before grouping
+
+        Returns:
+            List[Any]: One row per group with its keys and aggregates, as the entity type's
+                aggregate row type (see gql.types.aggregation.aggregate_row) when it is a strawberry
+                type and as dicts otherwise
+
+        Raises:
+            ValueError: If an aggregation is invalid for its field
+        """
+        return self._aggregate(await self._current_snapshot_async(), group_by, aggregations, where)
+
+    def _aggregate(
+        self,
+        snapshot: Optional[_Snapshot[T]],
+        group_by: Optional[Sequence[Any]],
+        aggregations: Optional[Sequence[Any]],
+        where: Optional[Any]
+    ) -> List[Any]:
+        fields = [getattr(field, "value", field) for field in group_by or []]
+        specs = aggregate_specs(aggregations)
+        aggregate = partial(
+            aggregate_frame, group_by=fields, specs=specs, date_fields=self._date_fields, row_type=self._aggregate_row
+        )
+        if snapshot is None or snapshot.frame is None:
+            # Nothing loaded, or an empty table: no groups, but the whole table is one row
+            return [] if fields else aggregate(self._empty_frame())
+        key = cache_key(fields, specs, where)
+        rows = snapshot.aggregates.get(key)
+        if rows is not None:
+            snapshot.aggregates.move_to_end(key)
+            return rows
+        mask = self._matches(snapshot, where)
+        frame = snapshot.frame if mask is None else snapshot.frame.filter(mask)
+        rows = aggregate(frame)
+        snapshot.aggregates[key] = rows
+        if len(snapshot.aggregates) > cache_size():
+            # Evict the least recently used result
+            snapshot.aggregates.popitem(last=False)
+        return rows
+
+    def _empty_frame(self) -> pl.DataFrame:
+        """The transformed frame of a table without rows, with its columns when they are configured."""
+        if self.frame_transform is None or not self.columns:
+            return pl.DataFrame()
+        return self.frame_transform(pl.DataFrame(schema=table_schema(self.columns)))
+
+    def _by_key(self, snapshot: Optional[_Snapshot[T]], key: Sequence[Any]) -> Optional[T]:
+        if not self.primary_key:
+            raise ValueError(f"No primary key configured for {self.table_name}")
+        rows = self._by_index(snapshot, tuple(self.primary_key), key)
+        return rows[0] if rows else None
+
+    def _by_index(self, snapshot: Optional[_Snapshot[T]], fields: IndexFields, key: Sequence[Any]) -> List[T]:
+        if fields not in self._index_fields():
+            raise ValueError(f"No index on {', '.join(fields)} configured for {self.table_name}")
+        if snapshot is None or fields not in snapshot.lookups:
+            # Nothing loaded, or an empty table
+            return []
+        return take(snapshot.data, snapshot.lookups[fields].lookup(key))
+
+    def _index_fields(self) -> List[IndexFields]:
+        """The primary key followed by the secondary indexes, each once."""
+        fields = [tuple(self.primary_key)] if self.primary_key else []
+        return list(dict.fromkeys(fields + self.indexes))
+
+    async def current_frame_async(self) -> Optional[pl.DataFrame]:
+        """
+        The transformed table behind the served data, refreshed first when it expired.
+
+        A reload replaces the frame object while an unchanged refresh keeps it, so
+        its identity tells whether the data changed. None when nothing is loaded.
+        """
+        snapshot = await self._current_snapshot_async()
+        return snapshot.frame if snapshot else None
+
+    def _select(self, snapshot: Optional[_Snapshot[T]], where: Optional[Any]) -> Sequence[T]:
+        if snapshot is None:
+            return []
+        mask = self._matches(snapshot, where)
+        if mask is None:
+            return snapshot.data
+        return take(snapshot.data, mask.arg_true().to_list())
+
+    def _select_frame(self, snapshot: Optional[_Snapshot[T]], where: Optional[Any]) -> Optional[pl.DataFrame]:
+        if self.frame_transform is None:
+            raise ValueError(f"{self.table_name} is not served from a transformed frame")
+        if snapshot is None or snapshot.frame is None:
+            return None
+        mask = self._matches(snapshot, where)
+        return snapshot.frame if mask is None else snapshot.frame.filter(mask)
+
+    def _page(
+        self,
+        snapshot: Optional[_Snapshot[T]],
+        first: Optional[int],
+        after: Optional[str],
+        where: Optional[Any]
+    ) -> Connection[T]:
+        if not self.primary_key:
+            raise ValueError(f"No primary key configured for {self.table_name}")
+        if snapshot is None or snapshot.index is None:
+            # Nothing loaded, or an empty table
+            return empty_page()
+        mask = self._matches(snapshot, where)
+        index = snapshot.index if mask is None else snapshot.index.filter(mask)
+        return paginate(snapshot.data, index, first, after)
+
+    def _matches(self, snapshot: _Snapshot[T], where: Optional[Any]) -> Optional[pl.Series]:
+        """Row mask of the filter over the snapshot's table, None when nothing is filtered."""
+        predicate = compile_where(where) if where is not None else None
+        if predicate is None:
+            return None
+        if snapshot.frame is None:
+            return pl.Series(values=[False] * len(snapshot.data), dtype=pl.Boolean)
+        return snapshot.frame.select(predicate).to_series()
+
+    async def _current_snapshot_async(self) -> Optional[_Snapshot[T]]:
+        """The snapshot to serve, refreshing it first when it expired."""
         current_time = time.time()
-        
-        # If cache is empty or expired, refresh it
-        if (self._cache is None or 
-            self._last_refresh is None or 
-            current_time - self._last_refresh > self.cache_ttl_seconds):
-            self._refresh_cache()
-            
-        return self._cache or []
-    
-    def _refresh_cache(self) -> None:
-        """Refresh the data cache."""
+        snapshot = self._snapshot
+
+        if self._is_expired(current_time):
+            servable = self._is_servable(snapshot, current_time)
+            task = self._start_async_refresh()
+            if task is None:
+                coalesced_waiters.inc(table=self.table_name, outcome="stale" if servable else "waited")
+                if not servable:
+                    await self._wait_for_refresh()
+            elif self.background_refresh and servable:
+                logger.info(f"Refreshing {self.table_name} in the background, serving data aged {self.data_age_seconds}s")
+            else:
+                await asyncio.shield(task)
+            snapshot = self._snapshot
+
+        self._record_read(snapshot)
+        return snapshot
+
+    def _record_read(self, snapshot: Optional[_Snapshot[T]]) -> None:
+        reads = _reads.get()
+        if reads is not None:
+            version = snapshot.version if snapshot else 0
+            reads[self.table_name] = version if reads.get(self.table_name, version) == version else None
+
+    def _start_async_refresh(self) -> Optional["asyncio.Task[None]"]:
+        """Start a refresh task on the running loop, or return None if a refresh is already in flight."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return None
+
+        def done(_: "asyncio.Task[None]") -> None:
+            self._refresh_task = None
+            self._refresh_lock.release()
+
+        task = asyncio.get_running_loop().create_task(self._refresh_cache_async())
+        task.add_done_callback(done)
+        self._refresh_task = task
+        return task
+
+    async def _wait_for_refresh(self) -> None:
+        """
+        Wait for the in-flight refresh, whether it runs as a task on this loop or on another one.
+
+        A task of another thread's loop cannot be awaited here, so its release of
+        the refresh lock is waited for in a worker thread instead.
+        """
+        task = self._refresh_task
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            await asyncio.shield(task)
+        else:
+            await asyncio.to_thread(self._join_refresh)
+
+    def _join_refresh(self) -> None:
+        with self._refresh_lock:
+            pass
+
+    async def _refresh_cache_async(self) -> None:
+        """Refresh the data cache and swap in the new snapshot; the transform runs in a worker thread."""
+        self._last_attempt = time.time()
+        start = time.perf_counter()
         try:
-            if not check_file_path(self.path):
-                logger.error(f"Path not found: {self.path}")
-                self._cache = []
-                self._last_refresh = time.time()
-                return
-                
-            logger.info(f"Reading CSV files from path: {self.path}")
-            df = read_csv_files_to_polars_df(self.path)
-            self._cache = []
-            for row in df.iter_rows(named=True):
-                self._cache.append(self.transform_func(cast(Dict[str, Any], row)))
-            
-            # records = df.to_dict(orient='records')
-            # self._cache = [self.transform_func(cast(Dict[str, Any], row)) for row in records]
-            self._last_refresh = time.time()
-            logger.info(f"Loaded {len(self._cache)} records for {self.entity_type.__name__}")      
+            df = await self._read_frame_async()
+            await asyncio.to_thread(self._load_frame, df)
+            self._last_error = None
         except Exception as e:
-            logger.error(f"Error refreshing {self.entity_type.__name__} data: {str(e)}")
-            # Don't clear cache on error - keep old data if we have it
-            if self._cache is None:
-                self._cache = []
-            self._last_refresh = time.time()
+            self._handle_refresh_error(e)
+        finally:
+            self._last_refresh_duration = time.perf_counter() - start
+
+    async def _read_frame_async(self) -> Optional[pl.DataFrame]:
+        """Read the table from storage; None when it did not change since the last read."""
+        if not check_file_path(self.table_name):
+            raise FileNotFoundError(f"Path not found: {self.path}")
+
+        logger.info(f"Reading CSV files from path: {self.path}")
+        return await self._parts.refresh_async(self.async_container_client)
+
+    def _load_frame(self, df: Optional[pl.DataFrame]) -> None:
+        """Transform a freshly read table into entities; None means storage did not change."""
+        if df is None and self._snapshot is not None and self._snapshot.loaded:
+            # Nothing changed in storage, the cached entities are still current
+            self._snapshot = replace(self._snapshot, refreshed_at=time.time())
+            return
+        if df is None:
+            df = pl.DataFrame()
+        frame = df
+        data: Sequence[T]
+        if self.frame_transform is not None:
+            frame = self.frame_transform(df) if df.height else pl.DataFrame()
+            if is_lazy_entity_type(self.entity_type):
+                # The table stays columnar; entities are row views created when served
+                data = LazyRows(frame, self.entity_type) if frame.height else []
+            else:
+                # Only the final entities are built in Python, from fully transformed rows
+                data = [self.entity_type(**row) for row in frame.iter_rows(named=True)]
+        else:
+            data = []
+            for row in df.iter_rows(named=True):
+                data.append(self.transform_func(cast(Dict[str, Any], row)))
+        
+        # records = df.to_dict(orient='records')
+        # self._cache = [self.transform_func(cast(Dict[str, Any], row)) for row in records]
+        index = KeyIndex.build(frame, self.primary_key) if self.primary_key and frame.height else None
+        lookups = {fields: HashIndex.build(frame, fields) for fields in self._index_fields()} if frame.height else {}
+        self._snapshot = _Snapshot(
+            data, time.time(), index=index, frame=frame if frame.height else None, lookups=lookups,
+            version=next(_versions)
+        )
+        logger.info(f"Loaded {len(data)} records for {self.entity_type.__name__}")      
+
+    def _handle_refresh_error(self, e: Exception) -> None:
+        logger.error(f"Error refreshing {self.entity_type.__name__} data: {str(e)}")
+        self._last_error = f"{type(e).__name__}: {e}"
+        # Rebuild from the cached parts next time even if storage did not change
+        self._parts.invalidate()
+        # Don't clear cache on error - keep old data if we have it
+        if self._snapshot is None:
+            self._snapshot = _Snapshot([], time.time(), loaded=False)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Health of the cached table, as reported by the readiness endpoint.
+
+        A table is warm when it has loaded data that is not older than the hard TTL.
+        """
+        snapshot = self._snapshot
+        loaded = snapshot is not None and snapshot.loaded
+        age = self.data_age_seconds
+        return {
+            "loaded": loaded,
+            "warm": loaded and age is not None and age <= self.hard_ttl_seconds,
+            "row_count": len(snapshot.data) if snapshot else 0,
+            "data_age_seconds": round(age, 3) if age is not None else None,
+            "last_refresh_duration_seconds": (
+                round(self._last_refresh_duration, 3) if self._last_refresh_duration is not None else None
+            ),
+            "last_error": self._last_error,
+            "refreshing": self._refresh_lock.locked(),
+        }
 
     def clear_cache(self) -> None:
         """Force clear the cache."""
-        self._cache = None
-        self._last_refresh = None
\ No newline at end of file
+        self._snapshot = None
+        self._last_attempt = None
+        self._parts.clear()
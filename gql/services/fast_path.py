@@ -0,0 +1,238 @@
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+import polars as pl
+from graphql import (
+    FieldNode, GraphQLError, GraphQLList, GraphQLNonNull, GraphQLObjectType, GraphQLScalarType,
+    OperationDefinitionNode, OperationType, is_required_argument, parse
+)
+from gql.services.data_service import get_registered_services
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Distinct query documents whose plan is remembered
+PLAN_CACHE_SIZE = 1024
+# Int values GraphQL can represent; anything else is an error the normal execution reports
+_INT_RANGE = (-2**31, 2**31 - 1)
+# String values json.dumps writes as they are between quotes
+_ESCAPED = r'[^ -~]|["\\]'
+
+
+@dataclass(frozen=True)
+class FlatField:
+    """A scalar field of a flat selection: its response key, column and GraphQL scalar."""
+    key: str
+    column: str
+    scalar: str
+    nullable: bool
+
+
+@dataclass(frozen=True)
+class FlatQuery:
+    """A query selecting scalar fields of every row of one table."""
+    key: str
+    table: str
+    fields: Tuple[FlatField, ...]
+
+
+def _list_item_type(field_type: Any) -> Optional[GraphQLObjectType]:
+    """The object type of a [Type!]! field, None for any other type."""
+    if not isinstance(field_type, GraphQLNonNull) or not isinstance(field_type.of_type, GraphQLList):
+        return None
+    item = field_type.of_type.of_type
+    if not isinstance(item, GraphQLNonNull) or not isinstance(item.of_type, GraphQLObjectType):
+        return None
+    return item.of_type
+
+
+def _table_of(object_type: GraphQLObjectType) -> Optional[str]:
+    """The one registered table whose entities are of object_type."""
+    entity_type = object_type.extensions["strawberry-definition"].origin
+    tables = [
+        table for table, service in get_registered_services().items()
+        if service.entity_type is entity_type and service.frame_transform is not None
+    ]
+    return tables[0] if len(tables) == 1 else None
+
+
+def _is_plain(node: FieldNode) -> bool:
+    return not node.arguments and not node.directives
+
+
+def _flat_field(object_type: GraphQLObjectType, node: Any) -> Optional[FlatField]:
+    if not isinstance(node, FieldNode) or not _is_plain(node) or node.selection_set is not None:
+        return None
+    field = object_type.fields.get(node.name.value)
+    if field is None or field.extensions["strawberry-definition"].base_resolver is not None:
+        # Unknown, __typename or a resolved field such as a relationship
+        return None
+    nullable = not isinstance(field.type, GraphQLNonNull)
+    scalar = field.type if nullable else field.type.of_type
+    if not isinstance(scalar, GraphQLScalarType) or scalar.name not in _WRITERS:
+        return None
+    return FlatField(
+        key=(node.alias or node.name).value,
+        column=field.extensions["strawberry-definition"].python_name,
+        scalar=scalar.name,
+        nullable=nullable,
+    )
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def plan_flat_query(schema: Any, query: str, operation_name: Optional[str] = None) -> Optional[FlatQuery]:
+    """
+    Recognize a query the fast path can answer: `{ table { scalar fields } }`.
+
+    The query must select one list field of a table type without arguments and,
+    under it, stored scalar fields of the rows only, each response key once.
+    Fragments, directives and variables are left to normal execution. Such a
+    query is valid whenever it is recognized.
+
+    Args:
+        schema: The strawberry schema the query is run against
+        query: The query document
+        operation_name: Operation to run, for documents naming one
+
+    Returns:
+        Optional[FlatQuery]: The plan, None when the query needs normal execution
+    """
+    try:
+        document = parse(query, no_location=True)
+    except GraphQLError:
+        return None
+    if len(document.definitions) != 1:
+        return None
+    operation = document.definitions[0]
+    if (
+        not isinstance(operation, OperationDefinitionNode)
+        or operation.operation != OperationType.QUERY
+        or operation.variable_definitions
+        or operation.directives
+        or (operation_name is not None and (operation.name is None or operation.name.value != operation_name))
+        or len(operation.selection_set.selections) != 1
+    ):
+        return None
+    root = operation.selection_set.selections[0]
+    if not isinstance(root, FieldNode) or not _is_plain(root) or root.selection_set is None:
+        return None
+    field = schema._schema.query_type.fields.get(root.name.value)
+    object_type = _list_item_type(field.type) if field is not None else None
+    if object_type is None or any(is_required_argument(argument) for argument in field.args.values()):
+        return None
+    table = _table_of(object_type)
+    fields = tuple(_flat_field(object_type, node) for node in root.selection_set.selections)
+    if table is None or not all(fields) or len({field.key for field in fields}) != len(fields):
+        return None
+    return FlatQuery(key=(root.alias or root.name).value, table=table, fields=fields)
+
+
+def _strings(values: pl.Series) -> Optional[pl.Expr]:
+    if values.dtype != pl.String:
+        return None
+    # Quoted as they are, unless json.dumps would escape something
+    escaped = values.filter(values.str.contains(_ESCAPED)).unique().drop_nulls()
+    quoted = pl.concat_str([pl.lit('"'), pl.col(values.name), pl.lit('"')])
+    if not escaped.len():
+        return quoted
+    encoded = {value: json.dumps(value) for value in escaped}
+    return (
+        pl.when(pl.col(values.name).str.contains(_ESCAPED))
+        .then(pl.col(values.name).replace_strict(encoded, default=None, return_dtype=pl.String))
+        .otherwise(quoted)
+    )
+
+
+def _ints(values: pl.Series) -> Optional[pl.Expr]:
+    if not values.dtype.is_integer():
+        return None
+    if values.len() > values.null_count() and not (_INT_RANGE[0] <= values.min() and values.max() <= _INT_RANGE[1]):  # type: ignore[operator]
+        return None
+    return pl.col(values.name).cast(pl.String)
+
+
+def _floats(values: pl.Series) -> Optional[pl.Expr]:
+    if not values.dtype.is_numeric():
+        return None
+    floats = values.cast(pl.Float64)
+    if not floats.drop_nulls().is_finite().all():
+        return None
+    # json.dumps writes float reprs, which Polars' float formatting is not
+    return pl.lit(pl.Series(values.name, [None if value is None else repr(value) for value in floats], dtype=pl.String))
+
+
+def _booleans(values: pl.Series) -> Optional[pl.Expr]:
+    if values.dtype != pl.Boolean:
+        return None
+    return pl.when(pl.col(values.name)).then(pl.lit("true")).when(~pl.col(values.name)).then(pl.lit("false"))
+
+
+_WRITERS: Dict[str, Callable[[pl.Series], Optional[pl.Expr]]] = {
+    "Int": _ints,
+    "Float": _floats,
+    "Boolean": _booleans,
+    "String": _strings,
+    "ID": _strings,
+    # Stored normalized, DateTimeISO serializes strings as they are
+    "DateTimeISO": _strings,
+}
+
+
+def _values(frame: pl.DataFrame, field: FlatField) -> Optional[pl.Expr]:
+    """JSON of a field's values as json.dumps writes what GraphQL serializes; None if that needs GraphQL."""
+    if field.column not in frame.columns:
+        return None
+    values = frame.get_column(field.column)
+    if values.null_count() and not field.nullable:
+        # A null non-null field is an error the normal execution reports
+        return None
+    if values.dtype == pl.Null:
+        return pl.lit("null")
+    expression = _WRITERS[field.scalar](values)
+    return expression.fill_null(pl.lit("null")) if expression is not None else None
+
+
+def write_rows(frame: Optional[pl.DataFrame], fields: Tuple[FlatField, ...]) -> Optional[str]:
+    """
+    Write the JSON objects of a flat selection over every row of a frame.
+
+    The output is what json.dumps writes for the rows GraphQL would return, e.g.
+    `{"customerId": 1, "customerName": "a"}, {...}`, built column by column.
+
+    Returns:
+        Optional[str]: The rows separated by ", ", None when a value needs normal execution
+    """
+    if frame is None or not frame.height:
+        return ""
+    values = [_values(frame, field) for field in fields]
+    if any(expression is None for expression in values):
+        return None
+    parts = []
+    for position, (field, expression) in enumerate(zip(fields, values)):
+        parts += [pl.lit(("{" if position == 0 else ", ") + json.dumps(field.key) + ": "), expression]
+    row = pl.concat_str(parts + [pl.lit("}")])
+    return frame.select(row.str.join(", ")).item()
+
+
+async def execute_flat_query(query: FlatQuery) -> Optional[str]:
+    """
+    The JSON response to a flat query, written straight from the table's cached frame.
+
+    Returns:
+        Optional[str]: `{"data": ...}` as json.dumps writes the normal execution's
+            result, None when the query needs normal execution after all
+    """
+    service = get_registered_services().get(query.table)
+    if service is None:
+        return None
+    try:
+        frame = await service.get_frame_async()
+    except Exception as e:
+        # Normal execution reports it as a GraphQL error
+        logger.debug(f"Flat query on {query.table} falls back: {e}")
+        return None
+    rows = write_rows(frame, query.fields)
+    if rows is None:
+        return None
+    return f'{{"data": {{{json.dumps(query.key)}: [{rows}]}}}}'
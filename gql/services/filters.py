@@ -0,0 +1,71 @@
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+import polars as pl
+from gql.types.filters import DateTimeFilter
+from gql.utils.datetime import parse_timestamps, to_utc_timestamp
+
+# Comparison operators shared by the filter inputs, applied as `column <op> value`
+_COMPARISONS = {
+    "eq": lambda column, value: column == value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+}
+
+
+def _instant(value: str) -> datetime:
+    instant = to_utc_timestamp(value)
+    if instant is None:
+        raise ValueError(f"Invalid date in filter: {value!r}")
+    return instant
+
+
+def _field_conditions(name: str, condition: Any) -> List[pl.Expr]:
+    """Expressions for the conditions set on one field's filter."""
+    column = pl.col(name)
+    convert: Callable[[Any], Any] = lambda value: value
+    if isinstance(condition, DateTimeFilter):
+        # Dates are stored as strings in several layouts, compare the instants they denote
+        column = column.map_batches(parse_timestamps, return_dtype=pl.Datetime("us", "UTC"))
+        convert = _instant
+
+    expressions = [
+        compare(column, convert(getattr(condition, op)))
+        for op, compare in _COMPARISONS.items()
+        if getattr(condition, op, None) is not None
+    ]
+    if getattr(condition, "in_", None) is not None:
+        expressions.append(column.is_in([convert(value) for value in condition.in_]))
+    if getattr(condition, "starts_with", None) is not None:
+        expressions.append(column.str.starts_with(condition.starts_with))
+    if condition.is_null is not None:
+        expressions.append(column.is_null() if condition.is_null else column.is_not_null())
+    return expressions
+
+
+def compile_where(where: Any) -> Optional[pl.Expr]:
+    """
+    Compile a `where` input into one Polars predicate over the transformed table.
+
+    Args:
+        where: Instance of an input built by gql.types.filters.where_input
+
+    Returns:
+        Optional[pl.Expr]: Predicate that holds where every given condition holds,
+            or None when no condition is set
+
+    Raises:
+        ValueError: If a date condition is not a valid date
+    """
+    expressions = [
+        expression
+        for field in fields(where)
+        if getattr(where, field.name) is not None
+        for expression in _field_conditions(field.name, getattr(where, field.name))
+    ]
+    if not expressions:
+        return None
+    # Rows where a condition is null (a null column value) do not match
+    return pl.all_horizontal(expressions).fill_null(False)
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple, Union
+import polars as pl
+
+IndexFields = Tuple[str, ...]
+
+# Row position column added while grouping; not an entity field
+_POSITION = "__position"
+
+
+def index_fields(entry: Union[str, Sequence[str]]) -> IndexFields:
+    """Fields of an index as declared in config.yaml: one field name or a list of them."""
+    return (entry,) if isinstance(entry, str) else tuple(entry)
+
+
+@dataclass(frozen=True)
+class HashIndex:
+    """
+    Rows of a cached table by the values of some of their fields.
+
+    postings maps each key, the tuple of the index fields' values, to the
+    positions of its rows in the cached entity list in load order. Rows with a
+    null in the key are left out, as null never equals a looked up value.
+    """
+    fields: IndexFields
+    postings: Dict[Tuple[Any, ...], List[int]]
+
+    @classmethod
+    def build(cls, frame: pl.DataFrame, fields: Sequence[str]) -> "HashIndex":
+        """Group a transformed table's row positions by the index fields."""
+        grouped = (
+            frame.select(fields)
+            .with_row_index(_POSITION)
+            .drop_nulls(fields)
+            .group_by(fields, maintain_order=True)
+            .agg(pl.col(_POSITION))
+        )
+        keys = grouped.select(fields).rows()
+        return cls(tuple(fields), dict(zip(keys, grouped[_POSITION].to_list())))
+
+    def lookup(self, key: Sequence[Any]) -> List[int]:
+        """Positions of the rows whose index fields hold key, in load order."""
+        return self.postings.get(tuple(key), [])
@@ -0,0 +1,79 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+from strawberry.dataloader import DataLoader
+from strawberry.types import Info
+# Imported as a module: the entity types use these loaders and data_service imports the types
+from gql.services import data_service
+from gql.services.indexes import IndexFields, index_fields
+
+if TYPE_CHECKING:
+    from gql.services.data_service import DataService
+
+
+class Loaders:
+    """
+    DataLoaders of one request, one per table index, created on first use.
+
+    Every key a relationship field asks for while a level of the query resolves
+    is collected and looked up in one batch against the table's hash index.
+    """
+
+    def __init__(self) -> None:
+        self._loaders: Dict[Tuple[str, IndexFields], DataLoader[Tuple[Any, ...], List[Any]]] = {}
+
+    def get(self, table: str, fields: IndexFields) -> DataLoader[Tuple[Any, ...], List[Any]]:
+        """The loader of the rows of a table by the values of indexed fields."""
+        if (table, fields) not in self._loaders:
+            service = _service(table)
+
+            async def load(keys: List[Tuple[Any, ...]]) -> List[List[Any]]:
+                return await service.get_many_by_index_async(fields, keys)
+
+            self._loaders[(table, fields)] = DataLoader(load_fn=load)
+        return self._loaders[(table, fields)]
+
+
+def _service(table: str) -> "DataService[Any]":
+    service = data_service.get_registered_services().get(table)
+    if service is None:
+        raise ValueError(f"No DataService registered for table {table}")
+    return service
+
+
+def request_loaders(info: Info) -> Loaders:
+    """
+    The loaders of the request being resolved, kept in its context.
+
+    Without a dict context (e.g. schema.execute without context_value) every
+    call gets fresh loaders, which is correct but batches nothing.
+    """
+    context = info.context
+    if isinstance(context, dict):
+        return context.setdefault("loaders", Loaders())
+    return Loaders()
+
+
+async def load_related(info: Info, table: str, fields: Sequence[str], key: Sequence[Any]) -> List[Any]:
+    """
+    Rows of a table whose indexed fields hold key, batched with the request's other lookups.
+
+    Args:
+        info: Resolver info of the relationship field
+        table: Table name of the related DataService
+        fields: Fields of an index configured on that table
+        key: Values of those fields on the parent row
+
+    Returns:
+        List[Any]: Related rows in load order; none when the key has a null
+    """
+    if any(value is None for value in key):
+        return []
+    return await request_loaders(info).get(table, index_fields(fields)).load(tuple(key))
+
+
+async def load_by_key(info: Info, table: str, key: Sequence[Any]) -> Optional[Any]:
+    """The row of a table with a primary key, batched like load_related."""
+    primary_key = _service(table).primary_key
+    if not primary_key:
+        raise ValueError(f"No primary key configured for {table}")
+    rows = await load_related(info, table, primary_key, key)
+    return rows[0] if rows else None
@@ -0,0 +1,172 @@
+import base64
+import binascii
+import bisect
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple, TypeVar
+import polars as pl
+from gql.config import config
+from gql.services.rows import take
+from gql.types.pagination import Connection, Edge, PageInfo
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+pagination_settings: Dict[str, Any] = config.get('pagination') or {}
+
+
+@dataclass(frozen=True)
+class KeyIndex:
+    """
+    Primary key order of a cached table.
+
+    keys holds the primary key columns sorted (nulls last, ties in load order) and
+    order the position of each of those rows in the cached entity list. When the
+    key is not unique, ties holds each row's position among the rows sharing its
+    key; cursors then carry it too, so a page boundary between such rows drops none.
+    """
+    keys: pl.DataFrame
+    order: pl.Series
+    ties: Optional[pl.Series] = None
+
+    @classmethod
+    def build(cls, frame: pl.DataFrame, primary_key: Sequence[str]) -> "KeyIndex":
+        """Sort a transformed table by its primary key without reordering the table itself."""
+        order = frame.select(
+            pl.arg_sort_by(list(primary_key), nulls_last=True, maintain_order=True)
+        ).to_series()
+        keys = frame.select(primary_key)[order]
+        ties = keys.select(pl.int_range(pl.len()).over(list(primary_key))).to_series()
+        if not ties.max():
+            return cls(keys, order)
+        logger.warning(
+            f"Primary key ({', '.join(primary_key)}) is not unique: "
+            f"{(ties > 0).sum()} rows repeat the key of an earlier row; their cursors include their position"
+        )
+        return cls(keys, order, ties)
+
+    def filter(self, mask: pl.Series) -> "KeyIndex":
+        """The index of the rows selected by a mask over the table in load order."""
+        keep = mask.gather(self.order)
+        ties = self.ties.filter(keep) if self.ties is not None else None
+        return KeyIndex(self.keys.filter(keep), self.order.filter(keep), ties)
+
+    @property
+    def height(self) -> int:
+        return self.keys.height
+
+    def cursor(self, position: int) -> str:
+        """Cursor of the row at a position of the index."""
+        key = self.keys.row(position)
+        return encode_cursor(key if self.ties is None else (*key, self.ties[position]))
+
+    def position_after(self, cursor: str) -> int:
+        """
+        Index of the first row sorting after a cursor, found by binary search.
+
+        Raises:
+            ValueError: If the cursor is malformed or does not match the primary key
+        """
+        width = self.keys.width
+        key = decode_cursor(cursor, width, tie=self.ties is not None)
+        if self.ties is None:
+            target, row_key = _sort_key(key), lambda i: _sort_key(self.keys.row(i))
+        else:
+            # A cursor of a key without its position comes after every row with that key
+            tie = key[width] if len(key) > width else float("inf")
+            target = (_sort_key(key[:width]), tie)
+            row_key = lambda i: (_sort_key(self.keys.row(i)), self.ties[i])
+        try:
+            return bisect.bisect_right(range(self.height), target, key=row_key)
+        except TypeError:
+            raise ValueError("Invalid cursor: key does not match the table's primary key") from None
+
+
+def _sort_key(key: Tuple[Any, ...]) -> Tuple[Tuple[bool, Any], ...]:
+    # Mirrors the Polars sort: values ascending, nulls last
+    return tuple((value is None, value) for value in key)
+
+
+def encode_cursor(key: Tuple[Any, ...]) -> str:
+    """Opaque cursor holding the primary key values of a row."""
+    return base64.urlsafe_b64encode(json.dumps(list(key), separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str, width: int, tie: bool = False) -> Tuple[Any, ...]:
+    """
+    Primary key values of a cursor made by encode_cursor.
+
+    With tie, the key may be followed by the row's position among the rows sharing it.
+
+    Raises:
+        ValueError: If the cursor is malformed or holds the wrong number of values
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if not isinstance(key, list) or not (
+        len(key) == width or (tie and len(key) == width + 1 and type(key[-1]) is int)
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return tuple(key)
+
+
+def page_size(first: Optional[int]) -> int:
+    """
+    Number of rows to return for a requested page size, capped at max_page_size.
+
+    Raises:
+        ValueError: If first is negative
+    """
+    if first is None:
+        return int(pagination_settings.get('default_page_size', 100))
+    if first < 0:
+        raise ValueError("first must not be negative")
+    return min(first, int(pagination_settings.get('max_page_size', 1000)))
+
+
+def empty_page() -> Connection[Any]:
+    """The page of a table without rows."""
+    return Connection(
+        edges=[],
+        page_info=PageInfo(has_next_page=False, has_previous_page=False, start_cursor=None, end_cursor=None),
+        total_count=0,
+    )
+
+
+def paginate(data: Sequence[T], index: KeyIndex, first: Optional[int] = None, after: Optional[str] = None) -> Connection[T]:
+    """
+    Slice one page out of a cached table in primary key order.
+
+    Only the rows of the page are looked up; cursors are primary key values, so a
+    cursor keeps pointing at the same place in the table after a refresh.
+
+    Args:
+        data: Cached entities in load order
+        index: Primary key order of data
+        first: Maximum number of rows in the page
+        after: Cursor of the row the page starts after, None to start at the beginning
+
+    Returns:
+        Connection[T]: The page with its cursors and the table's row count
+    """
+    start = index.position_after(after) if after else 0
+    end = min(start + page_size(first), index.height)
+    positions = index.order.slice(start, end - start).to_list()
+    edges = [
+        Edge(node=node, cursor=index.cursor(start + offset))
+        for offset, node in enumerate(take(data, positions))
+    ]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=end < index.height,
+            has_previous_page=start > 0,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+        total_count=index.height,
+    )
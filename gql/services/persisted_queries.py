@@ -0,0 +1,148 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from gql.config import config
+from gql.config.config import CONFIG_DIR
+from gql.utils.logger import get_logger
+from gql.utils.metrics import counter
+
+logger = get_logger(__name__)
+
+persisted_query_settings: Dict[str, Any] = config.get('persisted_queries') or {}
+
+lookups = counter(
+    "persisted_query_lookups",
+    "Persisted query requests by outcome: hit, miss (the client is asked for the query) or registered"
+)
+
+# The automatic persisted query protocol version supported
+APQ_VERSION = 1
+
+
+class PersistedQueryError(ValueError):
+    """A persisted query request that cannot be served, with the error code sent to the client."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.code = code
+
+
+def query_hash(query: str) -> str:
+    """The sha256 hex digest identifying a query document."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueries:
+    """
+    Query documents by sha256 hash, for automatic persisted queries (APQ).
+
+    A client sends only the hash of a query in `extensions.persistedQuery`;
+    when the hash is unknown it is told PersistedQueryNotFound and sends the
+    query together with its hash, which registers it. At most cache_size
+    registered queries are kept, least recently used first out; allowlisted
+    queries are registered up front and never evicted.
+    """
+
+    def __init__(self, cache_size: int, allowlist: Optional[Dict[str, str]] = None):
+        self.cache_size = cache_size
+        self._allowlist: Dict[str, str] = {}
+        self._registered: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        for sha256_hash, query in (allowlist or {}).items():
+            self._check_hash(query, sha256_hash)
+            self._allowlist[sha256_hash] = query
+
+    @staticmethod
+    def _check_hash(query: str, sha256_hash: str) -> None:
+        if query_hash(query) != sha256_hash.lower():
+            raise PersistedQueryError("provided sha does not match query", "PERSISTED_QUERY_HASH_MISMATCH")
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        """The query registered under a hash, None when it is unknown."""
+        sha256_hash = sha256_hash.lower()
+        if sha256_hash in self._allowlist:
+            return self._allowlist[sha256_hash]
+        with self._lock:
+            query = self._registered.get(sha256_hash)
+            if query is not None:
+                self._registered.move_to_end(sha256_hash)
+            return query
+
+    def register(self, query: str, sha256_hash: str) -> None:
+        """
+        Register a query under its hash.
+
+        Raises:
+            PersistedQueryError: If the hash is not the query's sha256 digest
+        """
+        self._check_hash(query, sha256_hash)
+        sha256_hash = sha256_hash.lower()
+        if sha256_hash in self._allowlist:
+            return
+        with self._lock:
+            self._registered[sha256_hash] = query
+            self._registered.move_to_end(sha256_hash)
+            while len(self._registered) > self.cache_size:
+                self._registered.popitem(last=False)
+
+    def resolve(self, query: Optional[str], extensions: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        The query document to execute for a request's query and extensions.
+
+        Requests without a persisted query extension keep their query; with one,
+        a hash alone is looked up and a query with its hash is registered.
+
+        Raises:
+            PersistedQueryError: If the hash is unknown, does not match the query
+                or the protocol version is not supported
+        """
+        persisted = (extensions or {}).get("persistedQuery")
+        if not isinstance(persisted, dict):
+            return query
+        sha256_hash = persisted.get("sha256Hash")
+        if persisted.get("version") != APQ_VERSION or not isinstance(sha256_hash, str):
+            raise PersistedQueryError("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+        if query is None:
+            stored = self.get(sha256_hash)
+            lookups.inc(outcome="miss" if stored is None else "hit")
+            if stored is None:
+                raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            return stored
+        self.register(query, sha256_hash)
+        lookups.inc(outcome="registered")
+        return query
+
+    def stats(self) -> Dict[str, int]:
+        """Number of allowlisted and registered queries."""
+        with self._lock:
+            return {"allowlisted": len(self._allowlist), "registered": len(self._registered)}
+
+
+def load_allowlist(path: Union[str, Path]) -> Dict[str, str]:
+    """
+    Read an allowlist file, a JSON object mapping sha256 hashes to query documents.
+
+    Relative paths are taken from the config directory.
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        path = CONFIG_DIR / path
+    with open(path, 'r', encoding='utf-8') as file:
+        allowlist = json.load(file)
+    if not isinstance(allowlist, dict) or not all(isinstance(query, str) for query in allowlist.values()):
+        raise ValueError(f"Persisted query allowlist {path} must map hashes to query documents")
+    return allowlist
+
+
+def default_persisted_queries() -> Optional[PersistedQueries]:
+    """The persisted queries configured under `persisted_queries` in config.yaml, None when disabled."""
+    if not persisted_query_settings.get('enabled', True):
+        return None
+    allowlist_path = persisted_query_settings.get('allowlist')
+    allowlist = load_allowlist(allowlist_path) if allowlist_path else {}
+    if allowlist:
+        logger.info(f"Registered {len(allowlist)} allowlisted persisted queries from {allowlist_path}")
+    return PersistedQueries(cache_size=int(persisted_query_settings.get('cache_size', 1024)), allowlist=allowlist)
@@ -0,0 +1,35 @@
+from typing import Any, Dict, List
+from gql.config import config
+from gql.services.warmup import WarmupState, services_to_warm_up, warmup_state
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+readiness_settings: Dict[str, Any] = config.get('readiness') or {}
+
+
+def required_tables(available: List[str]) -> List[str]:
+    """Tables that must be warm before the instance takes traffic; all tables unless configured."""
+    return list(readiness_settings.get('required_tables') or available)
+
+
+def readiness_report(state: WarmupState = warmup_state) -> Dict[str, Any]:
+    """
+    Collect the readiness of the instance and the status of every table.
+
+    Returns:
+        Dict[str, Any]: `ready` plus warm-up progress and per-table status
+    """
+    tables = {name: service.status() for name, service in services_to_warm_up().items()}
+    required = required_tables(list(tables))
+    cold = [name for name in required if not tables.get(name, {}).get("warm")]
+    return {
+        "ready": not cold,
+        "cold_tables": cold,
+        "warmup": {
+            "finished": state.finished_at is not None,
+            "deadline_passed": state.deadline_passed,
+            "durations_seconds": {name: round(d, 3) for name, d in state.durations.items()},
+        },
+        "tables": tables,
+    }
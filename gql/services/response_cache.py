@@ -0,0 +1,173 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Tuple
+from graphql import GraphQLError, OperationDefinitionNode, OperationType, parse, print_ast
+from gql.config import config
+from gql.services.data_service import get_registered_services
+from gql.utils.metrics import counter
+
+response_cache_settings: Dict[str, Any] = config.get('response_cache') or {}
+
+lookups = counter(
+    "response_cache_lookups",
+    "GraphQL responses looked up in the response cache, by outcome: hit, miss or stale"
+)
+evictions = counter(
+    "response_cache_evictions",
+    "Cached GraphQL responses dropped to keep the response cache within its bounds"
+)
+
+# Distinct query documents whose normalized form is remembered
+DOCUMENT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def normalize_document(query: str) -> Optional[str]:
+    """
+    The query document printed without comments and insignificant whitespace.
+
+    None for documents that do not parse or hold anything but queries, whose
+    responses are never cached.
+    """
+    try:
+        document = parse(query, no_location=True)
+    except GraphQLError:
+        return None
+    if any(
+        isinstance(definition, OperationDefinitionNode) and definition.operation != OperationType.QUERY
+        for definition in document.definitions
+    ):
+        return None
+    return print_ast(document)
+
+
+def auth_scope(context: Any) -> str:
+    """
+    Who a response is made for, so callers never share each other's responses.
+
+    The authenticated user with their roles and scopes when the context holds
+    one, else a digest of the request's Authorization header; "" for anonymous callers.
+    """
+    if not isinstance(context, dict):
+        return ""
+    user = context.get("user")
+    if user is not None:
+        return "user:" + json.dumps([user.id, sorted(user.roles), user.scp])
+    request = context.get("request")
+    authorization = request.headers.get("authorization") if request is not None else None
+    return "token:" + hashlib.sha256(authorization.encode()).hexdigest() if authorization else ""
+
+
+def response_key(
+    query: str,
+    operation_name: Optional[str],
+    variables: Optional[Dict[str, Any]],
+    scope: str
+) -> Optional[Hashable]:
+    """Key of a response in the cache, None when the request's response is not cached."""
+    document = normalize_document(query)
+    if document is None:
+        return None
+    return document, operation_name, json.dumps(variables or {}, sort_keys=True), scope
+
+
+@dataclass(frozen=True)
+class _Entry:
+    body: str
+    # (table, data version) of every table read to make the response
+    versions: Tuple[Tuple[str, int], ...]
+
+
+class ResponseCache:
+    """
+    Encoded GraphQL responses, served while the tables they were made from hold the same data.
+
+    An entry records the data version of every table read while its response
+    was made; it is a hit only while each table still serves that version,
+    checked the way a read would, so expired tables refresh as usual and a
+    reload invalidates every response made from the old data. Entries are
+    evicted least recently used first beyond max_entries or max_bytes of bodies.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    async def get_async(self, key: Hashable) -> Optional[str]:
+        """The cached response body for key, None when there is none or its data changed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            lookups.inc(outcome="miss")
+            return None
+        if not await self._is_current(entry):
+            self._discard(key, entry)
+            lookups.inc(outcome="stale")
+            return None
+        lookups.inc(outcome="hit")
+        return entry.body
+
+    @staticmethod
+    async def _is_current(entry: _Entry) -> bool:
+        services = get_registered_services()
+        for table, version in entry.versions:
+            if table not in services or await services[table].data_version_async() != version:
+                return False
+        return True
+
+    def put(self, key: Hashable, body: str, reads: Dict[str, Optional[int]]) -> None:
+        """
+        Cache a response body made from the table versions in reads (see track_reads).
+
+        Responses that read a table at two versions, or that are larger than the
+        whole cache, are not cached.
+        """
+        if any(version is None for version in reads.values()) or len(body) > self.max_bytes:
+            return
+        entry = _Entry(body, tuple(sorted(reads.items())))  # type: ignore[arg-type]
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = entry
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+                evictions.inc()
+
+    def _discard(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                self._size -= len(entry.body)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Number of cached responses and the bytes of their bodies, which are ASCII JSON."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size}
+
+
+def default_response_cache() -> Optional[ResponseCache]:
+    """The response cache configured under `response_cache` in config.yaml, None when disabled."""
+    if not response_cache_settings.get('enabled', True):
+        return None
+    return ResponseCache(
+        max_entries=int(response_cache_settings.get('max_entries', 512)),
+        max_bytes=int(response_cache_settings.get('max_bytes', 256 * 2**20)),
+    )
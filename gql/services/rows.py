@@ -0,0 +1,157 @@
+import dataclasses
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence, Type, TypeVar, Union, overload
+import polars as pl
+
+T = TypeVar('T')
+
+# Rows taken per block when iterating a table
+BLOCK_SIZE = 1024
+
+
+def is_lazy_entity_type(entity_type: Type[Any]) -> bool:
+    """Whether rows of entity_type can be served as lazy row views (strawberry types can)."""
+    return hasattr(entity_type, "__strawberry_definition__") and dataclasses.is_dataclass(entity_type)
+
+
+def stored_fields(entity_type: Type[Any]) -> List[str]:
+    """Fields of a strawberry type held on its rows; resolved fields such as relationships are left out."""
+    return [
+        field.python_name
+        for field in entity_type.__strawberry_definition__.fields
+        if field.base_resolver is None
+    ]
+
+
+@lru_cache(maxsize=None)
+def row_type(entity_type: Type[T]) -> Type[T]:
+    """
+    Subclass of an entity type whose instances are views of one row of a table.
+
+    Every stored field becomes a property reading the row's value from its
+    column on access, so a row costs two slots until its fields are resolved and
+    only resolved fields are ever converted to Python objects. The columns are
+    either the table's Series or a _Block of Python values shared by the rows
+    taken together. Methods, e.g. relationship fields, are inherited and see the
+    same values through self.
+    """
+    def __init__(self: Any, columns: Mapping[str, Sequence[Any]], position: int) -> None:
+        self._columns = columns
+        self._position = position
+
+    def column_value(name: str) -> property:
+        return property(lambda self: self._columns[name][self._position])
+
+    fields = stored_fields(entity_type)
+
+    def __eq__(self: Any, other: Any) -> Any:
+        # Equal to any entity of the type holding the same values, row view or not
+        if not isinstance(other, entity_type):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in fields)
+
+    namespace: Dict[str, Any] = {
+        "__slots__": ("_columns", "_position"),
+        "__init__": __init__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__module__": entity_type.__module__,
+        "__qualname__": f"Lazy{entity_type.__qualname__}",
+        **{name: column_value(name) for name in fields},
+    }
+    return type(f"Lazy{entity_type.__name__}", (entity_type,), namespace)
+
+
+class _Block(Dict[str, List[Any]]):
+    """
+    Python values of the rows taken together, converted a column at a time.
+
+    A column is converted the first time a field of one of the rows is resolved,
+    so reading a value is then a dict and a list lookup. The block lives as long
+    as the rows it was taken for, e.g. while a response is being built.
+    """
+    __slots__ = ("_columns", "_take")
+
+    def __init__(self, columns: Dict[str, pl.Series], take: Callable[[pl.Series], pl.Series]):
+        super().__init__()
+        self._columns = columns
+        self._take = take
+
+    def __missing__(self, name: str) -> List[Any]:
+        values = self[name] = self._take(self._columns[name]).to_list()
+        return values
+
+
+class LazyRows(Sequence[T]):
+    """
+    Entities of a transformed table, served from its columns.
+
+    The table stays a columnar Polars frame for as long as it is cached; a row
+    view is created when a row is taken from the sequence, and a value when a
+    field of that row is resolved. Rows taken together (iterated, sliced or
+    taken by position) share a _Block, so their values are converted a column at
+    a time rather than read from the Series one by one.
+    """
+    __slots__ = ("_row_type", "_columns", "_height")
+
+    def __init__(self, frame: pl.DataFrame, entity_type: Type[T]):
+        """
+        Serve the rows of a frame holding a column per field of entity_type.
+
+        Raises:
+            ValueError: If a field of entity_type has no column in frame
+        """
+        missing = [name for name in stored_fields(entity_type) if name not in frame.columns]
+        if missing:
+            raise ValueError(f"No column for {entity_type.__name__} fields: {', '.join(missing)}")
+        self._row_type = row_type(entity_type)
+        # The columns as they are: rechunking would copy a table read from several
+        # part files, whose columns share the buffers of the cached part frames
+        self._columns = {name: frame.get_column(name) for name in frame.columns}
+        self._height = frame.height
+
+    def __len__(self) -> int:
+        return self._height
+
+    @overload
+    def __getitem__(self, position: int) -> T: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[T]: ...
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(position, slice):
+            return self.take(range(*position.indices(self._height)))
+        if position < 0:
+            position += self._height
+        if not 0 <= position < self._height:
+            raise IndexError("row position out of range")
+        return self._row_type(self._columns, position)
+
+    def __iter__(self) -> Iterator[T]:
+        row_type, columns = self._row_type, self._columns
+        for start in range(0, self._height, BLOCK_SIZE):
+            size = min(BLOCK_SIZE, self._height - start)
+            block = _Block(columns, lambda series, start=start, size=size: series.slice(start, size))
+            yield from map(row_type, repeat(block, size), range(size))
+
+    def take(self, positions: Sequence[int]) -> List[T]:
+        """
+        The rows at positions, in that order, sharing one block of values.
+
+        Raises:
+            IndexError: If a position is out of range
+        """
+        indices = pl.Series(values=list(positions), dtype=pl.Int64)
+        if len(indices) and not (0 <= indices.min() and indices.max() < self._height):  # type: ignore[operator]
+            raise IndexError("row position out of range")
+        block = _Block(self._columns, lambda series: series.gather(indices))
+        return list(map(self._row_type, repeat(block, len(indices)), range(len(indices))))
+
+
+def take(data: Sequence[T], positions: Sequence[int]) -> List[T]:
+    """The rows of a cached table at positions, taken together when it is a LazyRows."""
+    if isinstance(data, LazyRows):
+        return data.take(positions)
+    return [data[position] for position in positions]
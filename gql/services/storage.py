@@ -0,0 +1,152 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.pipeline.transport import AioHttpTransport, RequestsTransport
+from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob.aio import (
+    BlobServiceClient as AsyncBlobServiceClient,
+    ContainerClient as AsyncContainerClient
+)
+from gql.config import config
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Azure storage account credentials, AZURE_STORAGE_CONNECTION_STRING takes precedence when set
+DEFAULT_CONNECTION_STRING = (
+    "DefaultEndpointsProtocol=https;"
+    "AccountName=mavdatalabdevsa;"
+    "AccountKey=GJjIbQW7QiwpWSUwyFuFN+v7p/o7ZMSM7Yt/UKXcd6IELOMkFipstnptesHlJTSc0dR9nN2fqngT+AStVk0I/A==;"
+    "EndpointSuffix=core.windows.net"
+)
+
+storage_settings: Dict[str, Any] = config.get('storage') or {}
+
+_lock = threading.Lock()
+_blob_service_client: Optional[BlobServiceClient] = None
+_container_client: Optional[ContainerClient] = None
+_async_blob_service_client: Optional[AsyncBlobServiceClient] = None
+_async_container_client: Optional[AsyncContainerClient] = None
+
+
+def _connection_string() -> str:
+    return os.getenv("AZURE_STORAGE_CONNECTION_STRING", DEFAULT_CONNECTION_STRING)
+
+
+def _download_options() -> Dict[str, int]:
+    """Chunk sizes used when streaming blobs, so at most one chunk is buffered per download."""
+    chunk_size = int(storage_settings.get('download_chunk_size', 4 * 1024 * 1024))
+    return {"max_single_get_size": chunk_size, "max_chunk_get_size": chunk_size}
+
+
+def _build_transport() -> RequestsTransport:
+    """Create an HTTP transport with a sized connection pool shared by all requests."""
+    pool_size = int(storage_settings.get('connection_pool_size', 32))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not storage_settings.get('keep_alive', True):
+        session.headers["Connection"] = "close"
+    return RequestsTransport(
+        session=session,
+        session_owner=True,
+        connection_timeout=storage_settings.get('connection_timeout', 20),
+        read_timeout=storage_settings.get('read_timeout', 120)
+    )
+
+
+def _build_async_transport() -> AioHttpTransport:
+    """Async counterpart of _build_transport; must be called on the serving event loop."""
+    pool_size = int(storage_settings.get('connection_pool_size', 32))
+    keep_alive = bool(storage_settings.get('keep_alive', True))
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        keepalive_timeout=storage_settings.get('keep_alive_timeout', 30) if keep_alive else None,
+        force_close=not keep_alive
+    )
+    return AioHttpTransport(
+        session=aiohttp.ClientSession(connector=connector),
+        session_owner=True,
+        connection_timeout=storage_settings.get('connection_timeout', 20),
+        read_timeout=storage_settings.get('read_timeout', 120)
+    )
+
+
+def open_storage_client() -> ContainerClient:
+    """
+    Create the process-wide container client if it does not exist yet.
+
+    Returns:
+        ContainerClient: The shared client for the configured container
+    """
+    global _blob_service_client, _container_client
+    with _lock:
+        if _container_client is None:
+            _blob_service_client = BlobServiceClient.from_connection_string(
+                _connection_string(), transport=_build_transport(), **_download_options()
+            )
+            _container_client = _blob_service_client.get_container_client(
+                storage_settings.get('container', 'external')
+            )
+            logger.info("Opened shared blob storage client")
+        return _container_client
+
+
+def get_container_client() -> ContainerClient:
+    """Return the shared container client, opening it on first use."""
+    return _container_client or open_storage_client()
+
+
+def close_storage_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _blob_service_client, _container_client
+    with _lock:
+        if _blob_service_client is not None:
+            _blob_service_client.close()
+            logger.info("Closed shared blob storage client")
+        _blob_service_client = None
+        _container_client = None
+
+
+def open_async_storage_client() -> AsyncContainerClient:
+    """
+    Create the process-wide async container client if it does not exist yet.
+
+    The client is bound to the event loop it is first used on, so it has to be
+    opened from the serving loop (the app lifespan does that).
+
+    Returns:
+        AsyncContainerClient: The shared async client for the configured container
+    """
+    global _async_blob_service_client, _async_container_client
+    with _lock:
+        if _async_container_client is None:
+            _async_blob_service_client = AsyncBlobServiceClient.from_connection_string(
+                _connection_string(), transport=_build_async_transport(), **_download_options()
+            )
+            _async_container_client = _async_blob_service_client.get_container_client(
+                storage_settings.get('container', 'external')
+            )
+            logger.info("Opened shared async blob storage client")
+        return _async_container_client
+
+
+def get_async_container_client() -> AsyncContainerClient:
+    """Return the shared async container client, opening it on first use."""
+    return _async_container_client or open_async_storage_client()
+
+
+async def close_async_storage_client() -> None:
+    """Close the shared async client and its connection pool."""
+    global _async_blob_service_client, _async_container_client
+    with _lock:
+        client = _async_blob_service_client
+        _async_blob_service_client = None
+        _async_container_client = None
+    if client is not None:
+        await client.close()
+        logger.info("Closed shared async blob storage client")
@@ -0,0 +1,163 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+import polars as pl
+from gql.config import config
+from gql.services.data_service import DataService, get_registered_services
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+def get_view_config(view_name: str) -> Dict[str, Any]:
+    """The definition of a view under `views` in config.yaml."""
+    definition = (config.get('views') or {}).get(view_name)
+    if not isinstance(definition, dict):
+        raise ValueError(f"No view {view_name} configured")
+    return definition
+
+
+def _field_map(fields: Union[Sequence[str], Dict[str, str]]) -> Dict[str, str]:
+    """Fields to project mapped to their name in the view; a list keeps the names."""
+    return dict(fields) if isinstance(fields, dict) else {field: field for field in fields}
+
+
+class ViewService(DataService[T]):
+    """
+    DataService of a materialized view, a join of other tables' cached frames.
+
+    A view is configured under `views` in config.yaml: a base table, the tables
+    joined to it and the fields projected from each. It is cached, filtered and
+    paged like a table, but its data is rebuilt from the input tables' frames and
+    only when one of them holds a new version of its data.
+    """
+
+    def __init__(
+        self,
+        view_name: str,
+        entity_type: Type[T],
+        definition: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize the view.
+
+        Args:
+            view_name: Name of the view under `views` in config.yaml
+            entity_type: The type of entity a view row becomes
+            definition: View definition; defaults to the configured one
+            **kwargs: Further DataService settings, e.g. cache TTLs
+        """
+        self.definition = definition or get_view_config(view_name)
+        self.base_table: str = self.definition['base']
+        self.joins: List[Dict[str, Any]] = list(self.definition.get('joins') or [])
+        kwargs.setdefault('primary_key', self.definition.get('primary_key'))
+        kwargs.setdefault('indexes', self.definition.get('indexes'))
+        super().__init__(
+            path=f"views/{view_name}",
+            table_name=view_name,
+            entity_type=entity_type,
+            transform_func=lambda row: entity_type(**row),
+            # Rows come out of the join with the entity fields already
+            frame_transform=lambda frame: frame,
+            **kwargs
+        )
+        self._inputs: Tuple[Any, ...] = ()
+
+    @property
+    def input_tables(self) -> List[str]:
+        """Tables the view reads, the base table first."""
+        return [self.base_table] + [join['table'] for join in self.joins]
+
+    def _input_services(self) -> List[DataService[Any]]:
+        services = get_registered_services()
+        missing = [table for table in self.input_tables if table not in services]
+        if missing:
+            raise ValueError(f"View {self.table_name} reads unregistered tables: {', '.join(missing)}")
+        return [services[table] for table in self.input_tables]
+
+    def _is_expired(self, current_time: float) -> bool:
+        """Expired like a table, and as soon as an input table loaded new data."""
+        return super()._is_expired(current_time) or self._inputs_changed()
+
+    def _inputs_changed(self) -> bool:
+        if not self._inputs:
+            return False
+        services = get_registered_services()
+        for table, used in zip(self.input_tables, self._inputs):
+            snapshot = services[table]._snapshot if table in services else None
+            if snapshot is not None and snapshot.frame is not used:
+                return True
+        return False
+
+    async def _read_frame_async(self) -> Optional[pl.DataFrame]:
+        """Rebuild the view from its input tables; None when none of them changed."""
+        return self._materialize([await service.current_frame_async() for service in self._input_services()])
+
+    def _materialize(self, frames: List[Optional[pl.DataFrame]]) -> Optional[pl.DataFrame]:
+        if len(frames) == len(self._inputs) and all(frame is used for frame, used in zip(frames, self._inputs)):
+            return None
+        logger.info(f"Materializing view {self.table_name} from {', '.join(self.input_tables)}")
+        view = build_view(self.definition, frames[0], frames[1:])
+        self._inputs = tuple(frames)
+        return view
+
+    def _handle_refresh_error(self, e: Exception) -> None:
+        super()._handle_refresh_error(e)
+        # Rebuild next time even if the inputs did not change
+        self._inputs = ()
+
+    def clear_cache(self) -> None:
+        """Force clear the cache, the view is rebuilt on next use."""
+        super().clear_cache()
+        self._inputs = ()
+
+
+def build_view(
+    definition: Dict[str, Any],
+    base: Optional[pl.DataFrame],
+    joined: Sequence[Optional[pl.DataFrame]]
+) -> pl.DataFrame:
+    """
+    Join and project transformed tables as a view definition describes.
+
+    Each join matches its `keys` fields (base field: joined table field) and adds
+    the joined table's `fields`; join keys are compared as the base field's dtype.
+    Joins are left joins unless `how` says otherwise, keeping the base rows in order.
+
+    Args:
+        definition: View definition from config.yaml
+        base: Transformed frame of the base table, None when it has no rows
+        joined: Transformed frames of the joined tables, in the order of the joins
+
+    Returns:
+        pl.DataFrame: The view, one column per projected field
+    """
+    if base is None:
+        return pl.DataFrame()
+    result = base
+    projection = [pl.col(field).alias(name) for field, name in _field_map(definition['fields']).items()]
+    for position, (join, frame) in enumerate(zip(definition.get('joins') or [], joined)):
+        # Joined columns are prefixed until the final projection, so they never clash with base columns
+        prefix = f"__join{position}__"
+        fields = _field_map(join['fields'])
+        keys = {f"{prefix}key__{left}": (left, right) for left, right in join['keys'].items()}
+        how = join.get('how', 'left')
+        if frame is None:
+            if how != 'left':
+                return pl.DataFrame()
+            result = result.with_columns([pl.lit(None).alias(f"{prefix}{name}") for name in fields.values()])
+        else:
+            right = frame.select(
+                [pl.col(right).cast(result.schema[left], strict=False).alias(key) for key, (left, right) in keys.items()]
+                + [pl.col(field).alias(f"{prefix}{name}") for field, name in fields.items()]
+            )
+            result = result.join(
+                right,
+                left_on=[left for left, _ in keys.values()],
+                right_on=list(keys),
+                how=how,
+                maintain_order="left",
+            )
+        projection += [pl.col(f"{prefix}{name}").alias(name) for name in fields.values()]
+    return result.select(projection)
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+from gql.config import config, tables_names
+from gql.services.data_service import DataService, get_registered_services
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+warmup_settings: Dict[str, Any] = config.get('warmup') or {}
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up, shared with the status endpoints."""
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    deadline_passed: bool = False
+    durations: Dict[str, float] = field(default_factory=dict)
+
+
+warmup_state = WarmupState()
+
+
+def services_to_warm_up(table_names: Iterable[str] = tables_names) -> Dict[str, DataService[Any]]:
+    """The registered DataService of every table in config.yaml."""
+    services = get_registered_services()
+    missing = [name for name in table_names if name not in services]
+    if missing:
+        logger.warning(f"No DataService registered for configured tables: {', '.join(missing)}")
+    return {name: services[name] for name in table_names if name in services}
+
+
+async def warm_up(
+    services: Dict[str, DataService[Any]],
+    max_concurrency: int = 4,
+    state: WarmupState = warmup_state
+) -> Dict[str, float]:
+    """
+    Preload the given tables concurrently.
+
+    Args:
+        services: DataService instances keyed by table name
+        max_concurrency: Maximum number of tables loading at the same time
+        state: Where progress is recorded
+
+    Returns:
+        Dict[str, float]: Load time in seconds per table
+    """
+    state.started_at = time.time()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def load(name: str, service: DataService[Any]) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            data = await service.get_data_async()
+            state.durations[name] = time.perf_counter() - start
+            logger.info(f"Warmed up {name}: {len(data)} records in {state.durations[name]:.2f}s")
+
+    await asyncio.gather(*(load(name, service) for name, service in services.items()))
+    state.finished_at = time.time()
+    logger.info(f"Warm-up of {len(services)} tables finished in {state.finished_at - state.started_at:.2f}s")
+    return state.durations
+
+
+async def run_startup_warm_up(state: WarmupState = warmup_state) -> Optional["asyncio.Task[Dict[str, float]]"]:
+    """
+    Warm up all configured tables, waiting at most the configured deadline.
+
+    Past the deadline the instance reports ready anyway and the remaining tables
+    keep loading in the returned task.
+    """
+    if not warmup_settings.get('enabled', True):
+        state.finished_at = time.time()
+        return None
+
+    task = asyncio.create_task(warm_up(
+        services_to_warm_up(),
+        max_concurrency=int(warmup_settings.get('max_concurrency', 4)),
+        state=state
+    ))
+    deadline = float(warmup_settings.get('deadline_seconds', 120))
+    try:
+        await asyncio.wait_for(asyncio.shield(task), timeout=deadline)
+    except asyncio.TimeoutError:
+        state.deadline_passed = True
+        logger.warning(f"Warm-up deadline of {deadline:.0f}s passed, continuing in the background")
+    return task
@@ -0,0 +1,105 @@
+import strawberry
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterator, List, Optional, Tuple, Type
+from gql.utils.datetime import DateTimeISO
+
+
+@strawberry.enum(description="Function applied to the rows of each group.")
+class AggregateFunction(Enum):
+    COUNT = "count"
+    SUM = "sum"
+    MIN = "min"
+    MAX = "max"
+    AVG = "avg"
+
+
+@strawberry.type(description=(
+    "One aggregate of a group, under its alias. The value is in the field of its type "
+    "(COUNT and integer SUMs are ints, AVG is a float, MIN and MAX have the type of their field); "
+    "every field is null when the aggregate is."
+))
+class AggregateValue:
+    alias: str
+    int_value: Optional[int] = None
+    float_value: Optional[float] = None
+    string_value: Optional[str] = None
+    boolean_value: Optional[bool] = None
+    date_value: Optional[datetime] = None
+
+    @classmethod
+    def of(cls, alias: str, value: Any, is_date: bool = False) -> "AggregateValue":
+        """The aggregate holding value in the field of its type; is_date marks the MIN or MAX of a date field."""
+        if value is None:
+            return cls(alias=alias)
+        if isinstance(value, bool):
+            return cls(alias=alias, boolean_value=value)
+        if isinstance(value, int):
+            return cls(alias=alias, int_value=value)
+        if isinstance(value, float):
+            return cls(alias=alias, float_value=value)
+        if is_date:
+            return cls(alias=alias, date_value=value)
+        return cls(alias=alias, string_value=str(value))
+
+
+def _stored_fields(entity_type: Type[Any]) -> Iterator[Tuple[str, Any]]:
+    """Name and type of the fields held on an entity type's rows; relationships are resolved, not stored."""
+    for field in entity_type.__strawberry_definition__.fields:
+        if field.base_resolver is None:
+            yield field.python_name, getattr(field.type, "of_type", field.type)
+
+
+def date_fields(entity_type: Type[Any]) -> FrozenSet[str]:
+    """Fields of an entity type holding dates, which are stored as strings in several layouts."""
+    return frozenset(name for name, field_type in _stored_fields(entity_type) if field_type in (datetime, DateTimeISO))
+
+
+def field_enum(entity_type: Type[Any]) -> Type[Enum]:
+    """
+    Build the enum of an entity type's stored fields, used to name group-by keys
+    and aggregated fields, e.g. CompanyField with CUSTOMER_ID.
+    """
+    names = [name for name, _ in _stored_fields(entity_type)]
+    name = entity_type.__name__.removesuffix("Type") + "Field"
+    return strawberry.enum(
+        Enum(name, {field.upper(): field for field in names}),
+        description=f"Fields of {entity_type.__name__} to group or aggregate by."
+    )
+
+
+def aggregation_input(fields: Type[Enum]) -> Type[Any]:
+    """
+    Build the input naming one aggregate of a table, e.g. CompanyAggregation.
+
+    field is required for every function but COUNT, which counts the group's rows
+    (or, with a field, its non-null values). alias names the aggregate in the result
+    rows and defaults to the function and field, e.g. sumUsedQty.
+    """
+    name = fields.__name__.removesuffix("Field") + "Aggregation"
+    namespace = {
+        "__annotations__": {"function": AggregateFunction, "field": Optional[fields], "alias": Optional[str]},
+        "field": None,
+        "alias": None,
+    }
+    return strawberry.input(type(name, (), namespace), description=f"One aggregate over the {fields.__name__} values of a group.")
+
+
+@lru_cache(maxsize=None)
+def aggregate_row(entity_type: Type[Any]) -> Type[Any]:
+    """
+    Build the result row of an entity type's aggregates, e.g. CompanyAggregateRow.
+
+    It has the type's stored fields, holding the group's key for the fields grouped
+    by and null for the others, and the group's aggregates in the order requested.
+    Built once per entity type, so the schema and the services share the class.
+    """
+    annotations = {name: Optional[field_type] for name, field_type in _stored_fields(entity_type)}
+    namespace = {
+        "__annotations__": {**annotations, "aggregates": List[AggregateValue]},
+        **{name: None for name in annotations},
+        "aggregates": strawberry.field(default_factory=list),
+    }
+    name = entity_type.__name__.removesuffix("Type") + "AggregateRow"
+    return strawberry.type(type(name, (), namespace), description=f"One group of {entity_type.__name__} rows with its aggregates.")
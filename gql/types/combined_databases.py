@@ -2,6 +2,8 @@ from datetime import date
 import strawberry
 from typing import Optional
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class CombinedDatabasesType:
@@ -17,4 +19,10 @@ class CombinedDatabasesType:
     reference_db: Optional[str]
     allowed_db_size_mb: Optional[str]
     db_size_mb: Optional[str]
-    customer_name_and_id:Optional[str]
\ No newline at end of file
+    customer_name_and_id:Optional[str]
+
+
+CombinedDatabasesWhere = where_input(CombinedDatabasesType)
+CombinedDatabasesField = field_enum(CombinedDatabasesType)
+CombinedDatabasesAggregation = aggregation_input(CombinedDatabasesField)
+CombinedDatabasesAggregateRow = aggregate_row(CombinedDatabasesType)
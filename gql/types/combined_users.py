@@ -2,6 +2,8 @@ from datetime import date
 import strawberry
 from typing import Optional
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class CombinedUsersType:
@@ -16,4 +18,8 @@ class CombinedUsersType:
     company_id: Optional[str]
     company_name: Optional[str]
 
-    
+
+CombinedUsersWhere = where_input(CombinedUsersType)
+CombinedUsersField = field_enum(CombinedUsersType)
+CombinedUsersAggregation = aggregation_input(CombinedUsersField)
+CombinedUsersAggregateRow = aggregate_row(CombinedUsersType)
@@ -1,6 +1,10 @@
 from datetime import datetime
 import strawberry
-from typing import Optional
+from typing import Annotated, List, Optional
+from strawberry.types import Info
+from gql.services.loaders import load_related
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class CompanyType:
@@ -25,6 +29,33 @@ class CompanyType:
     app_id: Optional[str]
     customer_name_and_id: Optional[str]
     crm_url:Optional[str]
-    
 
-    
\ No newline at end of file
+    @strawberry.field(description="Mavim databases of the company.")
+    async def databases(self, info: Info) -> List[Annotated["MavimDatabaseType", strawberry.lazy("gql.types.mavim_databases_details")]]:
+        return await load_related(info, "mavim_databases_details", ["customer_id"], [self.customer_id])
+
+    @strawberry.field(description="Portals of the company.")
+    async def portals(self, info: Info) -> List[Annotated["PortalType", strawberry.lazy("gql.types.portal")]]:
+        return await load_related(info, "portal", ["customer_id"], [self.customer_id])
+
+    @strawberry.field(description="Mavim Manager users of the company.")
+    async def users(self, info: Info) -> List[Annotated["UserMavimManagerLicenseType", strawberry.lazy("gql.types.users")]]:
+        return await load_related(info, "mavim_manager_users", ["customer_id"], [self.customer_id])
+
+    @strawberry.field(description="Editions the company is subscribed to.")
+    async def editions(self, info: Info) -> List[Annotated["CustomerEditionDetailsType", strawberry.lazy("gql.types.customer_edition_details")]]:
+        return await load_related(info, "customer_edition_details", ["customer_id"], [self.customer_id])
+
+    @strawberry.field(description="Add-ons of the company.")
+    async def addons(self, info: Info) -> List[Annotated["CustomerAddonDetailsType", strawberry.lazy("gql.types.customer_addons_details")]]:
+        return await load_related(info, "customer_addon_details", ["customer_id"], [self.customer_id])
+
+    @strawberry.field(description="Licenses of the company per product.")
+    async def licenses(self, info: Info) -> List[Annotated["LicenseCustomerProductType", strawberry.lazy("gql.types.license_customer_product")]]:
+        return await load_related(info, "license_customer_product", ["customer_id"], [self.customer_id])
+
+
+CompanyWhere = where_input(CompanyType)
+CompanyField = field_enum(CompanyType)
+CompanyAggregation = aggregation_input(CompanyField)
+CompanyAggregateRow = aggregate_row(CompanyType)
@@ -2,6 +2,8 @@ from datetime import date
 import strawberry
 from typing import Optional
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class CompanyGlobalAdminType:
@@ -14,3 +16,9 @@ class CompanyGlobalAdminType:
     user_aggregate_id: Optional[str] = strawberry.field(default=None)
     company_id: Optional[str] = strawberry.field(default=None)
     created: Optional[DateTimeISO] = strawberry.field(default=None)
+
+
+CompanyGlobalAdminWhere = where_input(CompanyGlobalAdminType)
+CompanyGlobalAdminField = field_enum(CompanyGlobalAdminType)
+CompanyGlobalAdminAggregation = aggregation_input(CompanyGlobalAdminField)
+CompanyGlobalAdminAggregateRow = aggregate_row(CompanyGlobalAdminType)
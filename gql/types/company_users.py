@@ -0,0 +1,27 @@
+import strawberry
+from typing import Optional
+from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
+
+
+@strawberry.type(description="Combined users with the details of their company, materialized from combined_users and company.")
+class CompanyUserType:
+    user_id: str
+    product_name: Optional[str]
+    license_name: Optional[str]
+    user_name: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    company_id: Optional[str]
+    company_name: Optional[str]
+    customer_name_and_id: Optional[str]
+    is_partner: Optional[bool]
+    domain_name: Optional[str]
+    termination_date: Optional[DateTimeISO]
+
+
+CompanyUserWhere = where_input(CompanyUserType)
+CompanyUserField = field_enum(CompanyUserType)
+CompanyUserAggregation = aggregation_input(CompanyUserField)
+CompanyUserAggregateRow = aggregate_row(CompanyUserType)
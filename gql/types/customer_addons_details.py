@@ -1,5 +1,9 @@
 import strawberry
-from typing import Optional    
+from typing import Annotated, Optional
+from strawberry.types import Info
+from gql.services.loaders import load_by_key
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
 
 @strawberry.type
 class CustomerAddonDetailsType:
@@ -10,3 +14,13 @@ class CustomerAddonDetailsType:
     customer_addon_id: Optional[int]
     name: Optional[str]
     is_addon: Optional[bool]
+
+    @strawberry.field(description="Company of the add-on.")
+    async def company(self, info: Info) -> Optional[Annotated["CompanyType", strawberry.lazy("gql.types.company")]]:
+        return await load_by_key(info, "company", [self.customer_id])
+
+
+CustomerAddonDetailsWhere = where_input(CustomerAddonDetailsType)
+CustomerAddonDetailsField = field_enum(CustomerAddonDetailsType)
+CustomerAddonDetailsAggregation = aggregation_input(CustomerAddonDetailsField)
+CustomerAddonDetailsAggregateRow = aggregate_row(CustomerAddonDetailsType)
@@ -1,6 +1,10 @@
 from datetime import datetime
 import strawberry
-from typing import Optional
+from typing import Annotated, List, Optional
+from strawberry.types import Info
+from gql.services.loaders import load_by_key, load_related
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
       
 @strawberry.type
 class CustomerEditionDetailsType:
@@ -14,4 +18,17 @@ class CustomerEditionDetailsType:
     edition_created_date: Optional[datetime]
     edition_modified_date: Optional[datetime]
     edition_deleted_date: Optional[datetime]
-    
\ No newline at end of file
+
+    @strawberry.field(description="Functions included in the edition.")
+    async def functions(self, info: Info) -> List[Annotated["EditionFunctionDetailsType", strawberry.lazy("gql.types.edition_function_details")]]:
+        return await load_related(info, "edition_function_details", ["edition_id"], [self.edition_id])
+
+    @strawberry.field(description="Company subscribed to the edition.")
+    async def company(self, info: Info) -> Optional[Annotated["CompanyType", strawberry.lazy("gql.types.company")]]:
+        return await load_by_key(info, "company", [self.customer_id])
+
+
+CustomerEditionDetailsWhere = where_input(CustomerEditionDetailsType)
+CustomerEditionDetailsField = field_enum(CustomerEditionDetailsType)
+CustomerEditionDetailsAggregation = aggregation_input(CustomerEditionDetailsField)
+CustomerEditionDetailsAggregateRow = aggregate_row(CustomerEditionDetailsType)
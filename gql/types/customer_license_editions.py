@@ -0,0 +1,25 @@
+import strawberry
+from typing import Optional
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
+
+
+@strawberry.type(description="Licenses per product next to the editions of the same customer, materialized from license_customer_product and customer_edition_details.")
+class CustomerLicenseEditionType:
+    customer_id: int
+    customer_name: Optional[str]
+    product_name: Optional[str]
+    license_name: Optional[str]
+    license_quantity: Optional[int]
+    used_qty: Optional[int]
+    customer_edition_id: Optional[int]
+    edition_id: Optional[int]
+    edition_name: Optional[str]
+    edition_is_active: Optional[bool]
+    edition_quantity: Optional[int]
+
+
+CustomerLicenseEditionWhere = where_input(CustomerLicenseEditionType)
+CustomerLicenseEditionField = field_enum(CustomerLicenseEditionType)
+CustomerLicenseEditionAggregation = aggregation_input(CustomerLicenseEditionField)
+CustomerLicenseEditionAggregateRow = aggregate_row(CustomerLicenseEditionType)
@@ -0,0 +1,25 @@
+import strawberry
+from typing import Optional
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
+
+
+@strawberry.type(description="Combined databases with their Mavim SQL details, materialized from combined_databases and mavim_databases_details.")
+class DatabaseDetailsType:
+    database_id: str
+    database_name: Optional[str]
+    company_id: Optional[str]
+    company_name: Optional[str]
+    primary_region: Optional[str]
+    db_size_mb: Optional[str]
+    mavim_sql_server: Optional[str]
+    mavim_sql_database: Optional[str]
+    mavim_schema: Optional[str]
+    template_id: Optional[int]
+    database_guid: Optional[str]
+
+
+DatabaseDetailsWhere = where_input(DatabaseDetailsType)
+DatabaseDetailsField = field_enum(DatabaseDetailsType)
+DatabaseDetailsAggregation = aggregation_input(DatabaseDetailsField)
+DatabaseDetailsAggregateRow = aggregate_row(DatabaseDetailsType)
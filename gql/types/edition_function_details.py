@@ -1,5 +1,7 @@
 import strawberry
 from typing import Optional
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
 
 @strawberry.type
 class EditionFunctionDetailsType:
@@ -10,4 +12,10 @@ class EditionFunctionDetailsType:
     function_description: Optional[str]
     function_subject: Optional[str]
     function_is_addon: Optional[bool]
-    function_is_company_wide_addon: Optional[bool]
\ No newline at end of file
+    function_is_company_wide_addon: Optional[bool]
+
+
+EditionFunctionDetailsWhere = where_input(EditionFunctionDetailsType)
+EditionFunctionDetailsField = field_enum(EditionFunctionDetailsType)
+EditionFunctionDetailsAggregation = aggregation_input(EditionFunctionDetailsField)
+EditionFunctionDetailsAggregateRow = aggregate_row(EditionFunctionDetailsType)
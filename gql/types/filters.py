@@ -0,0 +1,82 @@
+import strawberry
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+from gql.utils.datetime import DateTimeISO
+
+
+@strawberry.input(description="Conditions on an integer field; all given conditions must hold.")
+class IntFilter:
+    eq: Optional[int] = None
+    in_: Optional[List[int]] = strawberry.field(name="in", default=None)
+    gt: Optional[int] = None
+    gte: Optional[int] = None
+    lt: Optional[int] = None
+    lte: Optional[int] = None
+    is_null: Optional[bool] = None
+
+
+@strawberry.input(description="Conditions on a decimal field; all given conditions must hold.")
+class FloatFilter:
+    eq: Optional[float] = None
+    in_: Optional[List[float]] = strawberry.field(name="in", default=None)
+    gt: Optional[float] = None
+    gte: Optional[float] = None
+    lt: Optional[float] = None
+    lte: Optional[float] = None
+    is_null: Optional[bool] = None
+
+
+@strawberry.input(description="Conditions on a text field; all given conditions must hold.")
+class StringFilter:
+    eq: Optional[str] = None
+    in_: Optional[List[str]] = strawberry.field(name="in", default=None)
+    starts_with: Optional[str] = None
+    is_null: Optional[bool] = None
+
+
+@strawberry.input(description="Conditions on a boolean field; all given conditions must hold.")
+class BooleanFilter:
+    eq: Optional[bool] = None
+    is_null: Optional[bool] = None
+
+
+@strawberry.input(description="Conditions on a date field, compared as instants; all given conditions must hold.")
+class DateTimeFilter:
+    eq: Optional[DateTimeISO] = None
+    gt: Optional[DateTimeISO] = None
+    gte: Optional[DateTimeISO] = None
+    lt: Optional[DateTimeISO] = None
+    lte: Optional[DateTimeISO] = None
+    is_null: Optional[bool] = None
+
+
+_FILTERS: Dict[Any, Type[Any]] = {
+    int: IntFilter,
+    float: FloatFilter,
+    str: StringFilter,
+    bool: BooleanFilter,
+    datetime: DateTimeFilter,
+    DateTimeISO: DateTimeFilter,
+}
+
+
+def where_input(entity_type: Type[Any]) -> Type[Any]:
+    """
+    Build the `where` input of an entity type, with one optional filter per field.
+
+    The input is named after the type without its `Type` suffix, e.g. CompanyWhere.
+    """
+    annotations = {}
+    for field in entity_type.__strawberry_definition__.fields:
+        if field.base_resolver is not None:
+            # Relationship fields are resolved, not stored on the row
+            continue
+        field_type = getattr(field.type, "of_type", field.type)
+        if field_type in _FILTERS:
+            annotations[field.python_name] = Optional[_FILTERS[field_type]]
+    name = entity_type.__name__.removesuffix("Type") + "Where"
+    namespace = {"__annotations__": annotations, **{field: None for field in annotations}}
+    return strawberry.input(
+        type(name, (), namespace),
+        description=f"Filters on {entity_type.__name__} rows; all given field filters must hold."
+    )
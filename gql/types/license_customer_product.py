@@ -2,6 +2,8 @@ from datetime import date
 import strawberry
 from typing import Optional
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class LicenseCustomerProductType:
@@ -14,4 +16,10 @@ class LicenseCustomerProductType:
     license_quantity: Optional[int]
     used_qty: Optional[int]
     is_active: Optional[str]
-    created:Optional[DateTimeISO]
\ No newline at end of file
+    created:Optional[DateTimeISO]
+
+
+LicenseCustomerProductWhere = where_input(LicenseCustomerProductType)
+LicenseCustomerProductField = field_enum(LicenseCustomerProductType)
+LicenseCustomerProductAggregation = aggregation_input(LicenseCustomerProductField)
+LicenseCustomerProductAggregateRow = aggregate_row(LicenseCustomerProductType)
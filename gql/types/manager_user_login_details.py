@@ -1,6 +1,8 @@
 import strawberry
 from typing import Optional
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class ManagerUserLoginDetailsType:
@@ -8,3 +10,9 @@ class ManagerUserLoginDetailsType:
     thinfinity_user: Optional[str]
     customer_id: Optional[int]
     login_time: Optional[DateTimeISO]
+
+
+ManagerUserLoginDetailsWhere = where_input(ManagerUserLoginDetailsType)
+ManagerUserLoginDetailsField = field_enum(ManagerUserLoginDetailsType)
+ManagerUserLoginDetailsAggregation = aggregation_input(ManagerUserLoginDetailsField)
+ManagerUserLoginDetailsAggregateRow = aggregate_row(ManagerUserLoginDetailsType)
@@ -1,7 +1,11 @@
 import strawberry
-from typing import Optional
+from typing import Annotated, Optional
 from gql.utils.datetime import DateTimeISO
 from datetime import date
+from strawberry.types import Info
+from gql.services.loaders import load_by_key
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class MavimDatabaseType:
@@ -26,4 +30,14 @@ class MavimDatabaseType:
     # is_mavim_admin: Optional[str]
     # is_partner: Optional[bool]
     # manager_database_user_id: Optional[int]
-    # manager_database_user_database_id: Optional[int]
\ No newline at end of file
+    # manager_database_user_database_id: Optional[int]
+
+    @strawberry.field(description="Company owning the database.")
+    async def company(self, info: Info) -> Optional[Annotated["CompanyType", strawberry.lazy("gql.types.company")]]:
+        return await load_by_key(info, "company", [self.customer_id])
+
+
+MavimDatabaseWhere = where_input(MavimDatabaseType)
+MavimDatabaseField = field_enum(MavimDatabaseType)
+MavimDatabaseAggregation = aggregation_input(MavimDatabaseField)
+MavimDatabaseAggregateRow = aggregate_row(MavimDatabaseType)
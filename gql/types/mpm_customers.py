@@ -2,6 +2,8 @@ from datetime import date
 import strawberry
 from typing import Optional
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class MpmCustomerType:
@@ -13,4 +15,10 @@ class MpmCustomerType:
     portal_url: Optional[str]
     subscription_key: Optional[str]
     subscription_start_date: Optional[str]
-    subscription_end_date: Optional[str]
\ No newline at end of file
+    subscription_end_date: Optional[str]
+
+
+MpmCustomerWhere = where_input(MpmCustomerType)
+MpmCustomerField = field_enum(MpmCustomerType)
+MpmCustomerAggregation = aggregation_input(MpmCustomerField)
+MpmCustomerAggregateRow = aggregate_row(MpmCustomerType)
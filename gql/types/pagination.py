@@ -0,0 +1,26 @@
+import strawberry
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str]
+    end_cursor: Optional[str]
+
+
+@strawberry.type
+class Edge(Generic[T]):
+    node: T
+    cursor: str
+
+
+@strawberry.type
+class Connection(Generic[T]):
+    """A page of a table in primary key order, with cursors to continue from."""
+    edges: List[Edge[T]]
+    page_info: PageInfo
+    total_count: int
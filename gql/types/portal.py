@@ -1,6 +1,10 @@
 import strawberry
-from typing import Optional
+from typing import Annotated, List, Optional
 from datetime import datetime
+from strawberry.types import Info
+from gql.services.loaders import load_by_key, load_related
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 
 @strawberry.type
@@ -23,4 +27,17 @@ class PortalType:
     created_date: Optional[datetime]
     modified_date: Optional[datetime]
     termination_date: Optional[datetime]
-    
\ No newline at end of file
+
+    @strawberry.field(description="Monthly user counts of the portal.")
+    async def monthly_reports(self, info: Info) -> List[Annotated["PortalMonthlyUserReportType", strawberry.lazy("gql.types.portal_monthly_users_report")]]:
+        return await load_related(info, "portal_monthly_users_report", ["portal_id"], [self.portal_id])
+
+    @strawberry.field(description="Company owning the portal.")
+    async def company(self, info: Info) -> Optional[Annotated["CompanyType", strawberry.lazy("gql.types.company")]]:
+        return await load_by_key(info, "company", [self.customer_id])
+
+
+PortalWhere = where_input(PortalType)
+PortalField = field_enum(PortalType)
+PortalAggregation = aggregation_input(PortalField)
+PortalAggregateRow = aggregate_row(PortalType)
@@ -3,6 +3,8 @@ import strawberry
 from typing import Optional
 
 from gql.utils.datetime import DateTimeISO
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class PortalMonthlyUserReportType:
@@ -15,3 +17,8 @@ class PortalMonthlyUserReportType:
     year: str
     created_date: Optional[DateTimeISO]
 
+
+PortalMonthlyUserReportWhere = where_input(PortalMonthlyUserReportType)
+PortalMonthlyUserReportField = field_enum(PortalMonthlyUserReportType)
+PortalMonthlyUserReportAggregation = aggregation_input(PortalMonthlyUserReportField)
+PortalMonthlyUserReportAggregateRow = aggregate_row(PortalMonthlyUserReportType)
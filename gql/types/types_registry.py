@@ -1,17 +1,25 @@
-from .company import CompanyType
-from .customer_addons_details import CustomerAddonDetailsType
-from .customer_edition_details import CustomerEditionDetailsType
-from .edition_function_details import EditionFunctionDetailsType
-from .mavim_databases_details import MavimDatabaseType
-from .users import UserMavimManagerLicenseType
-from .mpm_customers import MpmCustomerType
-from .portal import PortalType
-from .license_customer_product import LicenseCustomerProductType
-from .combined_databases import CombinedDatabasesType
-from .combined_users import CombinedUsersType
-from .portal_monthly_users_report import PortalMonthlyUserReportType
-from .company_global_admin import CompanyGlobalAdminType
-from .manager_user_login_details import ManagerUserLoginDetailsType
+from .company import CompanyType, CompanyWhere, CompanyField, CompanyAggregation, CompanyAggregateRow
+from .customer_addons_details import CustomerAddonDetailsType, CustomerAddonDetailsWhere, CustomerAddonDetailsField, CustomerAddonDetailsAggregation, CustomerAddonDetailsAggregateRow
+from .customer_edition_details import CustomerEditionDetailsType, CustomerEditionDetailsWhere, CustomerEditionDetailsField, CustomerEditionDetailsAggregation, CustomerEditionDetailsAggregateRow
+from .edition_function_details import EditionFunctionDetailsType, EditionFunctionDetailsWhere, EditionFunctionDetailsField, EditionFunctionDetailsAggregation, EditionFunctionDetailsAggregateRow
+from .mavim_databases_details import MavimDatabaseType, MavimDatabaseWhere, MavimDatabaseField, MavimDatabaseAggregation, MavimDatabaseAggregateRow
+from .users import UserMavimManagerLicenseType, UserMavimManagerLicenseWhere, UserMavimManagerLicenseField, UserMavimManagerLicenseAggregation, UserMavimManagerLicenseAggregateRow
+from .mpm_customers import MpmCustomerType, MpmCustomerWhere, MpmCustomerField, MpmCustomerAggregation, MpmCustomerAggregateRow
+from .portal import PortalType, PortalWhere, PortalField, PortalAggregation, PortalAggregateRow
+from .license_customer_product import LicenseCustomerProductType, LicenseCustomerProductWhere, LicenseCustomerProductField, LicenseCustomerProductAggregation, LicenseCustomerProductAggregateRow
+from .combined_databases import CombinedDatabasesType, CombinedDatabasesWhere, CombinedDatabasesField, CombinedDatabasesAggregation, CombinedDatabasesAggregateRow
+from .combined_users import CombinedUsersType, CombinedUsersWhere, CombinedUsersField, CombinedUsersAggregation, CombinedUsersAggregateRow
+from .portal_monthly_users_report import PortalMonthlyUserReportType, PortalMonthlyUserReportWhere, PortalMonthlyUserReportField, PortalMonthlyUserReportAggregation, PortalMonthlyUserReportAggregateRow
+from .company_global_admin import CompanyGlobalAdminType, CompanyGlobalAdminWhere, CompanyGlobalAdminField, CompanyGlobalAdminAggregation, CompanyGlobalAdminAggregateRow
+from .manager_user_login_details import ManagerUserLoginDetailsType, ManagerUserLoginDetailsWhere, ManagerUserLoginDetailsField, ManagerUserLoginDetailsAggregation, ManagerUserLoginDetailsAggregateRow
+from .company_users import CompanyUserType, CompanyUserWhere, CompanyUserField, CompanyUserAggregation, CompanyUserAggregateRow
+from .customer_license_editions import (
+    CustomerLicenseEditionType, CustomerLicenseEditionWhere, CustomerLicenseEditionField, CustomerLicenseEditionAggregation, CustomerLicenseEditionAggregateRow
+)
+from .database_details import DatabaseDetailsType, DatabaseDetailsWhere, DatabaseDetailsField, DatabaseDetailsAggregation, DatabaseDetailsAggregateRow
+from .pagination import Connection, Edge, PageInfo
+from .filters import BooleanFilter, DateTimeFilter, FloatFilter, IntFilter, StringFilter
+from .aggregation import AggregateFunction, AggregateValue
     
 # @strawberry.type
 # class CompanyType:
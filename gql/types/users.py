@@ -1,6 +1,10 @@
 import strawberry
-from typing import Optional
+from typing import Annotated, Optional
 from gql.utils.datetime import DateTimeISO
+from strawberry.types import Info
+from gql.services.loaders import load_by_key
+from gql.types.aggregation import aggregate_row, aggregation_input, field_enum
+from gql.types.filters import where_input
     
 @strawberry.type
 class UserMavimManagerLicenseType:
@@ -20,6 +24,13 @@ class UserMavimManagerLicenseType:
     deleted_date: Optional[DateTimeISO]
     license_changed_date: Optional[DateTimeISO]
     license: Optional[str]
-    
-    
-    
+
+    @strawberry.field(description="Company of the user.")
+    async def company(self, info: Info) -> Optional[Annotated["CompanyType", strawberry.lazy("gql.types.company")]]:
+        return await load_by_key(info, "company", [self.customer_id])
+
+
+UserMavimManagerLicenseWhere = where_input(UserMavimManagerLicenseType)
+UserMavimManagerLicenseField = field_enum(UserMavimManagerLicenseType)
+UserMavimManagerLicenseAggregation = aggregation_input(UserMavimManagerLicenseField)
+UserMavimManagerLicenseAggregateRow = aggregate_row(UserMavimManagerLicenseType)
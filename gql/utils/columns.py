@@ -0,0 +1,43 @@
+from typing import Any, Optional
+import polars as pl
+
+# Flag spellings besides numbers, compared lowercase
+_TRUE = "true"
+_FALSE = "false"
+
+
+def parse_flag(value: Any) -> Optional[bool]:
+    """
+    Read a flag the way the gold tables write it: true/false, 1/0 or 1.0/0.0.
+
+    Returns None for empty or unrecognized values.
+    """
+    if value is None or isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in (_TRUE, _FALSE):
+        return text == _TRUE
+    try:
+        return float(text) != 0
+    except ValueError:
+        return None
+
+
+def flag(column: str) -> pl.Expr:
+    """Vectorized parse_flag of a text column, as a Boolean column of the same name."""
+    text = pl.col(column).cast(pl.String).str.strip_chars().str.to_lowercase()
+    return (
+        pl.when(text == _TRUE).then(True)
+        .when(text == _FALSE).then(False)
+        .otherwise(text.cast(pl.Float64, strict=False) != 0)
+        .alias(column)
+    )
+
+
+def whole_number(column: str) -> pl.Expr:
+    """
+    A numeric column as Int64, as int() would convert it; null where it is empty or not finite.
+
+    Count columns are read as Float64 because part files may write them as 3.0.
+    """
+    return pl.col(column).cast(pl.Int64, strict=False).alias(column)
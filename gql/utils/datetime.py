@@ -1,17 +1,60 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import re
+import time
+from typing import NewType, Optional
+import polars as pl
 import pytz
 import strawberry
 from dateutil import parser
-# Custom scalar for datetimeoffset
-@strawberry.scalar
-class DateTimeISO:
+from gql.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+AMSTERDAM = pytz.timezone("Europe/Amsterdam")
+# Distinct date strings remembered by parse_mavim_date and normalize_datetime_format
+DATE_CACHE_SIZE = 65536
 
-    @staticmethod
-    def serialize(value) -> str | None:
-        """Serialize datetime values to ISO format compatible with Power BI and other consumers."""
-        return normalize_datetime_format(value)
+# The gold-layer timestamp layouts, e.g. "2020-01-28 09:47:43.0000000 +00:00" and
+# "2020-01-28T09:47:43.000Z"; anything else is parsed by dateutil
+_GOLD_TIMESTAMP = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"(?: ?(Z|[+-]\d{2}:?\d{2}))?"
+)
+
+def _parse_gold_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse a gold-layer timestamp the way dateutil would, without dateutil.
 
+    Fractions beyond microseconds are truncated and a Z or +HH:MM suffix becomes a
+    fixed offset, as dateutil does. Returns None for any other layout.
+    """
+    match = _GOLD_TIMESTAMP.fullmatch(value.strip())
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset == "Z":
+        tzinfo = timezone.utc
+    elif offset is not None:
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:]))
+        tzinfo = timezone(-delta if offset[0] == "-" else delta)
+    try:
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0, tzinfo=tzinfo
+        )
+    except ValueError:
+        # Out of range fields, let dateutil decide
+        return None
 
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a timestamp string, through the fast path when it has a gold-layer layout."""
+    return _parse_gold_timestamp(value) or parser.parse(value)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_mavim_date(date_str: str) -> str | None:
     """
     Parse a date string and convert it to Europe/Amsterdam timezone.
@@ -27,11 +70,118 @@ def parse_mavim_date(date_str: str) -> str | None:
         return None
     
     try:
-        return parser.parse(date_str).astimezone(pytz.timezone("Europe/Amsterdam")).isoformat()
+        return _parse_timestamp(date_str).astimezone(AMSTERDAM).isoformat()
     except (ValueError, TypeError):
         return None
 
 
+# Timestamp layouts of the gold tables, parsed natively by Polars; other values go through dateutil
+_AWARE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%.f%#z",
+    "%Y-%m-%dT%H:%M:%S%.f%:z",
+    "%Y-%m-%d %H:%M:%S%.f %:z",
+)
+_NAIVE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%.f",
+    "%Y-%m-%d %H:%M:%S%.f",
+)
+# Earlier Amsterdam offsets are not whole minutes and pytz renders them differently
+_MIN_NATIVE_YEAR = 1970
+
+
+def _native_timestamps(formats) -> pl.Expr:
+    """UTC datetimes of the `value` column for the first matching layout, null if none matches."""
+    return pl.coalesce([
+        pl.col("value").str.to_datetime(fmt, strict=False, time_zone="UTC", time_unit="us")
+        for fmt in formats
+    ])
+
+
+def parse_mavim_dates(values: pl.Series) -> pl.Series:
+    """
+    Vectorized parse_mavim_date: the same ISO strings for a whole column.
+
+    Common layouts are parsed and converted by Polars; values it cannot handle
+    exactly the way parse_mavim_date does (other layouts, very old dates, naive
+    timestamps when the process does not run in UTC) are parsed one by one with
+    parse_mavim_date, once per distinct value.
+
+    Args:
+        values: Column of date strings
+
+    Returns:
+        pl.Series: ISO formatted Europe/Amsterdam timestamps, null where the input is invalid
+    """
+    # parse_mavim_date reads naive timestamps in the local timezone
+    formats = _AWARE_FORMATS + (_NAIVE_FORMATS if time.timezone == 0 and not time.daylight else ())
+    parsed = _native_timestamps(formats)
+    local = pl.col("parsed").dt.convert_time_zone("Europe/Amsterdam")
+    iso = (
+        pl.when(pl.col("parsed").dt.year() < _MIN_NATIVE_YEAR).then(None)
+        .when(local.dt.microsecond() == 0).then(local.dt.strftime("%Y-%m-%dT%H:%M:%S%:z"))
+        .otherwise(local.dt.strftime("%Y-%m-%dT%H:%M:%S%.6f%:z"))
+    )
+    frame = (
+        pl.DataFrame({"value": values.cast(pl.String)})
+        .with_columns(parsed=parsed)
+        .with_columns(iso=iso)
+    )
+
+    leftovers = frame.filter(pl.col("iso").is_null() & pl.col("value").is_not_null())["value"].unique()
+    if leftovers.len():
+        fallback = {value: parse_mavim_date(value) for value in leftovers}
+        frame = frame.with_columns(pl.col("iso").fill_null(
+            pl.col("value").replace_strict(fallback, default=None, return_dtype=pl.String)
+        ))
+    return frame["iso"].alias(values.name)
+
+
+def mavim_date(column: str) -> pl.Expr:
+    """Expression applying parse_mavim_dates to a column."""
+    return pl.col(column).map_batches(parse_mavim_dates, return_dtype=pl.String)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def to_utc_timestamp(value: str) -> Optional[datetime]:
+    """
+    The instant a date string denotes, in UTC; naive timestamps are taken as UTC.
+
+    Returns None for empty or invalid input.
+    """
+    if not value or not value.strip():
+        return None
+    try:
+        parsed = _parse_timestamp(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_timestamps(values: pl.Series) -> pl.Series:
+    """
+    Vectorized to_utc_timestamp, so date columns can be compared as instants.
+
+    Args:
+        values: Column of date strings in any layout the transformers produce
+
+    Returns:
+        pl.Series: UTC datetimes, null where the input is empty or invalid
+    """
+    frame = (
+        pl.DataFrame({"value": values.cast(pl.String)})
+        .with_columns(parsed=_native_timestamps(_AWARE_FORMATS + _NAIVE_FORMATS))
+    )
+    leftovers = frame.filter(pl.col("parsed").is_null() & pl.col("value").is_not_null())["value"].unique()
+    if leftovers.len():
+        fallback = {value: to_utc_timestamp(value) for value in leftovers}
+        frame = frame.with_columns(pl.col("parsed").fill_null(
+            pl.col("value").replace_strict(fallback, default=None, return_dtype=pl.Datetime("us", "UTC"))
+        ))
+    return frame["parsed"].alias(values.name)
+
+
 def normalize_datetime_format(value) -> str | None:
     """
     Normalize various datetime formats to a consistent ISO format.
@@ -50,30 +200,7 @@ def normalize_datetime_format(value) -> str | None:
         return None
     
     if isinstance(value, str):
-        value = value.strip()
-        if not value:
-            return None
-            
-        try:
-            # Handle the specific problematic format: "2020-01-28 09:47:43.0000000 +00:00"
-            if '.0000000' in value:
-                # Remove excessive precision that causes parsing issues
-                value = value.replace('.0000000', '.000')
-            
-            # Parse the datetime string
-            if '+' in value or value.endswith('Z'):
-                # It's already timezone-aware
-                parsed_date = parser.parse(value)
-            else:
-                # Assume UTC if no timezone info
-                parsed_date = parser.parse(value).replace(tzinfo=pytz.UTC)
-            
-            # Return in standard ISO format: YYYY-MM-DDTHH:MM:SS.sssZ
-            return parsed_date.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z' if parsed_date.tzinfo == pytz.UTC else parsed_date.isoformat()
-            
-        except (ValueError, TypeError) as e:
-            print(f"Warning: Could not parse datetime '{value}': {e}")
-            return None
+        return _normalize_datetime_string(value)
     
     elif isinstance(value, datetime):
         # If it's a datetime object, ensure it has timezone info
@@ -81,4 +208,68 @@ def normalize_datetime_format(value) -> str | None:
             value = value.replace(tzinfo=pytz.UTC)
         return value.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z' if value.tzinfo == pytz.UTC else value.isoformat()
     
-    return None 
\ No newline at end of file
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _normalize_datetime_string(value: str) -> str | None:
+    """normalize_datetime_format for strings, memoized per distinct value."""
+    value = value.strip()
+    if not value:
+        return None
+        
+    try:
+        # Handle the specific problematic format: "2020-01-28 09:47:43.0000000 +00:00"
+        if '.0000000' in value:
+            # Remove excessive precision that causes parsing issues
+            value = value.replace('.0000000', '.000')
+        
+        # Parse the datetime string
+        if '+' in value or value.endswith('Z'):
+            # It's already timezone-aware
+            parsed_date = _parse_timestamp(value)
+        else:
+            # Assume UTC if no timezone info
+            parsed_date = _parse_timestamp(value).replace(tzinfo=pytz.UTC)
+        
+        # Return in standard ISO format: YYYY-MM-DDTHH:MM:SS.sssZ
+        return parsed_date.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z' if parsed_date.tzinfo == pytz.UTC else parsed_date.isoformat()
+        
+    except (ValueError, TypeError) as e:
+        logger.warning("Could not parse datetime '%s': %s", value, e)
+        return None
+
+
+def _serialize_datetime_iso(value) -> str | None:
+    """
+    Serialize a DateTimeISO field.
+
+    Date columns are normalized once, when a table is refreshed, so stored strings
+    are sent as they are; only datetime objects are formatted here.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return normalize_datetime_format(value)
+
+
+def _parse_datetime_iso(value) -> str:
+    """
+    Parse a DateTimeISO input, such as a date in a `where` filter.
+
+    Raises:
+        ValueError: If the value is not a date, so the request fails instead of
+            the condition being dropped
+    """
+    normalized = normalize_datetime_format(value)
+    if normalized is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return normalized
+
+
+# Custom scalar for datetimeoffset
+DateTimeISO = strawberry.scalar(
+    NewType("DateTimeISO", str),
+    name="DateTimeISO",
+    serialize=_serialize_datetime_iso,
+    parse_value=_parse_datetime_iso,
+)
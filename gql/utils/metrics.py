@@ -0,0 +1,56 @@
+import threading
+from typing import Dict, Tuple
+
+
+class Counter:
+    """A monotonically increasing, thread-safe counter with optional labels."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the counter for the given label values."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for the given label values."""
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def collect(self) -> Dict[str, float]:
+        """All values keyed by their rendered label set, e.g. `table=company`."""
+        with self._lock:
+            items = list(self._values.items())
+        return {",".join(f"{k}={v}" for k, v in key) or "total": value for key, value in items}
+
+
+_registry: Dict[str, Counter] = {}
+_registry_lock = threading.Lock()
+
+
+def counter(name: str, description: str = "") -> Counter:
+    """
+    Get or create the counter registered under a name.
+
+    Args:
+        name: Unique metric name
+        description: Human readable description shown with the metric
+
+    Returns:
+        Counter: The registered counter
+    """
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = Counter(name, description)
+        return _registry[name]
+
+
+def collect_metrics() -> Dict[str, Dict[str, object]]:
+    """Snapshot of every registered metric, suitable for a JSON response."""
+    with _registry_lock:
+        counters = list(_registry.values())
+    return {c.name: {"description": c.description, "values": c.collect()} for c in counters}
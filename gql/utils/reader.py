@@ -3,13 +3,25 @@
 
 import pandas as pd
 import polars as pl
-from io import BytesIO  
+import asyncio
 import logging
 import os
-from azure.storage.blob import BlobServiceClient
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import IO, Any, Dict, List, Mapping, Optional, Tuple
+from azure.storage.blob import ContainerClient
+from azure.storage.blob.aio import ContainerClient as AsyncContainerClient
+from gql.services.storage import get_container_client, get_async_container_client
 
 log = logging.getLogger(__name__)
 
+# Number of part files downloaded in parallel when the table does not configure its own limit
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 # def read_delta_table(file_path: str)->pd.DataFrame:
     # """
@@ -74,37 +86,347 @@ log = logging.getLogger(__name__)
     #     raise
     # return df
 
-def read_csv_files_to_polars_df(file_path: str) -> pl.DataFrame:
-    # Azure storage account credentials
-    connection_string = (
-        "DefaultEndpointsProtocol=https;"
-        "AccountName=mavdatalabdevsa;"
-        "AccountKey=GJjIbQW7QiwpWSUwyFuFN+v7p/o7ZMSM7Yt/UKXcd6IELOMkFipstnptesHlJTSc0dR9nN2fqngT+AStVk0I/A==;"
-        "EndpointSuffix=core.windows.net"
+def table_schema(columns: Optional[Mapping[str, Any]]) -> Optional[Dict[str, pl.DataType]]:
+    """
+    Resolve a configured column mapping into a Polars schema.
+
+    Args:
+        columns: Column names mapped to a Polars dtype or its name, e.g. `Int64`
+
+    Returns:
+        Optional[Dict[str, pl.DataType]]: The schema, or None if no columns are given
+
+    Raises:
+        ValueError: If a dtype name is not a Polars data type
+    """
+    if columns is None:
+        return None
+    schema = {}
+    for name, dtype in columns.items():
+        if isinstance(dtype, str):
+            resolved = getattr(pl, dtype, None)
+            if not (isinstance(resolved, type) and issubclass(resolved, pl.DataType)):
+                raise ValueError(f"Unknown dtype '{dtype}' for column '{name}'")
+            dtype = resolved
+        schema[name] = dtype
+    return schema
+
+
+def _parse_csv_file(
+    blob_name: str,
+    spool: IO[bytes],
+    size: int,
+    download_seconds: float,
+    schema: Optional[Dict[str, pl.DataType]] = None
+) -> pl.DataFrame:
+    """
+    Parse a spooled CSV blob with the streaming engine and log its timings.
+
+    The streaming engine reads the file in batches, so besides the resulting frame
+    only one batch is held in memory while parsing. With a schema the file is parsed
+    without type inference and the frame holds exactly the schema's columns, in
+    order and with its dtypes; columns the file lacks are filled with nulls.
+    """
+    start = time.perf_counter()
+    if schema is None:
+        lf = pl.scan_csv(spool.name)
+    else:
+        header = set(pl.scan_csv(spool.name, infer_schema=False).collect_schema().names())
+        lf = pl.scan_csv(
+            spool.name,
+            infer_schema=False,
+            schema_overrides={name: dtype for name, dtype in schema.items() if name in header}
+        ).select([
+            pl.col(name) if name in header else pl.lit(None, dtype=dtype).alias(name)
+            for name, dtype in schema.items()
+        ])
+    df = lf.collect(engine="streaming")
+    log.info(
+        "Read CSV file %s: %d rows, %d bytes (download %.3fs, parse %.3fs)",
+        blob_name, df.height, size, download_seconds, time.perf_counter() - start
     )
-    container_name = "external"
-   
-    # Initialize BlobServiceClient
-    blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-    container_client = blob_service_client.get_container_client(container_name)
+    return df
+
+
+def _concat(df_list: List[pl.DataFrame], schema: Optional[Dict[str, pl.DataType]]) -> pl.DataFrame:
+    """
+    Concatenate part frames without copying their buffers.
+
+    Parts parsed with a schema share the same dtypes, so a plain vertical concat is
+    enough; without one the inferred dtypes are reconciled with vertical_relaxed.
+    """
+    if not df_list:
+        return pl.DataFrame(schema=schema)
+    return pl.concat(df_list, how="vertical" if schema is not None else "vertical_relaxed", rechunk=False)
+
+
+def _spool_file() -> IO[bytes]:
+    """Temporary file a blob is streamed into, removed when closed."""
+    return tempfile.NamedTemporaryFile(prefix="csv-part-", suffix=".csv")
+
+
+def _read_csv_blob(
+    container_client: ContainerClient,
+    blob_name: str,
+    schema: Optional[Dict[str, pl.DataType]] = None
+) -> pl.DataFrame:
+    """
+    Download a single CSV blob and parse it into a Polars DataFrame.
+
+    The blob is streamed chunk by chunk into a temporary file instead of being
+    held in memory as one bytes object.
 
+    Args:
+        container_client: Container client used to reach the blob
+        blob_name: Full name of the blob inside the container
+        schema: Columns to parse with their dtypes, None to infer all columns
+
+    Returns:
+        pl.DataFrame: The parsed CSV file
+    """
+    start = time.perf_counter()
+    with _spool_file() as spool:
+        size = 0
+        for chunk in container_client.get_blob_client(blob_name).download_blob().chunks():
+            size += spool.write(chunk)
+        spool.flush()
+        return _parse_csv_file(blob_name, spool, size, time.perf_counter() - start, schema)
+
+
+async def _read_csv_blob_async(
+    container_client: AsyncContainerClient,
+    blob_name: str,
+    schema: Optional[Dict[str, pl.DataType]] = None
+) -> pl.DataFrame:
+    """
+    Async variant of _read_csv_blob.
+
+    The spool file is created, written and removed in worker threads, and parsed
+    in one, so a large download does not block the event loop on disk I/O.
+    """
+    start = time.perf_counter()
+    spool = await asyncio.to_thread(_spool_file)
+    try:
+        size = 0
+        downloader = await container_client.get_blob_client(blob_name).download_blob()
+        async for chunk in downloader.chunks():
+            size += await asyncio.to_thread(spool.write, chunk)
+        await asyncio.to_thread(spool.flush)
+        return await asyncio.to_thread(
+            _parse_csv_file, blob_name, spool, size, time.perf_counter() - start, schema
+        )
+    finally:
+        await asyncio.to_thread(spool.close)
+
+
+@dataclass(frozen=True)
+class CsvBlob:
+    """A CSV part file as reported by the blob listing."""
+    name: str
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def from_properties(cls, blob: Any) -> "CsvBlob":
+        return cls(blob.name, getattr(blob, "etag", None), getattr(blob, "last_modified", None))
+
+
+def _table_prefix(file_path: str) -> str:
     # Ensure the file_path ends with a slash
-    if not file_path.endswith("/"):
-        file_path += "/"
-    blobs = container_client.list_blobs(name_starts_with=file_path)
-    # Read all CSV files into a single Polars DataFrame
-    df_list = []
-    for blob in blobs:
-        if blob.name.endswith(".csv"):
-            print(f"Reading CSV file: {blob.name}")
-            blob_client = container_client.get_blob_client(blob.name)
-            blob_data = blob_client.download_blob().readall()
-            df = pl.read_csv(BytesIO(blob_data))
-            df_list.append(df)
+    return file_path if file_path.endswith("/") else file_path + "/"
+
+
+def list_csv_blobs(file_path: str, container_client: ContainerClient) -> List[CsvBlob]:
+    """
+    List the CSV part files under a table prefix, in listing order.
+
+    Args:
+        file_path: Blob prefix of the table inside the container
+        container_client: Client to list the blobs with
+
+    Returns:
+        List[CsvBlob]: Name, ETag and last-modified time of every CSV blob
+    """
+    return [
+        CsvBlob.from_properties(blob)
+        for blob in container_client.list_blobs(name_starts_with=_table_prefix(file_path))
+        if blob.name.endswith(".csv")
+    ]
+
+
+async def list_csv_blobs_async(file_path: str, container_client: AsyncContainerClient) -> List[CsvBlob]:
+    """Async variant of list_csv_blobs."""
+    return [
+        CsvBlob.from_properties(blob)
+        async for blob in container_client.list_blobs(name_starts_with=_table_prefix(file_path))
+        if blob.name.endswith(".csv")
+    ]
+
+
+def _read_csv_blobs(
+    container_client: ContainerClient,
+    blob_names: List[str],
+    max_concurrency: int,
+    schema: Optional[Dict[str, pl.DataType]] = None
+) -> List[pl.DataFrame]:
+    """Download and parse the given blobs concurrently, keeping their order."""
+    if not blob_names:
+        return []
+    start = time.perf_counter()
+    workers = max(1, min(max_concurrency, len(blob_names)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="csv-reader") as executor:
+        df_list = list(executor.map(partial(_read_csv_blob, container_client, schema=schema), blob_names))
+    log.info(
+        "Read %d CSV files in %.3fs (concurrency %d)",
+        len(df_list), time.perf_counter() - start, workers
+    )
+    return df_list
+
+
+async def _read_csv_blobs_async(
+    container_client: AsyncContainerClient,
+    blob_names: List[str],
+    max_concurrency: int,
+    schema: Optional[Dict[str, pl.DataType]] = None
+) -> List[pl.DataFrame]:
+    """Async variant of _read_csv_blobs, bounded by a semaphore instead of a thread pool."""
+    if not blob_names:
+        return []
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def read(blob_name: str) -> pl.DataFrame:
+        async with semaphore:
+            return await _read_csv_blob_async(container_client, blob_name, schema)
+
+    df_list = list(await asyncio.gather(*(read(name) for name in blob_names)))
+    log.info(
+        "Read %d CSV files in %.3fs (async concurrency %d)",
+        len(df_list), time.perf_counter() - start, max_concurrency
+    )
+    return df_list
+
+
+def read_csv_files_to_polars_df(
+    file_path: str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    container_client: Optional[ContainerClient] = None,
+    columns: Optional[Mapping[str, Any]] = None
+) -> pl.DataFrame:
+    """
+    Read every CSV part file under a table prefix into a single Polars DataFrame.
+
+    The part files are downloaded and parsed concurrently on a bounded thread pool;
+    the resulting frames are concatenated in blob listing order.
+
+    Args:
+        file_path: Blob prefix of the table inside the container
+        max_concurrency: Maximum number of part files downloaded at the same time
+        container_client: Client to read from; defaults to the process-wide shared client
+        columns: Columns to parse and keep mapped to their dtype, None to infer all columns
+
+    Returns:
+        pl.DataFrame: All part files concatenated, or an empty DataFrame if none were found
+    """
+    if container_client is None:
+        container_client = get_container_client()
+
+    schema = table_schema(columns)
+    blob_names = [blob.name for blob in list_csv_blobs(file_path, container_client)]
+    df_list = _read_csv_blobs(container_client, blob_names, max_concurrency, schema)
 
     # Concatenate all Polars DataFrames
-    if df_list:
-        final_df = pl.concat(df_list, how="vertical_relaxed")
-        return final_df
-    else:
-        return pl.DataFrame()
\ No newline at end of file
+    return _concat(df_list, schema)
+
+
+class CsvPartCache:
+    """
+    Parsed part files of one table, keyed by blob name and ETag.
+
+    Each refresh lists the table prefix and only downloads the parts that are new
+    or whose ETag/last-modified time changed; parts that disappeared are dropped.
+    Callers must not run two refreshes of the same cache at the same time.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        columns: Optional[Mapping[str, Any]] = None
+    ):
+        self.file_path = file_path
+        self.max_concurrency = max_concurrency
+        self.schema = table_schema(columns)
+        self._parts: Dict[str, Tuple[CsvBlob, pl.DataFrame]] = {}
+        self._loaded = False
+
+    def refresh(self, container_client: Optional[ContainerClient] = None) -> Optional[pl.DataFrame]:
+        """
+        Bring the cached parts in line with the blob listing.
+
+        Args:
+            container_client: Client to read from; defaults to the process-wide shared client
+
+        Returns:
+            Optional[pl.DataFrame]: The concatenated table, or None if no part changed
+                since the previous refresh
+        """
+        if container_client is None:
+            container_client = get_container_client()
+
+        blobs = list_csv_blobs(self.file_path, container_client)
+        changed = self._changed_blobs(blobs)
+        if changed is None:
+            return None
+        downloaded = _read_csv_blobs(
+            container_client, [blob.name for blob in changed], self.max_concurrency, self.schema
+        )
+        return self._apply(blobs, changed, downloaded)
+
+    async def refresh_async(self, container_client: Optional[AsyncContainerClient] = None) -> Optional[pl.DataFrame]:
+        """Async variant of refresh, using the async blob client."""
+        if container_client is None:
+            container_client = get_async_container_client()
+
+        blobs = await list_csv_blobs_async(self.file_path, container_client)
+        changed = self._changed_blobs(blobs)
+        if changed is None:
+            return None
+        downloaded = await _read_csv_blobs_async(
+            container_client, [blob.name for blob in changed], self.max_concurrency, self.schema
+        )
+        return await asyncio.to_thread(self._apply, blobs, changed, downloaded)
+
+    def _changed_blobs(self, blobs: List[CsvBlob]) -> Optional[List[CsvBlob]]:
+        """Blobs that need downloading, or None if the listing matches the cache."""
+        changed = [blob for blob in blobs if self._parts.get(blob.name, (None,))[0] != blob]
+        removed = self._parts.keys() - {blob.name for blob in blobs}
+        if self._loaded and not changed and not removed:
+            log.info("No changes under %s, %d cached CSV files", self.file_path, len(blobs))
+            return None
+        return changed
+
+    def _apply(self, blobs: List[CsvBlob], changed: List[CsvBlob], downloaded: List[pl.DataFrame]) -> pl.DataFrame:
+        """Swap in the new part map and return the concatenated table."""
+        # The new part map is built aside so a failed download leaves the cache untouched
+        parts = dict(self._parts)
+        parts.update({blob.name: (blob, df) for blob, df in zip(changed, downloaded)})
+        removed = len(self._parts.keys() - {blob.name for blob in blobs})
+        self._parts = {blob.name: parts[blob.name] for blob in blobs}
+        self._loaded = True
+        log.info(
+            "Refreshed %s: %d changed, %d removed, %d reused CSV files",
+            self.file_path, len(changed), removed, len(blobs) - len(changed)
+        )
+
+        # Without rechunking the table shares the buffers of the cached part frames
+        return _concat([df for _, df in self._parts.values()], self.schema)
+
+    def invalidate(self) -> None:
+        """Make the next refresh return the table even if no part changed."""
+        self._loaded = False
+
+    def clear(self) -> None:
+        """Drop all cached parts so the next refresh downloads everything."""
+        self._parts = {}
+        self._loaded = False
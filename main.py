@@ -1,14 +1,38 @@
 import uvicorn
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI
-from strawberry.asgi import GraphQL
+from fastapi.responses import JSONResponse
 from gql.schemas import schema
+from gql.schemas.app import GraphQLApp
+from gql.services.storage import (
+    open_storage_client, close_storage_client,
+    open_async_storage_client, close_async_storage_client
+)
+from gql.services.readiness import readiness_report
+from gql.services.warmup import run_startup_warm_up
+from gql.utils.metrics import collect_metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources and preload the tables on startup, release them on shutdown"""
+    open_storage_client()
+    open_async_storage_client()
+    warmup_task = await run_startup_warm_up()
+    try:
+        yield
+    finally:
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+        await close_async_storage_client()
+        close_storage_client()
 
 # Create FastAPI application
-app = FastAPI(title="Azure GraphQL Platform Processor")
+app = FastAPI(title="Azure GraphQL Platform Processor", lifespan=lifespan)
 
 # Add GraphQL endpoint to FastAPI
-graphql_app = GraphQL(schema)
+graphql_app = GraphQLApp(schema)
 app.add_route("/graphql", graphql_app)
 app.add_websocket_route("/graphql", graphql_app)
 
@@ -40,6 +64,18 @@ async def status():
     """Status endpoint"""
     return await healthcheck()
 
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 503 until the tables required for serving are warm"""
+    report = readiness_report()
+    report["timestamp"] = datetime.utcnow().isoformat() + "Z"
+    return JSONResponse(content=report, status_code=200 if report["ready"] else 503)
+
+@app.get("/metrics")
+async def metrics():
+    """In-process counters, e.g. coalesced table refreshes"""
+    return collect_metrics()
+
 def main():
     """Run the GraphQL server locally"""
     print("Starting GraphQL server...")
@@ -0,0 +1,45 @@
+"""
+Fixtures shared by the test modules.
+"""
+import pytest
+
+from gql.services import data_service
+from gql.services.data_service import DataService
+from tests.fakes import BASE, FakeAsyncContainerClient, FakeContainerClient
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    """
+    Factory of DataServices reading fake blob storage.
+
+    The test starts with no registered services, so the ones it makes are the
+    only tables the response cache, views and relationships see. Call it as
+
+        make_service(table, csv, path=None, container=None, resolver=None, **DataService arguments)
+
+    where table is the config key of the table, read from path (its folder under
+    BASE by default), csv is the table's only part file, or container the
+    FakeContainerClient to read instead, through its async facade. resolver is a (module, attribute) pair whose service is swapped for the
+    new one, which then keeps its entity type and transforms unless given.
+    Other services read rows as dicts.
+    """
+    monkeypatch.setattr(data_service, "_services", {})
+
+    def make(table="company", csv=None, *, path=None, container=None, resolver=None, **kwargs):
+        path = path or f"{BASE}/{table}"
+        if container is None:
+            container = FakeContainerClient({f"{path}/part-0.csv": csv} if csv is not None else {})
+        if resolver is not None:
+            replaced = getattr(*resolver)
+            for name in ("entity_type", "transform_func", "frame_transform"):
+                kwargs.setdefault(name, getattr(replaced, name))
+        kwargs.setdefault("entity_type", dict)
+        kwargs.setdefault("transform_func", dict)
+        kwargs.setdefault("async_container_client", FakeAsyncContainerClient(container))
+        service = DataService(path=path, table_name=table, **kwargs)
+        if resolver is not None:
+            monkeypatch.setattr(*resolver, service)
+        return service
+
+    return make
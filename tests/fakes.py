@@ -0,0 +1,85 @@
+"""
+Test doubles shared by the test modules.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeContainerClient:
+    """In-memory stand-in for an Azure container client."""
+
+    def __init__(self, files, delay=0.0):
+        self.files = files
+        self.etags = {}
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.downloads = []
+        self._lock = threading.Lock()
+
+    def list_blobs(self, name_starts_with=""):
+        return [
+            SimpleNamespace(name=name, etag=self.etags.get(name, "v1"), last_modified=None)
+            for name in sorted(self.files) if name.startswith(name_starts_with)
+        ]
+
+    def get_blob_client(self, name):
+        return SimpleNamespace(download_blob=lambda: SimpleNamespace(chunks=lambda: self._chunks(name)))
+
+    def _chunks(self, name, size=4):
+        data = self._download(name)
+        for start in range(0, len(data), size):
+            yield data[start:start + size]
+
+    def _download(self, name):
+        self._start_download(name)
+        time.sleep(self.delay)
+        return self._finish_download(name)
+
+    def _start_download(self, name):
+        with self._lock:
+            self.active += 1
+            self.downloads.append(name)
+            self.peak = max(self.peak, self.active)
+
+    def _finish_download(self, name):
+        with self._lock:
+            self.active -= 1
+        return self.files[name]
+
+
+class FakeAsyncContainerClient:
+    """Async facade over a FakeContainerClient, mirroring the aio container client API."""
+
+    def __init__(self, container):
+        self.container = container
+
+    async def _list(self, name_starts_with):
+        for blob in self.container.list_blobs(name_starts_with):
+            yield blob
+
+    def list_blobs(self, name_starts_with=""):
+        return self._list(name_starts_with)
+
+    def get_blob_client(self, name):
+        async def chunks():
+            self.container._start_download(name)
+            await asyncio.sleep(self.container.delay)
+            data = self.container._finish_download(name)
+            for start in range(0, len(data), 4):
+                yield data[start:start + 4]
+
+        async def download_blob():
+            return SimpleNamespace(chunks=chunks)
+
+        return SimpleNamespace(download_blob=download_blob)
+
+
+BASE = "mavim_catalog_gold/gold"
+
+
+def part_path(table, part=0):
+    """Blob name of a part file of a table."""
+    return f"{BASE}/{table}/part-{part}.csv"
@@ -0,0 +1,176 @@
+"""
+Tests for the *Aggregate query fields.
+"""
+import asyncio
+
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company, license_customer_product
+from gql.services import aggregation
+from gql.types import (
+    AggregateFunction, LicenseCustomerProductAggregation as Aggregation,
+    LicenseCustomerProductField as Field, LicenseCustomerProductWhere, IntFilter
+)
+from tests.fakes import FakeContainerClient, part_path
+
+PART = part_path("license_customer_product")
+LICENSES = (license_customer_product, "license_customer_product_service")
+CSV = (
+    b"customer_id,product_name,license_name,license_quantity,used_qty\n"
+    b"2,Manager,Full,10,4\n"
+    b"1,Manager,Full,5,5\n"
+    b"1,Portal,Viewer,100,\n"
+    b"2,Manager,Light,3,1\n"
+)
+
+
+def values(row):
+    """The aggregates of a typed row by alias, read from the one field that holds each."""
+    return {
+        value.alias: next(
+            (v for v in (value.int_value, value.float_value, value.string_value, value.boolean_value, value.date_value)
+             if v is not None),
+            None
+        )
+        for value in row.aggregates
+    }
+
+
+def test_group_by_with_aggregates(make_service):
+    service = make_service("license_customer_product", CSV, resolver=LICENSES)
+
+    rows = asyncio.run(service.aggregate_async(
+        group_by=[Field.CUSTOMER_ID],
+        aggregations=[
+            Aggregation(function=AggregateFunction.SUM, field=Field.USED_QTY),
+            Aggregation(function=AggregateFunction.COUNT),
+            Aggregation(function=AggregateFunction.COUNT, field=Field.USED_QTY, alias="reported"),
+            Aggregation(function=AggregateFunction.MAX, field=Field.LICENSE_NAME),
+            Aggregation(function=AggregateFunction.AVG, field=Field.LICENSE_QUANTITY),
+        ],
+    ))
+
+    assert [(row.customer_id, values(row)) for row in rows] == [
+        (1, {"sumUsedQty": 5, "count": 2, "reported": 1, "maxLicenseName": "Viewer", "avgLicenseQuantity": 52.5}),
+        (2, {"sumUsedQty": 5, "count": 2, "reported": 2, "maxLicenseName": "Light", "avgLicenseQuantity": 6.5}),
+    ]
+    # Fields not grouped by stay null, and each aggregate is in the field of its type
+    assert rows[0].product_name is None
+    assert (rows[0].aggregates[0].int_value, rows[0].aggregates[3].string_value) == (5, "Viewer")
+    assert rows[0].aggregates[4].float_value == 52.5
+
+
+def test_filter_applies_before_grouping_and_no_group_gives_one_row(make_service):
+    service = make_service("license_customer_product", CSV, resolver=LICENSES)
+
+    rows = asyncio.run(service.aggregate_async(where=LicenseCustomerProductWhere(customer_id=IntFilter(eq=2))))
+
+    assert [values(row) for row in rows] == [{"count": 2}]
+
+
+def test_results_are_memoized_per_data_version(make_service):
+    container = FakeContainerClient({PART: CSV})
+    service = make_service("license_customer_product", container=container, resolver=LICENSES)
+    group_by = [Field.PRODUCT_NAME]
+
+    first = asyncio.run(service.aggregate_async(group_by=group_by))
+    assert asyncio.run(service.aggregate_async(group_by=group_by)) is first
+
+    container.files[PART] = CSV + b"3,Portal,Viewer,1,1\n"
+    container.etags[PART] = "v2"
+    service.clear_cache()
+
+    rows = asyncio.run(service.aggregate_async(group_by=group_by))
+    assert [(row.product_name, values(row)) for row in rows] == [("Manager", {"count": 3}), ("Portal", {"count": 2})]
+
+
+@pytest.mark.parametrize("aggregation", [
+    Aggregation(function=AggregateFunction.SUM),
+    Aggregation(function=AggregateFunction.SUM, field=Field.PRODUCT_NAME),
+])
+def test_invalid_aggregations_are_rejected(make_service, aggregation):
+    with pytest.raises(ValueError):
+        asyncio.run(make_service("license_customer_product", CSV, resolver=LICENSES).aggregate_async(aggregations=[aggregation]))
+
+
+def test_duplicate_aliases_are_rejected(make_service):
+    count = Aggregation(function=AggregateFunction.COUNT)
+
+    with pytest.raises(ValueError):
+        asyncio.run(make_service("license_customer_product", CSV, resolver=LICENSES).aggregate_async(aggregations=[count, count]))
+
+
+def test_aggregate_field_through_the_schema(make_service):
+    make_service("license_customer_product", CSV, resolver=LICENSES)
+    query = """
+    {
+      licenseCustomerProductAggregate(
+        groupBy: [PRODUCT_NAME]
+        aggregations: [{function: SUM, field: USED_QTY, alias: "used"}]
+        where: {usedQty: {isNull: false}}
+      ) {
+        productName
+        customerId
+        aggregates { alias intValue floatValue }
+      }
+    }
+    """
+
+    result = asyncio.run(schema.execute(query))
+
+    assert result.errors is None
+    assert result.data["licenseCustomerProductAggregate"] == [
+        {"productName": "Manager", "customerId": None, "aggregates": [{"alias": "used", "intValue": 10, "floatValue": None}]}
+    ]
+
+
+def test_min_and_max_of_dates_compare_instants(make_service):
+    # As text the first date sorts after the second, as instants it is 15 minutes earlier
+    make_service(
+        "company",
+        b"customer_id,created_date\n1,2024-01-01T00:30:00+01:00\n2,2023-12-31T23:45:00Z\n3,\n",
+        resolver=(company, "company_service"),
+    )
+    query = """
+    {
+      companiesAggregate(aggregations: [{function: MIN, field: CREATED_DATE}, {function: MAX, field: CREATED_DATE}]) {
+        aggregates { alias dateValue stringValue }
+      }
+    }
+    """
+
+    result = asyncio.run(schema.execute(query))
+
+    assert result.errors is None
+    assert result.data["companiesAggregate"][0]["aggregates"] == [
+        {"alias": "minCreatedDate", "dateValue": "2024-01-01T00:30:00+01:00", "stringValue": None},
+        {"alias": "maxCreatedDate", "dateValue": "2023-12-31T23:45:00Z", "stringValue": None},
+    ]
+
+
+def test_memo_evicts_the_least_recently_used_result(monkeypatch, make_service):
+    monkeypatch.setattr(aggregation, "aggregation_settings", {"cache_size": 2})
+    service = make_service("license_customer_product", CSV, resolver=LICENSES)
+    by_customer, by_product, by_license = ([field] for field in (Field.CUSTOMER_ID, Field.PRODUCT_NAME, Field.LICENSE_NAME))
+
+    first = asyncio.run(service.aggregate_async(group_by=by_customer))
+    asyncio.run(service.aggregate_async(group_by=by_product))
+    assert asyncio.run(service.aggregate_async(group_by=by_customer)) is first
+    asyncio.run(service.aggregate_async(group_by=by_license))
+
+    assert asyncio.run(service.aggregate_async(group_by=by_customer)) is first
+    assert len(service._snapshot.aggregates) == 2
+
+
+@pytest.mark.parametrize("csv", [None, CSV.splitlines(keepends=True)[0]])
+def test_empty_table_counts_zero_rows(make_service, csv):
+    service = make_service("license_customer_product", csv, resolver=LICENSES)
+
+    rows = asyncio.run(service.aggregate_async(aggregations=[
+        Aggregation(function=AggregateFunction.COUNT),
+        Aggregation(function=AggregateFunction.SUM, field=Field.USED_QTY, alias="used"),
+    ]))
+
+    assert [values(row) for row in rows] == [{"count": 0, "used": 0}]
+    assert asyncio.run(service.aggregate_async(group_by=[Field.PRODUCT_NAME])) == []
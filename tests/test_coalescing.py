@@ -0,0 +1,122 @@
+"""
+Tests for coalescing identical GraphQL operations in flight.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company
+from gql.schemas.app import GraphQLApp
+from gql.services.coalescing import RequestCoalescer, operations
+from gql.services.response_cache import ResponseCache
+
+
+def slow(result, calls, delay=0.01):
+    async def execute():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return execute
+
+
+def test_identical_operations_in_flight_run_once():
+    coalescer = RequestCoalescer()
+    calls = []
+    joined = operations.value(outcome="joined")
+
+    async def main():
+        results = await asyncio.gather(*[coalescer.run("k", slow(object(), calls)) for _ in range(5)])
+        other = await coalescer.run("other", slow("x", calls))
+        return results, other
+
+    results, other = asyncio.run(main())
+
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results)
+    assert other == "x"
+    assert operations.value(outcome="joined") == joined + 4
+    assert coalescer.in_flight() == 0
+
+
+def test_failures_are_shared_only_while_in_flight():
+    coalescer = RequestCoalescer(window_seconds=60)
+    calls = []
+
+    async def main():
+        failures = await asyncio.gather(
+            *[coalescer.run("k", slow(ValueError("boom"), calls)) for _ in range(3)], return_exceptions=True
+        )
+        return failures, await coalescer.run("k", slow("ok", calls))
+
+    failures, retried = asyncio.run(main())
+
+    assert [type(failure) for failure in failures] == [ValueError] * 3
+    assert retried == "ok"
+    assert len(calls) == 2
+
+
+def test_finished_results_are_shared_within_the_window():
+    async def run_twice(window):
+        coalescer = RequestCoalescer(window_seconds=window)
+        calls = []
+        await coalescer.run("k", slow("a", calls, delay=0))
+        await coalescer.run("k", slow("b", calls, delay=0))
+        return len(calls)
+
+    assert asyncio.run(run_twice(60)) == 1
+    assert asyncio.run(run_twice(0)) == 2
+
+
+def test_the_execution_outlives_a_cancelled_caller():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def main():
+        first = asyncio.ensure_future(coalescer.run("k", slow("done", calls)))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(coalescer.run("k", slow("again", calls)))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service("company", b"customer_id,customer_name\n1,a\n2,b\n", resolver=(company, "company_service"))
+
+
+def test_identical_requests_get_one_execution_and_the_same_bytes(service, monkeypatch):
+    executions = []
+    execute = schema.execute
+
+    async def counting(*args, **kwargs):
+        executions.append(args[0])
+        await asyncio.sleep(0.05)
+        return await execute(*args, **kwargs)
+
+    monkeypatch.setattr(schema, "execute", counting)
+    # A cache holding nothing, so only coalescing shares responses
+    app = GraphQLApp(schema, response_cache=ResponseCache(max_entries=0, max_bytes=0), coalescer=RequestCoalescer())
+    query = {"query": "{ companies(where: { customerId: { gte: 1 } }) { customerId customerName } }"}
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            same = await asyncio.gather(*[client.post("/", json=query) for _ in range(4)])
+            other = await client.post("/", json=query, headers={"authorization": "Bearer other"})
+            return same, other
+
+    same, other = asyncio.run(main())
+
+    assert len(executions) == 2
+    assert len({response.content for response in same}) == 1
+    assert same[0].json()["data"]["companies"] == [
+        {"customerId": 1, "customerName": "a"}, {"customerId": 2, "customerName": "b"}
+    ]
+    assert other.content == same[0].content
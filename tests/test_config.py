@@ -0,0 +1,64 @@
+"""
+Tests for the table configuration in config.yaml.
+"""
+import dataclasses
+import importlib
+import pkgutil
+
+import pytest
+
+import gql.resolvers.query as query_package
+from gql.config import table_path, tables_names
+from gql.services.data_service import DataService
+from gql.services.views import ViewService, _field_map
+from gql.utils import reader
+
+
+def resolver_services(views=False):
+    """The DataService of every table, or of every materialized view with views=True."""
+    for module_info in pkgutil.iter_modules(query_package.__path__):
+        module = importlib.import_module(f"{query_package.__name__}.{module_info.name}")
+        for value in vars(module).values():
+            if isinstance(value, DataService) and isinstance(value, ViewService) == views:
+                yield value
+
+
+def entity_fields(entity_type):
+    return [field.name for field in dataclasses.fields(entity_type)]
+
+
+@pytest.mark.parametrize("service", list(resolver_services()), ids=lambda service: service.table_name)
+def test_configured_columns_cover_the_transformer(service):
+    assert service.columns, f"no columns configured for {service.table_name}"
+    reader.table_schema(service.columns)
+    service.transform_func({column: None for column in service.columns})
+
+
+@pytest.mark.parametrize(
+    "service", list(resolver_services()) + list(resolver_services(views=True)), ids=lambda service: service.table_name
+)
+def test_primary_key_and_indexes_are_entity_fields(service):
+    for fields in [service.primary_key or [], *service.indexes]:
+        assert set(fields) <= set(entity_fields(service.entity_type)), f"{service.table_name}: {fields}"
+
+
+@pytest.mark.parametrize("view", list(resolver_services(views=True)), ids=lambda view: view.table_name)
+def test_views_project_input_fields_onto_the_view_type(view):
+    tables = {service.table_name: service for service in resolver_services()}
+    projected = list(_field_map(view.definition["fields"]).values())
+    assert set(_field_map(view.definition["fields"])) <= set(entity_fields(tables[view.base_table].entity_type))
+    for join in view.joins:
+        joined_fields = set(entity_fields(tables[join["table"]].entity_type))
+        assert set(_field_map(join["fields"])) <= joined_fields
+        assert set(join["keys"].values()) <= joined_fields
+        projected += list(_field_map(join["fields"]).values())
+
+    assert projected == entity_fields(view.entity_type)
+
+
+def test_every_configured_table_is_served_from_its_path():
+    services = list(resolver_services())
+
+    assert {service.table_name for service in services} == set(tables_names)
+    assert all(service.path == table_path(service.table_name) for service in services)
+    assert table_path("company") == "mavim_catalog_gold/gold/company"
@@ -0,0 +1,149 @@
+"""
+Tests for the cached DataService.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from gql.config import config, table_path
+from gql.services.data_service import coalesced_waiters, get_registered_services
+from tests.fakes import BASE, FakeContainerClient
+
+PATH = f"{BASE}/company"
+# Arguments of a table of ids
+ID_TABLE = {"columns": {"id": "Int64"}, "primary_key": ["id"], "indexes": []}
+
+
+def age_cache(service, seconds):
+    """Pretend the cached data was loaded the given number of seconds ago."""
+    service._last_attempt -= seconds
+    service._snapshot = replace(service._snapshot, refreshed_at=service._snapshot.refreshed_at - seconds)
+
+
+def get_data(service):
+    return asyncio.run(service.get_data_async())
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not await condition() and time.time() < deadline:
+        await asyncio.sleep(0.01)
+    return await condition()
+
+
+def test_expired_data_is_served_while_refreshing_in_background(make_service):
+    container = FakeContainerClient({f"{PATH}/part-0.csv": b"id\n1\n"})
+    service = make_service(container=container, **ID_TABLE, cache_ttl_seconds=60, hard_ttl_seconds=600)
+    assert get_data(service) == [{"id": 1}]
+
+    container.files[f"{PATH}/part-0.csv"] = b"id\n2\n"
+    container.etags[f"{PATH}/part-0.csv"] = "v2"
+    container.delay = 0.2
+    age_cache(service, 120)
+
+    async def refreshed():
+        return await service.get_data_async() == [{"id": 2}]
+
+    async def scenario():
+        stale = await service.get_data_async()
+        return stale, await wait_for(refreshed)
+
+    assert asyncio.run(scenario()) == ([{"id": 1}], True)
+    assert service.data_age_seconds < 60
+
+
+def test_data_past_hard_ttl_is_refreshed_in_the_request(make_service):
+    container = FakeContainerClient({f"{PATH}/part-0.csv": b"id\n1\n"})
+    service = make_service(container=container, **ID_TABLE, cache_ttl_seconds=60, hard_ttl_seconds=600)
+    get_data(service)
+
+    container.files[f"{PATH}/part-0.csv"] = b"id\n2\n"
+    container.etags[f"{PATH}/part-0.csv"] = "v2"
+    age_cache(service, 1200)
+
+    assert get_data(service) == [{"id": 2}]
+
+
+def test_concurrent_cold_loads_share_a_single_refresh(make_service):
+    container = FakeContainerClient({f"{PATH}/part-0.csv": b"id\n1\n"}, delay=0.2)
+    service = make_service(container=container, **ID_TABLE)
+    waited_before = coalesced_waiters.value(table="company", outcome="waited")
+
+    # Each caller runs its own event loop, so the others wait on the refresh of another loop
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: get_data(service), range(5)))
+
+    assert results == [[{"id": 1}]] * 5
+    assert container.downloads == [f"{PATH}/part-0.csv"]
+    assert coalesced_waiters.value(table="company", outcome="waited") - waited_before == 4
+
+
+def test_async_callers_share_one_refresh_without_blocking_the_loop(make_service):
+    container = FakeContainerClient({f"{PATH}/part-0.csv": b"id\n1\n"}, delay=0.2)
+    service = make_service(container=container, **ID_TABLE)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(service.get_data_async() for _ in range(5)))
+        ticking.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(scenario())
+
+    assert results == [[{"id": 1}]] * 5
+    assert container.downloads == [f"{PATH}/part-0.csv"]
+    assert ticks > 5
+
+
+def test_status_reports_failed_and_successful_loads(make_service):
+    container = FakeContainerClient({f"{PATH}/part-0.csv": b"id\n1\n2\n"})
+    container.list_blobs = lambda name_starts_with="": (_ for _ in ()).throw(ConnectionError("storage down"))
+    service = make_service(container=container, **ID_TABLE)
+
+    assert get_data(service) == []
+    status = service.status()
+    assert not status["loaded"] and not status["warm"]
+    assert status["last_error"] == "ConnectionError: storage down"
+
+    del container.list_blobs
+    service.clear_cache()
+    get_data(service)
+    status = service.status()
+    assert status["loaded"] and status["warm"]
+    assert status["row_count"] == 2
+    assert status["last_error"] is None
+    assert status["last_refresh_duration_seconds"] is not None
+
+
+def test_table_is_named_by_its_config_key_not_its_folder(monkeypatch, make_service):
+    tables = dict(config["tables"])
+    monkeypatch.setitem(config, "tables", {**tables, "company": {**tables["company"], "path": "company_v2"}})
+
+    service = make_service("company", b"customer_id,customer_name\n2,b\n1,a\n", path=table_path("company"))
+
+    assert service.path == f"{BASE}/company_v2"
+    assert service.table_name == "company" and service.primary_key == ["customer_id"]
+    assert get_registered_services() == {"company": service}
+    assert asyncio.run(service.get_by_key_async([1]))["customer_name"] == "a"
+
+
+def test_zero_soft_ttl_refreshes_on_every_request(make_service):
+    container = FakeContainerClient({f"{PATH}/part-0.csv": b"id\n1\n"})
+    service = make_service(container=container, cache_ttl_seconds=0, background_refresh=False, **ID_TABLE)
+
+    assert get_data(service) == [{"id": 1}]
+    container.files[f"{PATH}/part-0.csv"] = b"id\n2\n"
+    container.etags[f"{PATH}/part-0.csv"] = "v2"
+    time.sleep(0.01)
+
+    assert service.cache_ttl_seconds == 0
+    assert get_data(service) == [{"id": 2}]
@@ -0,0 +1,79 @@
+"""
+Tests for the date parsing helpers.
+"""
+from typing import Optional
+
+import pytest
+import strawberry
+
+from gql.utils import datetime as dt
+
+VALUES = [
+    "2020-01-28 09:47:43.0000000 +00:00",
+    "2020-01-28 09:47:43.1234567 +00:00",
+    "2020-01-28T09:47:43.000Z",
+    "2020-01-28T09:47:43Z",
+    "2020-07-28T09:47:43.5+02:00",
+    "2020-07-28T09:47:43-0530",
+    "2020-01-28T09:47:43-05:00",
+    "2020-01-28 09:47:43",
+    " 2020-01-28T09:47:43Z ",
+    "2020-02-30T09:47:43Z",
+    "2020-01-28",
+    "1900-01-01 00:00:00",
+    "invalid-date",
+    "",
+    None,
+]
+
+
+def _reference(func, value, monkeypatch):
+    """Result of func with every value going through dateutil."""
+    with monkeypatch.context() as patched:
+        patched.setattr(dt, "_parse_gold_timestamp", lambda value: None)
+        dt.parse_mavim_date.cache_clear()
+        dt._normalize_datetime_string.cache_clear()
+        result = func(value)
+    dt.parse_mavim_date.cache_clear()
+    dt._normalize_datetime_string.cache_clear()
+    return result
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_parse_mavim_date_matches_dateutil(value, monkeypatch):
+    assert dt.parse_mavim_date(value) == _reference(dt.parse_mavim_date, value, monkeypatch)
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_normalize_datetime_format_matches_dateutil(value, monkeypatch):
+    assert dt.normalize_datetime_format(value) == _reference(dt.normalize_datetime_format, value, monkeypatch)
+
+
+def test_gold_layouts_skip_dateutil(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("dateutil was called")
+
+    monkeypatch.setattr(dt.parser, "parse", fail)
+    dt.parse_mavim_date.cache_clear()
+
+    assert dt.parse_mavim_date("2020-01-28 09:47:43.0000000 +00:00") == "2020-01-28T10:47:43+01:00"
+    assert dt.parse_mavim_date("2020-07-28T09:47:43.000Z") == "2020-07-28T11:47:43+02:00"
+
+
+def test_datetime_iso_fields_are_sent_as_stored(monkeypatch):
+    @strawberry.type
+    class Row:
+        created: Optional[dt.DateTimeISO]
+        deleted: Optional[dt.DateTimeISO]
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def row(self) -> Row:
+            return Row(created="2020-01-28T10:47:43+01:00", deleted=None)
+
+    monkeypatch.setattr(dt, "normalize_datetime_format", lambda value: pytest.fail("date parsed at response time"))
+    result = strawberry.Schema(query=Query).execute_sync("{ row { created deleted } }")
+
+    assert result.errors is None
+    assert result.data == {"row": {"created": "2020-01-28T10:47:43+01:00", "deleted": None}}
@@ -0,0 +1,91 @@
+"""
+Tests for the flat whole-table queries answered straight from the cached frames.
+"""
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from strawberry.asgi import GraphQL
+
+from gql import schema
+from gql.resolvers.query import company
+from gql.schemas.app import GraphQLApp
+from gql.services import fast_path
+from gql.services.fast_path import plan_flat_query
+from tests.fakes import part_path
+
+PART = part_path("company")
+CSV = (
+    'customer_id,customer_name,created_date,is_partner,exact_id,number_of_databases,crm_url\n'
+    '1,"Acé ""q"" \\ 😀",2024-01-02 10:00:00.0000000 +00:00,true,1.5,3,\n'
+    '2,"line\nbreak",,false,1e16,,\n'
+    '3,plain,,,,-4,http://x\n'
+).encode()
+QUERY = "{ companies { customerId name: customerName createdDate isPartner exactId numberOfDatabases crmUrl } }"
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service("company", CSV, resolver=(company, "company_service"))
+
+
+def post(app, query):
+    client = TestClient(Starlette(routes=[Route("/graphql", app, methods=["GET", "POST"])]))
+    return client.post("/graphql", json={"query": query}).content
+
+
+def fast_path_answers(monkeypatch):
+    answered = []
+    execute = fast_path.execute_flat_query
+
+    async def recording(query):
+        body = await execute(query)
+        answered.append(body is not None)
+        return body
+
+    monkeypatch.setattr("gql.schemas.app.execute_flat_query", recording)
+    return answered
+
+
+def test_flat_queries_are_answered_with_the_normal_bytes(service, monkeypatch):
+    answered = fast_path_answers(monkeypatch)
+
+    fast = post(GraphQLApp(schema), QUERY)
+
+    assert answered == [True]
+    assert fast == post(GraphQL(schema), QUERY)
+    assert b'"name": "Ac\\u00e9 \\"q\\" \\\\ \\ud83d\\ude00"' in fast
+    assert b'"exactId": 1e+16' in fast
+
+
+def test_empty_tables_are_answered_as_empty_lists(service, monkeypatch):
+    monkeypatch.setattr(service.async_container_client.container, "files", {PART: b"customer_id\n"})
+
+    assert post(GraphQLApp(schema), "{ companies { customerId } }") == b'{"data": {"companies": []}}'
+
+
+@pytest.mark.parametrize("query", [
+    "{ companies { customerId databases { databaseId } } }",
+    "{ companies(where: { customerId: { eq: 1 } }) { customerId } }",
+    "{ companies { customerId __typename } }",
+    "{ companies { customerId customerId } }",
+    "{ companies { ...F } } fragment F on CompanyType { customerId }",
+    "{ companies { customerId @include(if: true) } }",
+    "query ($x: Int) { companies { customerId } }",
+    "{ companiesConnection { totalCount } }",
+    "{ companies { customerId } portal { portalId } }",
+    "{ companies { noSuchField } }",
+])
+def test_other_queries_are_left_to_normal_execution(service, query):
+    assert plan_flat_query(schema, query) is None
+
+
+def test_values_graphql_rejects_fall_back_to_normal_execution(service, monkeypatch):
+    monkeypatch.setattr(service.async_container_client.container, "files", {
+        PART: b"customer_id,number_of_databases\n1,3000000000\n"
+    })
+    answered = fast_path_answers(monkeypatch)
+    query = "{ companies { customerId numberOfDatabases } }"
+
+    assert post(GraphQLApp(schema), query) == post(GraphQL(schema), query)
+    assert answered == [False]
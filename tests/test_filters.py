@@ -0,0 +1,104 @@
+"""
+Tests for the `where` filter arguments.
+"""
+import asyncio
+
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company
+from gql.types import BooleanFilter, CompanyWhere, DateTimeFilter, IntFilter, StringFilter
+
+COMPANY = (company, "company_service")
+CSV = (
+    b"customer_id,customer_name,is_partner,number_of_databases,created_date\n"
+    b"3,Gamma,true,5,2024-03-01T10:00:00Z\n"
+    b"1,Alpha,false,,2023-12-31 23:30:00.000\n"
+    b"4,Alphabet,,2,\n"
+    b"2,Beta,true,1,2024-01-01T00:30:00+01:00\n"
+)
+
+
+def ids(rows):
+    return [row.customer_id for row in rows]
+
+
+@pytest.mark.parametrize("where, expected", [
+    (CompanyWhere(customer_id=IntFilter(gte=2, lt=4)), [3, 2]),
+    (CompanyWhere(customer_id=IntFilter(in_=[1, 4, 9])), [1, 4]),
+    (CompanyWhere(customer_name=StringFilter(starts_with="Alpha")), [1, 4]),
+    (CompanyWhere(is_partner=BooleanFilter(eq=False)), [1, 4]),
+    (CompanyWhere(number_of_databases=IntFilter(gt=0), is_partner=BooleanFilter(eq=True)), [3, 2]),
+    (CompanyWhere(number_of_databases=IntFilter(is_null=True)), [1]),
+    (CompanyWhere(number_of_databases=IntFilter(lt=3)), [4, 2]),
+    (CompanyWhere(created_date=DateTimeFilter(gte="2024-01-01T00:00:00Z")), [3]),
+    (CompanyWhere(created_date=DateTimeFilter(lte="2023-12-31T23:30:00Z")), [1, 2]),
+    (CompanyWhere(created_date=DateTimeFilter(is_null=True)), [4]),
+    (CompanyWhere(), [3, 1, 4, 2]),
+])
+def test_filters_select_matching_rows_in_load_order(make_service, where, expected):
+    service = make_service("company", CSV, resolver=COMPANY)
+
+    assert ids(asyncio.run(service.get_data_async(where=where))) == expected
+
+
+def test_unfiltered_data_is_the_cached_list(make_service):
+    service = make_service("company", CSV, resolver=COMPANY)
+
+    data = asyncio.run(service.get_data_async())
+
+    assert asyncio.run(service.get_data_async(where=CompanyWhere())) is data
+
+
+@pytest.mark.parametrize("query", [
+    '{ companies(where: {createdDate: {gte: "garbage"}}) { customerId } }',
+    '{ companiesConnection(where: {createdDate: {lt: "garbage"}}) { totalCount } }',
+])
+def test_invalid_date_is_rejected(make_service, query):
+    make_service("company", CSV, resolver=COMPANY)
+
+    result = asyncio.run(schema.execute(query))
+
+    assert result.data is None
+    assert "Invalid date: 'garbage'" in result.errors[0].message
+
+
+def test_invalid_date_variable_is_rejected(make_service):
+    make_service("company", CSV, resolver=COMPANY)
+    query = "query ($from: DateTimeISO) { companies(where: {createdDate: {gte: $from}}) { customerId } }"
+
+    result = asyncio.run(schema.execute(query, variable_values={"from": "garbage"}))
+
+    assert result.data is None
+    assert "Invalid date: 'garbage'" in result.errors[0].message
+
+
+def test_filtered_pages_count_matching_rows_only(make_service):
+    service = make_service("company", CSV, resolver=COMPANY)
+    where = CompanyWhere(customer_id=IntFilter(gt=1))
+
+    first = asyncio.run(service.get_page_async(first=2, where=where))
+    second = asyncio.run(service.get_page_async(after=first.page_info.end_cursor, where=where))
+
+    assert [edge.node.customer_id for edge in first.edges + second.edges] == [2, 3, 4]
+    assert first.total_count == 3 and first.page_info.has_next_page
+
+
+def test_where_argument_through_the_schema(make_service):
+    make_service("company", CSV, resolver=COMPANY)
+    query = """
+    {
+      companies(where: {customerName: {in: ["Beta", "Gamma"]}}) { customerId }
+      companiesConnection(first: 1, where: {isPartner: {eq: true}}) {
+        edges { node { customerId } }
+        totalCount
+      }
+    }
+    """
+
+    result = asyncio.run(schema.execute(query))
+
+    assert result.errors is None
+    assert [row["customerId"] for row in result.data["companies"]] == [3, 2]
+    assert result.data["companiesConnection"]["totalCount"] == 2
+    assert result.data["companiesConnection"]["edges"][0]["node"]["customerId"] == 2
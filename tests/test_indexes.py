@@ -0,0 +1,77 @@
+"""
+Tests for the hash indexes and the by-key root fields.
+"""
+import asyncio
+
+import polars as pl
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company
+from gql.services.indexes import HashIndex
+from tests.fakes import FakeContainerClient, part_path
+
+PART = part_path("company")
+# Arguments of a table of ids in named groups, indexed by name
+TABLE = {
+    "columns": {"id": "Int64", "name": "String", "group": "Int64"},
+    "primary_key": ["id"],
+    "indexes": ["name", ["name", "group"]],
+}
+
+
+def test_hash_index_keeps_load_order_and_skips_nulls():
+    frame = pl.DataFrame({"a": [1, 2, 1, None], "b": ["x", "y", "x", "z"]})
+
+    index = HashIndex.build(frame, ["a", "b"])
+
+    assert index.lookup((1, "x")) == [0, 2]
+    assert index.lookup((2, "y")) == [1]
+    assert index.lookup((None, "z")) == []
+
+
+def test_lookups_by_primary_key_and_secondary_indexes(make_service):
+    service = make_service("company", b"id,name,group\n1,a,1\n2,b,1\n3,a,2\n4,a,1\n", **TABLE)
+
+    assert asyncio.run(service.get_by_key_async([3])) == {"id": 3, "name": "a", "group": 2}
+    assert asyncio.run(service.get_by_key_async([9])) is None
+    assert [row["id"] for row in asyncio.run(service.get_by_index_async(["name"], ["a"]))] == [1, 3, 4]
+    assert [row["id"] for row in asyncio.run(service.get_by_index_async("name", ["a"]))] == [1, 3, 4]
+    assert [row["id"] for row in asyncio.run(service.get_by_index_async(["name", "group"], ["a", 1]))] == [1, 4]
+    assert asyncio.run(service.get_by_index_async(["name"], ["c"])) == []
+
+
+def test_unindexed_fields_are_rejected(make_service):
+    service = make_service("company", b"id,name,group\n1,a,1\n", **TABLE)
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_by_index_async(["group"], [1]))
+
+
+def test_indexes_follow_refreshes(make_service):
+    container = FakeContainerClient({PART: b"id,name,group\n1,a,1\n"})
+    service = make_service(container=container, **TABLE)
+    assert asyncio.run(service.get_by_key_async([1]))["name"] == "a"
+
+    container.files[PART] = b"id,name,group\n1,b,1\n2,a,1\n"
+    container.etags[PART] = "v2"
+    service.clear_cache()
+
+    assert asyncio.run(service.get_by_key_async([1]))["name"] == "b"
+    assert [row["id"] for row in asyncio.run(service.get_by_index_async(["name"], ["a"]))] == [2]
+
+
+def test_empty_table_has_no_rows_to_look_up(make_service):
+    service = make_service(**TABLE)
+
+    assert asyncio.run(service.get_by_key_async([1])) is None
+    assert asyncio.run(service.get_by_index_async(["name"], ["a"])) == []
+
+
+def test_company_root_field(make_service):
+    make_service("company", b"customer_id,customer_name\n2,b\n1,a\n", resolver=(company, "company_service"))
+
+    result = asyncio.run(schema.execute("{ a: company(customerId: 1) { customerName } b: company(customerId: 3) { customerName } }"))
+
+    assert result.errors is None
+    assert result.data == {"a": {"customerName": "a"}, "b": None}
@@ -0,0 +1,126 @@
+"""
+Tests for the paged Connection fields.
+"""
+import asyncio
+
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company
+from gql.services import pagination
+from tests.fakes import FakeContainerClient, part_path
+
+PART = part_path("company")
+# Arguments of a table of named ids
+TABLE = {"columns": {"id": "Int64", "name": "String"}, "primary_key": ["id"], "indexes": []}
+
+
+def node_ids(page):
+    return [edge.node["id"] for edge in page.edges]
+
+
+def update(container, data, etag):
+    container.files[PART] = data
+    container.etags[PART] = etag
+
+
+def test_pages_follow_primary_key_order(make_service):
+    service = make_service("company", b"id,name\n3,c\n1,a\n,x\n2,b\n", **TABLE)
+
+    first = asyncio.run(service.get_page_async(first=2))
+    second = asyncio.run(service.get_page_async(first=2, after=first.page_info.end_cursor))
+
+    assert node_ids(first) == [1, 2]
+    assert node_ids(second) == [3, None]
+    assert first.total_count == 4
+    assert first.page_info.has_next_page and not first.page_info.has_previous_page
+    assert not second.page_info.has_next_page and second.page_info.has_previous_page
+    # The list field keeps serving rows in load order
+    assert [row["id"] for row in asyncio.run(service.get_data_async())] == [3, 1, None, 2]
+
+
+def test_cursor_stays_valid_across_refreshes(make_service):
+    container = FakeContainerClient({PART: b"id,name\n10,a\n20,b\n30,c\n"})
+    service = make_service(container=container, **TABLE)
+    cursor = asyncio.run(service.get_page_async(first=1)).page_info.end_cursor
+
+    update(container, b"id,name\n5,x\n20,b\n30,c\n25,y\n", "v2")
+    service.clear_cache()
+
+    assert node_ids(asyncio.run(service.get_page_async(after=cursor))) == [20, 25, 30]
+
+
+def test_composite_primary_key(make_service):
+    service = make_service("company", b"id,name\n1,b\n2,a\n1,a\n", **{**TABLE, "primary_key": ["id", "name"]})
+
+    first = asyncio.run(service.get_page_async(first=2))
+    rest = asyncio.run(service.get_page_async(after=first.page_info.end_cursor))
+
+    assert [(edge.node["id"], edge.node["name"]) for edge in first.edges + rest.edges] == [(1, "a"), (1, "b"), (2, "a")]
+
+
+def test_pages_keep_rows_sharing_a_key(make_service, caplog):
+    service = make_service("company", b"id,name\n2,a\n1,a\n2,b\n2,c\n,x\n,y\n3,d\n", **TABLE)
+
+    pages, after = [], None
+    while after is None or pages[-1].page_info.has_next_page:
+        pages.append(asyncio.run(service.get_page_async(first=2, after=after)))
+        after = pages[-1].page_info.end_cursor
+
+    assert [(edge.node["id"], edge.node["name"]) for page in pages for edge in page.edges] == [
+        (1, "a"), (2, "a"), (2, "b"), (2, "c"), (3, "d"), (None, "x"), (None, "y")
+    ]
+    assert "Primary key (id) is not unique: 3 rows" in caplog.text
+    # A cursor of the key alone comes after every row with that key
+    assert node_ids(asyncio.run(service.get_page_async(after=pagination.encode_cursor((2,))))) == [3, None, None]
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_page_async(after=pagination.encode_cursor((2, "b"))))
+
+
+def test_page_size_defaults_and_cap(monkeypatch, make_service):
+    monkeypatch.setattr(pagination, "pagination_settings", {"default_page_size": 2, "max_page_size": 3})
+    rows = "".join(f"{i},n\n" for i in range(10)).encode()
+    service = make_service("company", b"id,name\n" + rows, **TABLE)
+
+    assert len(asyncio.run(service.get_page_async()).edges) == 2
+    assert len(asyncio.run(service.get_page_async(first=50)).edges) == 3
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_page_async(first=-1))
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", pagination.encode_cursor((1, 2)), pagination.encode_cursor(("x",))])
+def test_invalid_cursor_is_rejected(make_service, cursor):
+    service = make_service("company", b"id,name\n1,a\n", **TABLE)
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_page_async(after=cursor))
+
+
+def test_empty_table_gives_empty_page(make_service):
+    service = make_service(**TABLE)
+
+    page = asyncio.run(service.get_page_async(first=5))
+
+    assert page.edges == [] and page.total_count == 0 and page.page_info.end_cursor is None
+
+
+def test_connection_field_through_the_schema(make_service):
+    make_service("company", b"customer_id,customer_name\n2,b\n1,a\n3,c\n", resolver=(company, "company_service"))
+    query = """
+    query ($after: String) {
+      companiesConnection(first: 2, after: $after) {
+        edges { cursor node { customerId customerName } }
+        pageInfo { hasNextPage endCursor }
+        totalCount
+      }
+    }
+    """
+
+    first = asyncio.run(schema.execute(query)).data["companiesConnection"]
+    after = first["pageInfo"]["endCursor"]
+    second = asyncio.run(schema.execute(query, variable_values={"after": after})).data["companiesConnection"]
+
+    assert [edge["node"]["customerName"] for edge in first["edges"]] == ["a", "b"]
+    assert first["pageInfo"]["hasNextPage"] and first["totalCount"] == 3
+    assert [edge["node"]["customerId"] for edge in second["edges"]] == [3]
+    assert not second["pageInfo"]["hasNextPage"]
@@ -0,0 +1,85 @@
+"""
+Tests for automatic persisted queries and the parsed document cache.
+"""
+import asyncio
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from gql import schema
+from gql.schemas.app import GraphQLApp
+from gql.schemas.extensions import document_cache_info
+from gql.services.persisted_queries import PersistedQueries, PersistedQueryError, load_allowlist, query_hash
+
+QUERY = "query Typename { __typename }"
+
+
+def persisted(sha256_hash):
+    return {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+
+
+@pytest.fixture
+def client():
+    app = GraphQLApp(schema, persisted_queries=PersistedQueries(cache_size=4))
+    return TestClient(Starlette(routes=[Route("/graphql", app, methods=["GET", "POST"])]))
+
+
+def test_unknown_hashes_are_registered_by_sending_the_query(client):
+    extensions = persisted(query_hash(QUERY))
+
+    missing = client.post("/graphql", json={"extensions": extensions}).json()
+    registered = client.post("/graphql", json={"query": QUERY, "extensions": extensions}).json()
+    by_hash = client.post("/graphql", json={"extensions": extensions}).json()
+    by_get = client.get("/graphql", params={"extensions": json.dumps(extensions)}).json()
+
+    assert missing["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert missing["errors"][0]["extensions"] == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+    assert registered == by_hash == by_get == {"data": {"__typename": "Query"}}
+
+
+def test_mismatched_hashes_and_versions_are_rejected(client):
+    mismatch = client.post("/graphql", json={"query": QUERY, "extensions": persisted("0" * 64)}).json()
+    version = client.post("/graphql", json={"extensions": {"persistedQuery": {"version": 2, "sha256Hash": "x"}}}).json()
+
+    assert mismatch["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+    assert version["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+
+def test_registered_queries_are_evicted_but_allowlisted_ones_stay():
+    pinned = "{ pinned }"
+    queries = PersistedQueries(cache_size=1, allowlist={query_hash(pinned): pinned})
+    queries.register("{ a }", query_hash("{ a }"))
+    queries.register("{ b }", query_hash("{ b }"))
+
+    assert queries.get(query_hash("{ a }")) is None
+    assert queries.get(query_hash("{ b }")) == "{ b }"
+    assert queries.get(query_hash(pinned).upper()) == pinned
+    assert queries.stats() == {"allowlisted": 1, "registered": 1}
+
+
+def test_allowlists_are_loaded_and_checked(tmp_path):
+    path = tmp_path / "allowlist.json"
+    path.write_text(json.dumps({query_hash(QUERY): QUERY}))
+
+    assert PersistedQueries(cache_size=1, allowlist=load_allowlist(path)).get(query_hash(QUERY)) == QUERY
+    with pytest.raises(PersistedQueryError):
+        PersistedQueries(cache_size=1, allowlist={"0" * 64: QUERY})
+    path.write_text(json.dumps([QUERY]))
+    with pytest.raises(ValueError):
+        load_allowlist(path)
+
+
+def test_documents_are_parsed_and_validated_once():
+    query = "query DocumentCacheTest { __typename }"
+    before = document_cache_info()
+
+    for _ in range(3):
+        assert asyncio.run(schema.execute(query)).data == {"__typename": "Query"}
+
+    after = document_cache_info()
+    assert after["parse"]["misses"] - before["parse"]["misses"] == 1
+    assert after["parse"]["hits"] - before["parse"]["hits"] == 2
+    assert after["validate"]["hits"] - before["validate"]["hits"] == 2
@@ -0,0 +1,136 @@
+"""
+Tests for the blob CSV reader.
+"""
+import asyncio
+import threading
+
+import polars as pl
+import pytest
+
+from gql.config import get_table_config
+from gql.resolvers.transformers import transform_to_company_frame, transform_to_license_customer_product_frame
+from gql.utils import reader
+from tests.fakes import FakeAsyncContainerClient, FakeContainerClient
+
+
+def test_reads_parts_in_listing_order_with_relaxed_concat():
+    container = FakeContainerClient({
+        "gold/table/part-0.csv": b"id,value\n1,a\n2,b\n",
+        "gold/table/part-1.csv": b"id,value\n3,1.5\n",
+        "gold/table/_SUCCESS": b"",
+    })
+
+    df = reader.read_csv_files_to_polars_df("gold/table", container_client=container)
+
+    assert df["id"].to_list() == [1, 2, 3]
+    assert df["value"].to_list() == ["a", "b", "1.5"]
+
+
+def test_download_concurrency_is_bounded():
+    files = {f"gold/table/part-{i}.csv": b"id\n1\n" for i in range(8)}
+    container = FakeContainerClient(files, delay=0.05)
+
+    df = reader.read_csv_files_to_polars_df("gold/table", max_concurrency=3, container_client=container)
+
+    assert df.height == 8
+    assert 1 < container.peak <= 3
+
+
+def test_async_download_spools_off_the_event_loop(monkeypatch):
+    container = FakeAsyncContainerClient(FakeContainerClient({"gold/table/part-0.csv": b"id,value\n1,a\n2,b\n"}))
+    spool_file, spools, threads = reader._spool_file, [], set()
+
+    def tracked_spool_file():
+        spool = spool_file()
+        write = spool.write
+        spool.write = lambda chunk: threads.add(threading.get_ident()) or write(chunk)
+        spools.append(spool)
+        return spool
+
+    monkeypatch.setattr(reader, "_spool_file", tracked_spool_file)
+
+    df = asyncio.run(reader._read_csv_blob_async(container, "gold/table/part-0.csv"))
+
+    assert df["value"].to_list() == ["a", "b"]
+    assert threads and threading.get_ident() not in threads
+    assert spools[0].closed
+
+
+def test_empty_prefix_returns_empty_frame():
+    container = FakeContainerClient({})
+
+    assert reader.read_csv_files_to_polars_df("gold/table", container_client=container).is_empty()
+
+
+def test_part_cache_only_downloads_changed_parts():
+    container = FakeContainerClient({
+        "gold/table/part-0.csv": b"id\n1\n",
+        "gold/table/part-1.csv": b"id\n2\n",
+    })
+    parts = reader.CsvPartCache("gold/table")
+
+    assert parts.refresh(container)["id"].to_list() == [1, 2]
+    assert parts.refresh(container) is None
+
+    container.etags["gold/table/part-1.csv"] = "v2"
+    container.files["gold/table/part-1.csv"] = b"id\n3\n"
+    del container.files["gold/table/part-0.csv"]
+    container.files["gold/table/part-2.csv"] = b"id\n4\n"
+
+    assert parts.refresh(container)["id"].to_list() == [3, 4]
+    assert sorted(container.downloads) == ["gold/table/part-0.csv", "gold/table/part-1.csv",
+                                           "gold/table/part-1.csv", "gold/table/part-2.csv"]
+
+
+def test_only_requested_columns_are_kept():
+    container = FakeContainerClient({"gold/table/part-0.csv": b"id,name,unused\n1,a,x\n"})
+
+    df = reader.read_csv_files_to_polars_df(
+        "gold/table", container_client=container, columns={"name": "String", "id": "Int64", "missing": "Int64"}
+    )
+
+    assert df.columns == ["name", "id", "missing"]
+    assert df.row(0) == ("a", 1, None)
+
+
+def test_configured_dtypes_are_stable_across_parts():
+    container = FakeContainerClient({
+        "gold/table/part-0.csv": b"id,code,active\n1,007,true\n",
+        "gold/table/part-1.csv": b"id,code,active\n,,\n2,8,false\n",
+    })
+    columns = {"id": "Int64", "code": "String", "active": "Boolean"}
+
+    df = reader.read_csv_files_to_polars_df("gold/table", container_client=container, columns=columns)
+
+    assert df.schema == {"id": pl.Int64, "code": pl.String, "active": pl.Boolean}
+    assert df.rows() == [(1, "007", True), (None, None, None), (2, "8", False)]
+
+
+def test_counts_written_as_decimals_and_numeric_flags_are_read():
+    container = FakeContainerClient({
+        "gold/table/part-0.csv": (
+            b"customer_id,product_name,license_name,number_of_databases,license_quantity,used_qty\n"
+            b"1,Manager,Full,3.0,10,4.0\n"
+        ),
+        "gold/table/part-1.csv": b"customer_id,number_of_databases,is_partner,is_onboarded_to_improve\n2,1,1,0\n3,,0,\n",
+    })
+    licenses = reader.read_csv_files_to_polars_df(
+        "gold/table", container_client=container, columns=get_table_config("license_customer_product")["columns"]
+    )
+    companies = reader.read_csv_files_to_polars_df(
+        "gold/table", container_client=container, columns=get_table_config("company")["columns"]
+    )
+
+    licenses = transform_to_license_customer_product_frame(licenses)
+    companies = transform_to_company_frame(companies)
+
+    assert licenses.select("number_of_databases", "license_quantity", "used_qty").rows()[0] == (3, 10, 4)
+    assert licenses["used_qty"].dtype == pl.Int64
+    assert companies.select("customer_id", "number_of_databases", "is_partner", "is_onboarded_to_improve").rows() == [
+        (1, 3, False, False), (2, 1, True, False), (3, None, False, False)
+    ]
+
+
+def test_unknown_dtype_is_rejected():
+    with pytest.raises(ValueError):
+        reader.table_schema({"id": "Integer"})
@@ -0,0 +1,83 @@
+"""
+Tests for the relationship fields resolved through per-request DataLoaders.
+"""
+import asyncio
+
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company, mavim_databases_details, portal, portal_monthly_users_report
+
+# Tables by name, with the resolver service each replaces and its only part file
+TABLES = {
+    "company": ((company, "company_service"), b"customer_id,customer_name\n1,a\n2,b\n3,c\n"),
+    "mavim_databases_details": (
+        (mavim_databases_details, "mavim_database_service"), b"database_id,customer_id\n10,1\n11,2\n12,1\n"
+    ),
+    "portal": ((portal, "portal_service"), b"portal_id,customer_id,portal_name\n20,2,p\n21,1,q\n"),
+    "portal_monthly_users_report": (
+        (portal_monthly_users_report, "portal_monthly_users_report_service"),
+        b"report_id,portal_id,users_count\n30,20,5\n31,21,6\n32,20,7\n",
+    ),
+}
+
+
+@pytest.fixture
+def services(make_service):
+    return {table: make_service(table, csv, resolver=resolver) for table, (resolver, csv) in TABLES.items()}
+
+
+def count_batches(monkeypatch, service):
+    batches = []
+    lookup = service.get_many_by_index_async
+
+    async def counting(fields, keys):
+        batches.append(list(keys))
+        return await lookup(fields, keys)
+
+    monkeypatch.setattr(service, "get_many_by_index_async", counting)
+    return batches
+
+
+def test_relationships_resolve_with_one_lookup_per_relation(services, monkeypatch):
+    database_batches = count_batches(monkeypatch, services["mavim_databases_details"])
+    report_batches = count_batches(monkeypatch, services["portal_monthly_users_report"])
+    query = """
+    {
+      companies {
+        customerId
+        databases { databaseId }
+        portals { portalId monthlyReports { reportId } }
+      }
+    }
+    """
+
+    result = asyncio.run(schema.execute(query, context_value={}))
+
+    assert result.errors is None
+    assert result.data["companies"] == [
+        {"customerId": 1, "databases": [{"databaseId": 10}, {"databaseId": 12}],
+         "portals": [{"portalId": 21, "monthlyReports": [{"reportId": 31}]}]},
+        {"customerId": 2, "databases": [{"databaseId": 11}],
+         "portals": [{"portalId": 20, "monthlyReports": [{"reportId": 30}, {"reportId": 32}]}]},
+        {"customerId": 3, "databases": [], "portals": []},
+    ]
+    assert database_batches == [[(1,), (2,), (3,)]]
+    assert report_batches == [[(21,), (20,)]]
+
+
+def test_to_one_relationship(services):
+    result = asyncio.run(schema.execute("{ portal { portalId company { customerName } } }", context_value={}))
+
+    assert result.errors is None
+    assert result.data["portal"] == [
+        {"portalId": 20, "company": {"customerName": "b"}},
+        {"portalId": 21, "company": {"customerName": "a"}},
+    ]
+
+
+def test_relationships_work_without_a_request_context(services):
+    result = asyncio.run(schema.execute("{ company(customerId: 2) { databases { databaseId } } }"))
+
+    assert result.errors is None
+    assert result.data == {"company": {"databases": [{"databaseId": 11}]}}
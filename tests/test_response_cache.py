@@ -0,0 +1,124 @@
+"""
+Tests for the GraphQL response cache invalidated by table data versions.
+"""
+import asyncio
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from gql import schema
+from gql.resolvers.query import company
+from gql.schemas.app import GraphQLApp
+from gql.services.data_service import track_reads
+from gql.services.response_cache import ResponseCache, lookups, normalize_document
+from tests.fakes import part_path
+
+PART = part_path("company")
+QUERY = "{ companies(where: { customerId: { lte: 2 } }) { customerId customerName } }"
+
+
+@pytest.fixture
+def service(make_service):
+    return make_service("company", b"customer_id,customer_name\n1,a\n2,b\n3,c\n", resolver=(company, "company_service"))
+
+
+@pytest.fixture
+def client(service):
+    app = GraphQLApp(schema, response_cache=ResponseCache(max_entries=8, max_bytes=2**20))
+    return TestClient(Starlette(routes=[Route("/graphql", app, methods=["GET", "POST"])])), app
+
+
+def post(client, query, **headers):
+    return client.post("/graphql", json={"query": query}, headers=headers).json()
+
+
+def count_executions(monkeypatch):
+    executions = []
+    execute = schema.execute
+
+    async def counting(*args, **kwargs):
+        executions.append(args[0])
+        return await execute(*args, **kwargs)
+
+    monkeypatch.setattr(schema, "execute", counting)
+    return executions
+
+
+def test_repeated_queries_are_served_from_the_cache(client, monkeypatch):
+    client, app = client
+    executions = count_executions(monkeypatch)
+    hits = lookups.value(outcome="hit")
+
+    first = post(client, QUERY)
+    again = post(client, "# same query\n{companies(where:{customerId:{lte:2}}){ customerId customerName }}")
+
+    assert first == again == {"data": {"companies": [
+        {"customerId": 1, "customerName": "a"}, {"customerId": 2, "customerName": "b"}
+    ]}}
+    assert len(executions) == 1
+    assert lookups.value(outcome="hit") == hits + 1
+    assert app.response_cache.stats()["entries"] == 1
+
+
+def test_new_table_data_invalidates_cached_responses(client, service):
+    client, _ = client
+    stale = lookups.value(outcome="stale")
+    post(client, QUERY)
+
+    service.async_container_client.container.files[PART] = b"customer_id,customer_name\n1,z\n"
+    service.clear_cache()
+
+    assert post(client, QUERY) == {"data": {"companies": [{"customerId": 1, "customerName": "z"}]}}
+    assert lookups.value(outcome="stale") == stale + 1
+
+
+def test_callers_do_not_share_responses(client, monkeypatch):
+    client, _ = client
+    executions = count_executions(monkeypatch)
+
+    post(client, QUERY, authorization="Bearer one")
+    post(client, QUERY, authorization="Bearer two")
+    post(client, QUERY, authorization="Bearer one")
+
+    assert len(executions) == 2
+
+
+def test_error_responses_are_not_cached(client):
+    client, app = client
+
+    post(client, "{ companies { noSuchField } }")
+
+    assert app.response_cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_responses_are_evicted():
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.put("a", "1234", {})
+    cache.put("b", "1234", {})
+    asyncio.run(cache.get_async("a"))
+    cache.put("c", "1234", {})
+    cache.put("huge", "x" * 11, {})
+
+    assert [asyncio.run(cache.get_async(key)) for key in ("a", "b", "c", "huge")] == ["1234", None, "1234", None]
+    assert cache.stats() == {"entries": 2, "bytes": 8}
+
+
+def test_reads_of_a_reloaded_table_are_not_cached(service):
+    with track_reads() as reads:
+        version = asyncio.run(service.data_version_async())
+        service.clear_cache()
+        asyncio.run(service.get_data_async())
+
+    assert version > 0
+    assert reads == {"company": None}
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.put("a", "1", reads)
+    assert cache.stats()["entries"] == 0
+
+
+def test_only_query_documents_are_normalized():
+    assert normalize_document("query A { companies { customerId } }") == "query A {\n  companies {\n    customerId\n  }\n}"
+    assert normalize_document("mutation { reset }") is None
+    assert normalize_document("{ broken") is None
@@ -0,0 +1,92 @@
+"""
+Tests for the columnar row views served for strawberry entity types.
+"""
+import asyncio
+
+import polars as pl
+import pytest
+
+from gql.resolvers.query import company
+from gql.services import rows as rows_module
+from gql.services.rows import LazyRows, row_type
+from gql.types import MpmCustomerType
+
+
+def mpm_frame():
+    return pl.DataFrame({
+        "customer_id": [1, 2, 3],
+        "number_of_analyzer": [5, None, 7],
+        "number_of_developer": [1, 2, 3],
+        "number_of_reports": [0, 0, 0],
+        "workspace_id": ["w1", "w2", None],
+        "portal_url": [None, None, None],
+        "subscription_key": ["k1", "k2", "k3"],
+        "subscription_start_date": ["2024-01-01T00:00:00+01:00", None, None],
+        "subscription_end_date": [None, None, None],
+    })
+
+
+def test_rows_are_entities_reading_their_columns():
+    rows = LazyRows(mpm_frame(), MpmCustomerType)
+
+    assert len(rows) == 3
+    row = rows[1]
+    assert isinstance(row, MpmCustomerType)
+    assert (row.customer_id, row.number_of_analyzer, row.workspace_id) == (2, None, "w2")
+    assert rows[-1].customer_id == 3
+    assert [row.customer_id for row in rows] == [1, 2, 3]
+    assert [row.customer_id for row in rows[1:]] == [2, 3]
+    assert rows[0] == MpmCustomerType(**mpm_frame().row(0, named=True))
+    with pytest.raises(IndexError):
+        rows[3]
+
+
+def test_row_views_have_no_instance_dict():
+    row = LazyRows(mpm_frame(), MpmCustomerType)[0]
+
+    assert row_type(MpmCustomerType).__slots__ == ("_columns", "_position")
+    assert not getattr(row, "__dict__", {})
+
+
+def test_rows_taken_together_share_converted_columns(monkeypatch):
+    monkeypatch.setattr(rows_module, "BLOCK_SIZE", 2)
+    rows = LazyRows(mpm_frame(), MpmCustomerType)
+
+    taken = rows.take([2, 0])
+    iterated = list(rows)
+
+    assert [row.subscription_key for row in taken] == ["k3", "k1"]
+    assert taken[0]._columns is taken[1]._columns
+    assert dict(taken[0]._columns) == {"subscription_key": ["k3", "k1"]}
+    assert [row.workspace_id for row in iterated] == ["w1", "w2", None]
+    assert iterated[0]._columns is iterated[1]._columns is not iterated[2]._columns
+    assert rows.take([]) == []
+    with pytest.raises(IndexError):
+        rows.take([0, 3])
+
+
+def test_rows_of_a_table_read_in_parts_share_its_columns(monkeypatch):
+    monkeypatch.setattr(rows_module, "BLOCK_SIZE", 2)
+    frame = pl.concat([mpm_frame().head(2), mpm_frame().tail(1)], rechunk=False)
+
+    rows = LazyRows(frame, MpmCustomerType)
+
+    assert rows[2]._columns["customer_id"].n_chunks() == 2
+    assert [row.customer_id for row in rows] == [1, 2, 3]
+    assert [row.workspace_id for row in rows.take([2, 1])] == [None, "w2"]
+    assert rows[2].subscription_key == "k3"
+
+
+def test_missing_field_columns_are_rejected():
+    with pytest.raises(ValueError):
+        LazyRows(mpm_frame().drop("subscription_key"), MpmCustomerType)
+
+
+def test_service_serves_row_views_for_strawberry_types(make_service):
+    service = make_service("company", b"customer_id,customer_name\n2,b\n1,a\n", resolver=(company, "company_service"))
+
+    data = asyncio.run(service.get_data_async())
+
+    assert isinstance(data, LazyRows)
+    assert [(row.customer_id, row.customer_name) for row in data] == [(2, "b"), (1, "a")]
+    assert asyncio.run(service.get_by_key_async([1])).customer_name == "a"
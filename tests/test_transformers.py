@@ -0,0 +1,60 @@
+"""
+Tests for the vectorized table transformers.
+"""
+import polars as pl
+import pytest
+
+from gql.utils import reader
+from gql.utils.datetime import parse_mavim_date, parse_mavim_dates
+from tests.test_config import resolver_services
+
+DATES = [
+    "2020-01-28T09:47:43.000Z",
+    "2020-07-28 09:47:43.1234567 +02:00",
+    "2020-03-29T01:30:00.5Z",
+    "2020-01-28 09:47:43",
+    "2020-01-28",
+    "1900-01-01 00:00:00",
+    " 2020-01-28T09:47:43Z",
+    "not a date",
+    "",
+    None,
+]
+SAMPLES = {
+    pl.Int64: [1, None, 3],
+    pl.Float64: [1.5, None, 3.0],
+    pl.Boolean: [True, None, False],
+    pl.String: ["a", None, ""],
+}
+
+
+def sample_frame(schema):
+    """Three rows per table, with dates in every string column that looks like one."""
+    columns = {}
+    for name, dtype in schema.items():
+        if dtype == pl.String and ("date" in name.lower() or name in ("created", "Created", "login_time")):
+            columns[name] = DATES[:3]
+        else:
+            columns[name] = SAMPLES[dtype]
+    return pl.DataFrame(columns, schema=schema)
+
+
+def test_parse_mavim_dates_matches_parse_mavim_date():
+    assert parse_mavim_dates(pl.Series(DATES)).to_list() == [parse_mavim_date(value) for value in DATES]
+
+
+@pytest.mark.parametrize("service", list(resolver_services()), ids=lambda service: service.table_name)
+def test_frame_transform_matches_row_transform(service):
+    df = sample_frame(reader.table_schema(service.columns))
+
+    expected = [service.transform_func(row) for row in df.iter_rows(named=True)]
+    actual = [service.entity_type(**row) for row in service.frame_transform(df).iter_rows(named=True)]
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("service", list(resolver_services()), ids=lambda service: service.table_name)
+def test_primary_key_is_a_transformed_column(service):
+    frame = service.frame_transform(sample_frame(reader.table_schema(service.columns)))
+
+    assert service.primary_key and set(service.primary_key) <= set(frame.columns)
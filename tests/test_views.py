@@ -0,0 +1,129 @@
+"""
+Tests for the materialized views.
+"""
+import asyncio
+
+import polars as pl
+import pytest
+
+from gql import schema
+from gql.resolvers.query import company_users
+from gql.services import data_service, views
+from gql.services.views import ViewService, build_view
+from gql.types import CompanyUserType
+from tests.fakes import FakeContainerClient, part_path
+
+USERS = part_path("users")
+COMPANIES = part_path("companies")
+DEFINITION = {
+    "base": "users",
+    "primary_key": ["user_id"],
+    "fields": {"user_id": "user_id", "company_id": "company_id", "name": "user_name"},
+    "joins": [{"table": "companies", "keys": {"company_id": "id"}, "fields": {"name": "company_name"}}],
+}
+
+
+def as_read(columns):
+    """Arguments of a table served as it is read, keyed by its first column."""
+    return {
+        "frame_transform": lambda frame: frame,
+        "columns": columns,
+        "primary_key": [next(iter(columns))],
+        "indexes": [],
+    }
+
+
+@pytest.fixture
+def container(make_service, monkeypatch):
+    monkeypatch.setattr(data_service, "check_file_path", lambda path: True)
+    container = FakeContainerClient({
+        USERS: b"user_id,company_id,name\nu1,2,Ann\nu2,1,Bob\nu3,9,Cy\n",
+        COMPANIES: b"id,name\n1,Acme\n2,Globex\n",
+    })
+    make_service("users", container=container, **as_read({"user_id": "String", "company_id": "String", "name": "String"}))
+    make_service("companies", container=container, **as_read({"id": "Int64", "name": "String"}))
+    return container
+
+
+def make_view(definition=DEFINITION):
+    return ViewService("users_with_company", entity_type=dict, definition=definition)
+
+
+def test_build_view_joins_on_keys_of_different_dtypes():
+    base = pl.DataFrame({"user_id": ["u1", "u2"], "company_id": ["2", None], "name": ["Ann", "Bob"]})
+    companies = pl.DataFrame({"id": [1, 2], "name": ["Acme", "Globex"]})
+
+    view = build_view(DEFINITION, base, [companies])
+
+    assert view.columns == ["user_id", "company_id", "user_name", "company_name"]
+    assert view.rows() == [("u1", "2", "Ann", "Globex"), ("u2", None, "Bob", None)]
+
+
+def test_build_view_without_joined_rows():
+    base = pl.DataFrame({"user_id": ["u1"], "company_id": ["2"], "name": ["Ann"]})
+
+    assert build_view(DEFINITION, base, [None]).rows() == [("u1", "2", "Ann", None)]
+    inner = {**DEFINITION, "joins": [{**DEFINITION["joins"][0], "how": "inner"}]}
+    assert build_view(inner, base, [None]).is_empty()
+
+
+def test_view_is_served_like_a_table(container):
+    view = make_view()
+
+    assert asyncio.run(view.get_data_async()) == [
+        {"user_id": "u1", "company_id": "2", "user_name": "Ann", "company_name": "Globex"},
+        {"user_id": "u2", "company_id": "1", "user_name": "Bob", "company_name": "Acme"},
+        {"user_id": "u3", "company_id": "9", "user_name": "Cy", "company_name": None},
+    ]
+    page = asyncio.run(view.get_page_async(first=2))
+    assert [edge.node["user_id"] for edge in page.edges] == ["u1", "u2"] and page.total_count == 3
+
+
+def test_view_is_rebuilt_only_when_an_input_changes(container, monkeypatch):
+    builds = []
+    monkeypatch.setattr(views, "build_view", lambda *args: builds.append(args) or build_view(*args))
+    view = make_view()
+    asyncio.run(view.get_data_async())
+
+    # Tables refresh without changes: the view keeps its data
+    for service in data_service.get_registered_services().values():
+        service._last_attempt = 0
+        service.background_refresh = False
+    data = asyncio.run(view.get_data_async())
+    assert len(builds) == 1 and asyncio.run(view.get_data_async()) is data
+
+    # A table loads new data: the view follows on its next use, before its own TTL
+    container.files[COMPANIES] = b"id,name\n1,Acme\n2,Initech\n"
+    container.etags[COMPANIES] = "v2"
+    data_service.get_registered_services()["companies"].clear_cache()
+    asyncio.run(data_service.get_registered_services()["companies"].get_data_async())
+
+    assert [row["company_name"] for row in asyncio.run(view.get_data_async())] == ["Initech", "Acme", None]
+    assert len(builds) == 2
+
+
+def test_configured_view_through_the_schema(make_service, monkeypatch):
+    container = FakeContainerClient({
+        part_path("combined_users"): (
+            b"user_id,product_name,license_name,user_name,first_name,last_name,company_id,company_name\n"
+            b"u1,Manager,Full,ann,Ann,A,2,Globex\nu2,Portal,Viewer,bob,Bob,B,1,Acme\n"
+        ),
+        part_path("company"): b"customer_id,customer_name_and_id,is_partner,domain_name,termination_date\n1,Acme (1),true,acme.com,\n",
+    })
+    make_service("combined_users", container=container, **as_read({
+        name: "String"
+        for name in ["user_id", "product_name", "license_name", "user_name", "first_name", "last_name", "company_id", "company_name"]
+    }))
+    make_service("company", container=container, **as_read({
+        "customer_id": "Int64", "customer_name_and_id": "String", "is_partner": "Boolean",
+        "domain_name": "String", "termination_date": "String",
+    }))
+    monkeypatch.setattr(company_users, "company_users_service", ViewService("company_users", entity_type=CompanyUserType))
+    query = "{ companyUsers(where: {isPartner: {eq: true}}) { userId productName companyName customerNameAndId domainName } }"
+
+    result = asyncio.run(schema.execute(query))
+
+    assert result.errors is None
+    assert result.data == {"companyUsers": [
+        {"userId": "u2", "productName": "Portal", "companyName": "Acme", "customerNameAndId": "Acme (1)", "domainName": "acme.com"}
+    ]}
@@ -0,0 +1,41 @@
+"""
+Tests for the startup warm-up.
+"""
+import asyncio
+
+from gql.services import readiness
+from gql.services.warmup import WarmupState, warm_up
+from tests.fakes import FakeContainerClient, part_path
+
+# Arguments of a table of ids
+ID_TABLE = {"columns": {"id": "Int64"}, "primary_key": ["id"], "indexes": []}
+
+
+def test_warm_up_loads_tables_concurrently_under_the_cap(make_service):
+    tables = ["company", "portal", "mpm_customers", "combined_users"]
+    container = FakeContainerClient({part_path(table): b"id\n1\n" for table in tables}, delay=0.1)
+    services = {table: make_service(table, container=container, **ID_TABLE) for table in tables}
+    state = WarmupState()
+
+    durations = asyncio.run(warm_up(services, max_concurrency=2, state=state))
+
+    assert set(durations) == set(tables)
+    assert container.peak == 2
+    assert state.finished_at is not None and not state.deadline_passed
+    assert all(service.data_age_seconds is not None for service in services.values())
+
+
+def test_readiness_waits_for_required_tables(monkeypatch, make_service):
+    container = FakeContainerClient({part_path("company"): b"id\n1\n"})
+    services = {table: make_service(table, container=container, **ID_TABLE) for table in ["company", "portal"]}
+    monkeypatch.setattr(readiness, "services_to_warm_up", lambda: services)
+    monkeypatch.setitem(readiness.readiness_settings, "required_tables", ["company"])
+
+    assert readiness.readiness_report(WarmupState())["cold_tables"] == ["company"]
+
+    asyncio.run(services["company"].get_data_async())
+    report = readiness.readiness_report(WarmupState())
+
+    assert report["ready"]
+    assert report["tables"]["company"]["row_count"] == 1
+    assert not report["tables"]["portal"]["loaded"]